@@ -0,0 +1,976 @@
+import argparse
+import asyncio
+import hashlib
+import hmac
+import os
+import secrets
+import socket
+import time
+from collections import deque
+
+from yacht_journal import Journal, recover
+from yacht_lobby import RANKED_MODE, Lobby, Ticket
+from yacht_log import DEBUG, ERROR, INFO, LEVELS, WARNING, logger
+from yacht_metrics import handle_scrape, message_label, metrics
+from yacht_protocol import FrameDecoder, ack_message, encode_message, error_message
+from yacht_results import QUERY_TYPES, ResultStore, answer_query
+from yacht_rng import SECURE_SEED, DiceRNG, derive_seed
+from yacht_server import IDLE_TIMEOUT, TURN_TIMEOUT, YachtRoom
+from yacht_solver import load_strategy
+from yacht_state import GameState
+from yacht_timer import Timer, TimerWheel
+from yacht_trace import add_trace_arguments, profiler, start_tracing, stop_tracing, trace_options, tracer
+from yacht_transport import Endpoint, parse_endpoints
+
+SESSION_KEY_FILE = "session.key"
+RESUME_GRACE = 0.05  # 새 연결이 재접속(resume) 요청을 먼저 보내는지 기다리는 시간(초)
+RESUME_TIMEOUT = 120.0  # 모든 플레이어가 끊긴 방을 재접속을 위해 남겨두는 시간(초)
+SPECTATOR_QUEUE_LIMIT = 64 * 1024  # 관전자 한 명의 송신 대기열 최대 크기(바이트)
+LOBBY_SWEEP_INTERVAL = 1.0  # 오래 기다린 대기표를 다시 매칭하는 주기(초)
+MAX_CONNECTIONS = 10000  # 동시 연결 상한 - 넘으면 새 연결은 server_busy 응답 후 바로 종료
+MAX_ROOMS = 5000  # 진행 중인 방 상한 - 넘으면 새 플레이어는 server_busy (재접속과 관전은 허용)
+RATE_LIMIT = 50.0  # 연결당 초당 처리할 메시지 수 (토큰 버킷 충전 속도, 0이면 제한 없음)
+RATE_BURST = 100  # 한꺼번에 보낼 수 있는 메시지 수 (봇이 한 게임을 몰아서 보내도 걸리지 않는 크기)
+RATE_LIMIT_STRIKES = 200  # 버린 메시지가 이만큼 쌓이면 연결 종료
+
+
+class ConnectionLimits:
+    """연결 하나의 메시지 속도 제한(토큰 버킷)과 유휴 감시 상태.
+
+    메시지가 들어올 때만 경과 시간만큼 토큰을 채우므로 연결마다 타이머를 두지 않음.
+    마지막 수신 시각은 유휴 타이머가 만료될 때 확인해, 메시지마다 타이머를 다시 걸지 않음.
+    """
+
+    __slots__ = ("rate", "burst", "tokens", "updated", "last_seen", "dropped", "idle_timer")
+
+    def __init__(self, rate: float, burst: int):
+        """가득 찬 버킷으로 시작.
+
+        Args:
+            rate: 초당 충전할 토큰 수 (0이면 제한 없음)
+            burst: 버킷 크기
+        """
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = self.last_seen = time.monotonic()  # 마지막 토큰 충전 시각, 마지막 수신 시각
+        self.dropped = 0  # 속도 제한으로 버린 메시지 수
+        self.idle_timer: Timer | None = None
+
+    def allow(self, now: float) -> bool:
+        """메시지 하나를 처리해도 되는지 확인하고 토큰 사용.
+
+        Args:
+            now: 현재 시각 (time.monotonic)
+
+        Returns:
+            처리할 수 있으면 True, 버려야 하면 False
+        """
+        self.last_seen = now
+        if not self.rate:
+            return True
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        self.dropped += 1
+        return False
+
+
+class Outbox:
+    """연결 하나의 크기 제한이 있는 송신 대기열.
+
+    보낼 프레임을 대기열에 넣기만 하고, 전용 태스크가 모아서 쓰고 drain까지 기다림.
+    받는 쪽이 느려도 넣는 쪽(게임 진행)은 기다리지 않으며,
+    대기열이 가득 차면 put이 False를 돌려 호출한 쪽이 처리 방법을 정함.
+    """
+
+    def __init__(self, writer: asyncio.StreamWriter, limit: int = SPECTATOR_QUEUE_LIMIT):
+        """대기열을 만들고 송신 태스크 시작.
+
+        Args:
+            writer: 보낼 연결의 StreamWriter
+            limit: 대기열 최대 크기(바이트)
+        """
+        self.writer = writer
+        self.limit = limit
+        self.queue = deque()  # 아직 쓰지 않은 프레임 (여러 연결이 같은 bytes 객체를 공유)
+        self.size = 0  # 대기열의 총 바이트 수
+        self.coalesced = False  # 밀린 메시지를 스냅샷 하나로 대체한 뒤 아직 다 보내지 못한 상태
+        self.closing = False
+        self._ready = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    def put(self, data: bytes) -> bool:
+        """프레임 하나를 대기열에 추가.
+
+        Args:
+            data: 인코딩된 프레임
+
+        Returns:
+            추가했으면 True, 대기열이 가득 찼으면 False
+        """
+        if self.closing or self.size + len(data) > self.limit:
+            return False
+        self.queue.append(data)
+        self.size += len(data)
+        self._ready.set()
+        return True
+
+    def replace(self, data: bytes) -> None:
+        """밀린 프레임을 모두 버리고 프레임 하나(전체 상태)로 대체.
+
+        Args:
+            data: 대신 보낼 프레임
+        """
+        self.queue.clear()
+        self.queue.append(data)
+        self.size = len(data)
+        self.coalesced = True
+        self._ready.set()
+
+    def close(self) -> None:
+        """남은 프레임을 보낸 뒤 연결 종료."""
+        self.closing = True
+        self._ready.set()
+
+    def abort(self) -> None:
+        """남은 프레임을 버리고 바로 연결 종료."""
+        self.closing = True
+        self.queue.clear()
+        self._task.cancel()
+        self.writer.close()
+
+    async def _run(self) -> None:
+        """송신 태스크 - 쌓인 프레임을 한 번에 쓰고 drain."""
+        try:
+            while True:
+                await self._ready.wait()
+                self._ready.clear()
+                if self.queue:
+                    data = b"".join(self.queue)
+                    self.queue.clear()
+                    self.size = 0
+                    self.writer.write(data)
+                    metrics.inc("yacht_bytes_sent_total", len(data))
+                    await self.writer.drain()
+                    if not self.queue:
+                        self.coalesced = False  # 대체한 스냅샷까지 모두 전송됨
+                if self.closing and not self.queue:
+                    break
+        except (ConnectionError, OSError):
+            pass
+        finally:
+            self.writer.close()
+
+
+class AsyncYachtRoom(YachtRoom):
+    """asyncio 서버용 야추 게임 방 클래스.
+
+    게임 규칙은 YachtRoom을 그대로 사용하고,
+    클라이언트 목록에 소켓 대신 asyncio StreamWriter를 보관.
+    """
+
+    def __init__(self, room_id: int = 0, rng: DiceRNG | None = None):
+        """방 초기화.
+
+        Args:
+            room_id: 방 식별 번호
+            rng: 방 전용 주사위 생성기 (None이면 새 시드로 생성)
+        """
+        super().__init__(room_id, rng)
+        self.spectators: list[Outbox] = []  # 관전자별 송신 대기열
+        self._snapshot_frame = (-1, b"")  # (순번, 인코딩된 state_snapshot) 캐시
+
+    def snapshot_frame(self) -> bytes:
+        """현재 순번 기준의 state_snapshot 프레임 (순번이 같으면 재사용).
+
+        Returns:
+            인코딩된 state_snapshot 프레임 (JSON)
+        """
+        if self._snapshot_frame[0] != self.seq:
+            message = {"type": "state_snapshot", "data": self.game_state.to_dict(), "seq": self.seq}
+            self._snapshot_frame = (self.seq, encode_message(message))
+        return self._snapshot_frame[1]
+
+    def log(self, message: str, level: int = INFO, **fields) -> None:
+        """방 번호 필드를 붙여 로그 기록.
+
+        Args:
+            message: 로그 메시지
+            level: 로그 레벨
+            **fields: 함께 남길 구조화 필드
+        """
+        logger.log(level, message, room=self.room_id, **fields)
+
+    def send_to(self, player_id: int, message: dict, record: bool = True) -> None:
+        """특정 플레이어에게만 메시지 전송.
+
+        Args:
+            player_id: 받을 플레이어 ID
+            message: 전송할 메시지 딕셔너리
+            record: 순번을 붙이고 재전송용으로 보관할지 여부
+        """
+        if record:
+            self.stamp(message, player_id)
+        writer = self.clients[player_id]
+        if writer is not None and not writer.is_closing():
+            data = encode_message(message, binary=writer in self.binary_clients)
+            writer.write(data)
+            metrics.inc("yacht_bytes_sent_total", len(data))
+
+    def broadcast(self, message: dict) -> None:
+        """방의 모든 클라이언트에게 메시지 브로드캐스트.
+
+        StreamWriter.write는 블로킹 없이 전송 버퍼에 쌓기만 하므로
+        이벤트 루프를 멈추지 않음.
+
+        Args:
+            message: 전송할 메시지 딕셔너리
+        """
+        started = time.perf_counter()
+        self.stamp(message)
+        # 인코딩별로 한 번씩만 직렬화
+        data = encode_message(message)
+        binary_data = encode_message(message, binary=True) if self.binary_clients else data
+        sent = 0
+        for writer in self.clients:
+            if writer is not None and not writer.is_closing():
+                payload = binary_data if writer in self.binary_clients else data
+                writer.write(payload)
+                sent += len(payload)
+        metrics.inc("yacht_bytes_sent_total", sent)
+
+        # 관전자에게는 같은 bytes 객체를 대기열에 넣기만 함 (느린 관전자가 게임을 지연시키지 않음)
+        for outbox in list(self.spectators):
+            if not outbox.put(data):
+                self.overflow(outbox)
+        metrics.observe("yacht_broadcast_seconds", time.perf_counter() - started)
+        if tracer.current is not None:
+            tracer.current.add("broadcast", started, type=message["type"], bytes=sent, spectators=len(self.spectators))
+
+    def overflow(self, outbox: Outbox) -> None:
+        """관전자 대기열이 가득 찼을 때 처리.
+
+        처음에는 밀린 메시지를 현재 상태 스냅샷 하나로 합치고,
+        그 스냅샷도 다 보내기 전에 다시 가득 차면 관전자 연결을 끊음.
+
+        Args:
+            outbox: 가득 찬 관전자 대기열
+        """
+        if outbox.coalesced or outbox.closing:
+            self.spectators.remove(outbox)
+            outbox.abort()
+            self.log("느린 관전자 연결 종료", WARNING)
+        else:
+            outbox.replace(self.snapshot_frame())
+
+
+class AsyncYachtServer:
+    """asyncio 기반 멀티 룸 야추 게임 서버 클래스.
+
+    하나의 이벤트 루프에서 모든 연결을 처리하고,
+    로비에서 게임 모드와 레이팅이 가까운 두 명씩 묶어 독립된 게임 방을 만들어 동시에 진행.
+    """
+
+    def __init__(self, host: str = 'localhost', port: int = 8888, reuse_port: bool = False,
+                 journal_dir: str | None = None, snapshot_interval: float = 30.0, metrics_port: int | None = None,
+                 seed: int | None = None, secure_dice: bool = False, listen: list[Endpoint] | None = None,
+                 turn_timeout: float = TURN_TIMEOUT, idle_timeout: float = IDLE_TIMEOUT,
+                 max_connections: int = MAX_CONNECTIONS, max_rooms: int = MAX_ROOMS,
+                 rate_limit: float = RATE_LIMIT, rate_burst: int = RATE_BURST, results_path: str | None = None):
+        """서버 초기화.
+
+        Args:
+            host: 바인딩할 호스트 주소
+            port: 바인딩할 포트 번호
+            reuse_port: SO_REUSEPORT로 여러 프로세스가 같은 포트를 바인딩할지 여부
+            journal_dir: 게임 기록과 스냅샷을 남길 디렉터리 (None이면 기록하지 않음)
+            snapshot_interval: 진행 중인 방 스냅샷 주기(초)
+            metrics_port: Prometheus 형식 지표를 제공할 포트 (None이면 제공하지 않음)
+            seed: 방별 주사위 시드를 만들 기준 시드 (None이면 방마다 임의 시드, 어느 쪽이든 기록에 남음)
+            secure_dice: 모든 방에서 암호학적 난수로 주사위를 굴릴지 여부 (ranked 모드는 항상 사용)
+            listen: 접속을 받을 주소 목록 (None이면 host:port의 TCP 하나, 유닉스 소켓과 함께 여러 개 가능)
+            turn_timeout: 한 턴의 제한 시간(초)
+            idle_timeout: 아무 메시지도 보내지 않는 플레이어 연결을 끊기까지의 시간(초, 관전자 제외)
+            max_connections: 동시 연결 상한
+            max_rooms: 진행 중인 방 상한
+            rate_limit: 연결당 초당 메시지 수 (0이면 제한 없음)
+            rate_burst: 연결당 한꺼번에 보낼 수 있는 메시지 수
+            results_path: 게임 결과와 플레이어 통계를 기록할 SQLite 파일 (None이면 순위표 없음)
+        """
+        self.host = host
+        self.port = port
+        self.endpoints = listen or [Endpoint.tcp(host, port)]
+        self.metrics_port = metrics_port
+        self.reuse_port = reuse_port
+        self.journal_dir = journal_dir
+        self.snapshot_interval = snapshot_interval
+        self.journal = None
+        self.results_path = results_path
+        self.results: ResultStore | None = None
+        self.seed = seed
+        self.secure_dice = secure_dice
+        self.rooms: dict[int, AsyncYachtRoom] = {}  # 진행 중인 방 목록
+        self.lobby = Lobby()  # 상대를 기다리는 연결의 매칭 대기열
+        self.next_room_id = 1  # 다음에 만들 방 번호 (복구 시 기록된 번호 이후부터)
+        self.session_key = secrets.token_bytes(32)  # 세션 토큰 서명 키 (기록 사용 시 파일에 보관)
+        self.turn_timeout = turn_timeout
+        self.idle_timeout = idle_timeout
+        self.max_connections = max_connections
+        self.max_rooms = max_rooms
+        self.rate_limit = rate_limit
+        self.rate_burst = rate_burst
+        self.timers = TimerWheel()  # 턴 제한 시간, 유휴 연결, 재접속 대기 만료를 모두 처리
+        self._expiry: dict[int, Timer] = {}  # 방 번호 → 재접속 대기 만료 타이머
+        self.connections = 0  # 현재 연결된 클라이언트 수
+        self.games_finished = 0  # 끝까지 진행된 게임 수
+        metrics.gauge("yacht_connections", "현재 연결 수 (대기·관전 포함)", lambda: self.connections)
+        metrics.gauge("yacht_rooms", "진행 중인 방 수", lambda: len(self.rooms))
+        metrics.gauge("yacht_spectators", "현재 관전자 수",
+                      lambda: sum(len(room.spectators) for room in self.rooms.values()))
+        metrics.gauge("yacht_lobby_queued", "매칭을 기다리는 연결 수", lambda: self.lobby.depth)
+        metrics.gauge("yacht_timers", "대기 중인 타이머 수 (턴, 유휴, 재접속 대기)", lambda: len(self.timers))
+
+    def stats(self) -> dict:
+        """서버 상태 요약.
+
+        Returns:
+            방 수, 연결 수, 관전자 수, 완료한 게임 수와 매칭 대기열 상태를 담은 딕셔너리
+        """
+        spectators = sum(len(room.spectators) for room in self.rooms.values())
+        return {"rooms": len(self.rooms), "connections": self.connections, "spectators": spectators,
+                "games_finished": self.games_finished, **self.lobby.stats()}
+
+    def log(self, message: str, level: int = INFO, **fields) -> None:
+        """로그 기록 (버퍼링되어 별도 스레드에서 출력).
+
+        Args:
+            message: 로그 메시지
+            level: 로그 레벨
+            **fields: 함께 남길 구조화 필드
+        """
+        logger.log(level, message, **fields)
+
+    async def start_server(self, shared: dict[str, socket.socket] | None = None) -> None:
+        """서버 시작 및 클라이언트 연결 처리.
+
+        모든 주소에서 연결 상한까지 접속을 받아 방에 배정하고 종료될 때까지 실행.
+        어느 주소로 들어왔는지와 관계없이 같은 로비에서 매칭.
+
+        Args:
+            shared: 주소 문자열 → 이미 listen 중인 소켓 (여러 프로세스가 하나의 소켓을 공유할 때)
+        """
+        profiler.watch()  # 샘플링 프로파일러는 이벤트 루프 스레드만 표본 추출
+        if self.results_path is not None:
+            self.results = ResultStore(self.results_path)
+        if self.journal_dir is not None:
+            self.restore()
+        shared = shared or {}
+        servers = []
+        for endpoint in self.endpoints:
+            sock = shared.get(str(endpoint))
+            if sock is None:
+                servers.append(await endpoint.listen(self.handle_client, self.reuse_port))
+            elif sock.family == socket.AF_UNIX:
+                servers.append(await asyncio.start_unix_server(self.handle_client, sock=sock))
+            else:
+                servers.append(await asyncio.start_server(self.handle_client, sock=sock))
+            self.log(f"asyncio 서버 시작 - {endpoint}")
+        if load_strategy() is None:
+            self.log("기대값 테이블 없음 - 힌트 비활성화 (python app/src/yacht_solver.py 로 생성)")
+        else:
+            self.log("기대값 테이블 로드 완료 - 힌트 활성화")
+        scrape_server = None
+        if self.metrics_port is not None:
+            scrape_server = await asyncio.start_server(handle_scrape, self.host, self.metrics_port)
+            self.log(f"지표 제공 - http://{self.host}:{self.metrics_port}/metrics")
+        snapshots = asyncio.create_task(self.snapshot_loop()) if self.journal is not None else None
+        sweeper = asyncio.create_task(self.lobby_loop())
+        ticker = asyncio.create_task(self.timers.run())
+        try:
+            await asyncio.gather(*(server.serve_forever() for server in servers))
+        finally:
+            for server, endpoint in zip(servers, self.endpoints):
+                server.close()
+                if str(endpoint) not in shared:
+                    endpoint.cleanup()  # 공유 소켓 파일은 감독 프로세스가 정리
+            sweeper.cancel()
+            ticker.cancel()
+            if scrape_server is not None:
+                scrape_server.close()
+            if snapshots is not None:
+                snapshots.cancel()
+                self.journal.close()
+            if self.results is not None:
+                self.results.close()
+
+    def restore(self) -> None:
+        """기록 디렉터리에서 진행 중이던 게임을 복구하고 기록 시작."""
+        seeds = {}  # 방 번호 → 마지막 주사위 시드 (0이면 암호학적 난수)
+        games, self.next_room_id = recover(self.journal_dir, seeds)
+        self.journal = Journal(self.journal_dir)
+        # 재시작 전에 발급한 세션 토큰으로도 재접속할 수 있도록 서명 키를 보관
+        key_path = os.path.join(self.journal_dir, SESSION_KEY_FILE)
+        if os.path.exists(key_path):
+            with open(key_path, "rb") as f:
+                self.session_key = f.read()
+        else:
+            # 서명 키는 다른 사용자가 읽지 못하도록 처음부터 소유자 전용(0600)으로 생성
+            with os.fdopen(os.open(key_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600), "wb") as f:
+                f.write(self.session_key)
+        for room_id, state in games.items():
+            # 복구된 방은 남은 주사위를 새 생성기로 이어서 굴림 (이미 굴린 주사위는 기록에 있음)
+            # 암호학적 난수를 쓰던 방(ranked 등)은 시드 있는 생성기로 바뀌지 않도록 그대로 유지
+            if seeds.get(room_id) == SECURE_SEED:
+                rng = DiceRNG(SECURE_SEED)
+            else:
+                rng = self.room_rng(room_id, None)
+            self.journal.record_reseed(room_id, rng.seed)
+            room = AsyncYachtRoom(room_id, rng)
+            room.game_state = state
+            room.clients = [None, None]  # 플레이어가 재접속할 때까지 비어 있음
+            self.rooms[room_id] = room
+            self.watch_room(room)
+            self.schedule_expiry(room)
+        for room in self.rooms.values():
+            room.journal = self.journal
+            room.results = self.results  # 이름은 복구하지 않으므로 게임만 기록하고 플레이어 통계에는 반영하지 않음
+        self.log("게임 기록 사용", directory=self.journal_dir, recovered=len(games))
+
+    async def snapshot_loop(self) -> None:
+        """진행 중인 방의 상태를 주기적으로 스냅샷으로 저장.
+
+        복구할 때 기록 전체가 아닌 마지막 스냅샷 이후의 레코드만 재생하면 됨.
+        """
+        while True:
+            await asyncio.sleep(self.snapshot_interval)
+            games = {room_id: room.game_state for room_id, room in self.rooms.items()}
+            seeds = {room_id: room.rng.seed for room_id, room in self.rooms.items()}
+            self.journal.snapshot(games, self.next_room_id, seeds)
+
+    async def lobby_loop(self) -> None:
+        """오래 기다린 대기표를 주기적으로 레이팅 구간 제한 없이 매칭."""
+        while True:
+            await asyncio.sleep(LOBBY_SWEEP_INTERVAL)
+            for pair in self.lobby.sweep():
+                self.start_room(*pair)
+
+    async def matchmake(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+                        decoder: FrameDecoder, pending: list,
+                        limits: ConnectionLimits) -> tuple[AsyncYachtRoom, int] | None:
+        """새 연결을 로비에 넣고 상대가 정해질 때까지 대기.
+
+        대기 중에도 연결을 계속 읽어 끊김을 바로 감지하고(대기표 취소),
+        그 사이 받은 메시지는 pending에 모아 매칭 후 속도 제한을 거쳐 처리 (burst개를 넘으면 버림).
+        접속이 몰려 join 메시지가 늦게 도착하면 그 조건으로 다시 줄을 섬.
+
+        Args:
+            reader: 새로 접속한 클라이언트의 StreamReader
+            writer: 새로 접속한 클라이언트의 StreamWriter
+            decoder: 연결의 FrameDecoder
+            pending: 아직 처리하지 않은 메시지 목록 (제자리에서 갱신)
+            limits: 연결의 속도 제한과 유휴 감시 상태
+
+        Returns:
+            배정된 방과 방 안에서의 플레이어 ID, 매칭 전에 연결이 끊기면 None
+        """
+        future = asyncio.get_running_loop().create_future()  # 매칭되면 (방, 플레이어 ID)
+        ticket = None
+
+        def enqueue(data: dict) -> Ticket:
+            if ticket is not None:
+                self.lobby.cancel(ticket)
+            new = Ticket(writer, data)
+            new.future = future
+            pair = self.lobby.enqueue(new)
+            if pair is not None:
+                self.start_room(*pair)
+            return new
+
+        ticket = enqueue(pending.pop(0)["data"] if pending and pending[0]["type"] == "join" else {})
+        try:
+            while not future.done():
+                read = asyncio.ensure_future(reader.read(65536))
+                await asyncio.wait((future, read), return_when=asyncio.FIRST_COMPLETED)
+                if not read.done():
+                    read.cancel()  # 읽지 않은 데이터는 StreamReader 버퍼에 남음
+                    await asyncio.wait((read,))
+                if read.cancelled():
+                    continue
+                data = read.result()
+                if not data and not future.done():
+                    return None
+                metrics.inc("yacht_bytes_received_total", len(data))
+                limits.last_seen = time.monotonic()
+                for message in decoder.feed(data):
+                    if message["type"] == "join" and not future.done():
+                        if limits.allow(limits.last_seen):  # 다시 줄서기도 속도 제한
+                            ticket = enqueue(message["data"])
+                        else:
+                            metrics.inc("yacht_rate_limited_total")
+                    elif len(pending) < limits.burst:
+                        pending.append(message)
+                    else:
+                        metrics.inc("yacht_rate_limited_total")  # 매칭 전에 쌓아 둘 메시지 수 제한
+        finally:
+            if not future.done():
+                self.lobby.cancel(ticket)
+        return future.result()
+
+    def start_room(self, first: Ticket, second: Ticket) -> None:
+        """매칭된 두 연결로 새 방을 만들고 게임 시작.
+
+        Args:
+            first: 먼저 기다린 대기표 (플레이어 1)
+            second: 나중에 들어온 대기표 (플레이어 2)
+        """
+        room_id = self.next_room_id
+        self.next_room_id += 1
+        room = AsyncYachtRoom(room_id, self.room_rng(room_id, first.mode))
+        room.journal = self.journal
+        room.results = self.results
+        room.names = [first.name, second.name]
+        room.timers = self.timers
+        room.turn_timeout = self.turn_timeout
+        room.game_state = GameState(tuple(ticket.name or f"Player{i + 1}" for i, ticket in enumerate((first, second))))
+        room.clients = [first.client, second.client]
+        self.rooms[room_id] = room
+
+        for player_id, ticket in enumerate((first, second)):
+            # 클라이언트에게 플레이어 ID와 재접속용 세션 토큰 전송
+            welcome_msg = {"type": "player_id", "data": {
+                "id": player_id, "session": self.session_token(room_id, player_id)}}
+            ticket.client.write(encode_message(welcome_msg))
+            ticket.future.set_result((room, player_id))
+
+        room.log("게임 시작!", mode=first.mode, ratings=f"{first.rating}/{second.rating}", seed=room.rng.seed)
+        metrics.inc("yacht_games_started_total")
+        now = time.monotonic()
+        metrics.observe("yacht_match_wait_seconds", now - first.enqueued_at)
+        metrics.observe("yacht_match_wait_seconds", now - second.enqueued_at)
+        if self.journal is not None:
+            self.journal.record_start(room_id, room.rng.seed)
+        room.broadcast({"type": "game_start", "data": room.game_state.to_dict()})
+        room.watch_turn()
+
+    def watch_room(self, room: AsyncYachtRoom) -> None:
+        """복구한 방에 턴 제한 시간 적용.
+
+        Args:
+            room: 기록에서 복구한 방
+        """
+        room.timers = self.timers
+        room.turn_timeout = self.turn_timeout
+        room.watch_turn()
+
+    def room_rng(self, room_id: int, mode: str | None) -> DiceRNG:
+        """새 방의 주사위 생성기.
+
+        Args:
+            room_id: 방 번호
+            mode: 게임 모드 (ranked면 암호학적 난수 사용)
+
+        Returns:
+            시드를 정한 DiceRNG
+        """
+        if self.secure_dice or mode == RANKED_MODE:
+            return DiceRNG(SECURE_SEED)
+        return DiceRNG(derive_seed(self.seed, room_id))
+
+    def session_token(self, room_id: int, player_id: int) -> str:
+        """방과 플레이어 번호에 서명한 세션 토큰 발급.
+
+        서버는 토큰을 따로 저장하지 않고, 재접속 시 서명을 다시 계산해 검증.
+
+        Args:
+            room_id: 방 번호
+            player_id: 방 안에서의 플레이어 ID
+
+        Returns:
+            "방번호-플레이어ID-서명" 형태의 토큰
+        """
+        subject = f"{room_id}-{player_id}"
+        signature = hmac.new(self.session_key, subject.encode(), hashlib.sha256).hexdigest()[:32]
+        return f"{subject}-{signature}"
+
+    def resume(self, writer: asyncio.StreamWriter, data: dict) -> tuple[AsyncYachtRoom, int] | None:
+        """세션 토큰으로 기존 방의 자리에 새 연결을 다시 연결.
+
+        놓친 메시지가 링 버퍼에 남아 있으면 그것만 다시 보내고,
+        버퍼가 이미 지나쳤으면 전체 상태 스냅샷을 보냄.
+
+        Args:
+            writer: 재접속한 클라이언트의 StreamWriter
+            data: resume 메시지 데이터 (session, last_seq)
+
+        Returns:
+            다시 연결된 방과 플레이어 ID, 토큰이 유효하지 않으면 None
+        """
+        try:
+            room_id, player_id, _ = data["session"].split("-")
+            room_id, player_id = int(room_id), int(player_id)
+        except (KeyError, AttributeError, ValueError):
+            return None
+        room = self.rooms.get(room_id)
+        if (room is None or player_id not in (0, 1)
+                or not hmac.compare_digest(data["session"], self.session_token(room_id, player_id))):
+            return None
+
+        old = room.clients[player_id]
+        if old is not None and not old.is_closing():
+            old.close()  # 끊긴 줄 모르고 남아 있던 이전 연결 정리
+        room.binary_clients.discard(old)
+        room.clients[player_id] = writer
+        handle = self._expiry.pop(room_id, None)
+        if handle is not None:
+            handle.cancel()
+
+        writer.write(encode_message({"type": "player_id", "data": {
+            "id": player_id, "session": data["session"], "resumed": True}}))
+        missed = room.missed_messages(player_id, data.get("last_seq", 0))
+        if missed is None:
+            # 링 버퍼가 지나친 지점 - 현재 순번이 붙은 전체 상태로 대체
+            writer.write(room.snapshot_frame())
+            room.log("재접속 - 스냅샷 전송", player=player_id + 1)
+        else:
+            writer.write(b"".join(encode_message(message) for message in missed))
+            room.log("재접속 - 놓친 메시지 재전송", player=player_id + 1, missed=len(missed))
+        return room, player_id
+
+    def find_room(self, room_id: int | None) -> AsyncYachtRoom | None:
+        """관전할 방 선택.
+
+        Args:
+            room_id: 요청한 방 번호 (None이면 관전자가 가장 많은 진행 중인 방)
+
+        Returns:
+            관전할 방, 없으면 None
+        """
+        if room_id is not None:
+            return self.rooms.get(room_id)
+        playing = [room for room in self.rooms.values() if not room.game_state.game_over]
+        return max(playing, key=lambda room: len(room.spectators), default=None)
+
+    async def spectate(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, data: dict) -> None:
+        """관전자 연결 처리.
+
+        현재 상태 스냅샷을 보낸 뒤 방의 브로드캐스트를 계속 받음.
+        관전자가 보내는 메시지는 무시.
+
+        Args:
+            reader: 관전자 StreamReader
+            writer: 관전자 StreamWriter
+            data: spectate 메시지 데이터 (room: 방 번호, 생략 가능)
+        """
+        room = self.find_room(data.get("room"))
+        if room is None:
+            writer.write(encode_message({"type": "spectate_failed", "data": {}}))
+            return
+
+        outbox = Outbox(writer)
+        room.spectators.append(outbox)
+        outbox.put(encode_message({"type": "spectating", "data": {"room": room.room_id}}))
+        outbox.put(room.snapshot_frame())
+        room.log("관전자 입장", spectators=len(room.spectators))
+        try:
+            while await reader.read(65536):
+                pass
+        finally:
+            if outbox in room.spectators:
+                room.spectators.remove(outbox)
+                outbox.close()
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """개별 클라이언트 연결 처리.
+
+        연결 직후 resume 메시지가 오면 기존 방의 자리로 다시 연결하고,
+        spectate 메시지가 오면 관전자로, 순위 조회 요청이 오면 조회 전용 연결로 처리하며,
+        그렇지 않으면 로비에서 상대와 매칭해 새 방에 배정 (join 메시지로 이름·모드·레이팅 지정).
+        연결이나 방이 상한에 도달했으면 읽기 전에 server_busy로 거절하고,
+        플레이어 연결은 속도 제한과 유휴 시간 제한을 받음.
+
+        Args:
+            reader: 클라이언트 StreamReader
+            writer: 클라이언트 StreamWriter
+        """
+        addr = writer.get_extra_info('peername') or writer.get_extra_info('sockname')  # 유닉스 소켓은 경로
+        if self.connections >= self.max_connections:
+            self.reject(writer, "connections")
+            return
+        self.connections += 1
+        decoder = FrameDecoder()  # 조각난 프레임을 모아 메시지 단위로 분리
+        limits = ConnectionLimits(self.rate_limit, self.rate_burst)
+        room = None
+        player_id = None
+        trace = None  # 이번 읽기를 추적하는 기록기 (표본으로 뽑히지 않으면 None)
+        try:
+            # 재접속하는 클라이언트와 관전자는 연결하자마자 resume / spectate를 보냄 (새 플레이어는 join)
+            # 읽기를 바로 취소하지 않고 기다림 - 부하가 몰려 시간 초과와 데이터 도착이
+            # 같은 루프 차례에 처리되더라도 이미 도착한 첫 메시지를 놓치지 않음
+            read = asyncio.ensure_future(reader.read(65536))
+            await asyncio.wait((read,), timeout=RESUME_GRACE)
+            if not read.done():
+                read.cancel()  # 읽지 않은 데이터는 StreamReader 버퍼에 남음
+                await asyncio.wait((read,))
+            data = b"" if read.cancelled() else read.result()
+            metrics.inc("yacht_bytes_received_total", len(data))
+            pending = decoder.feed(data)
+
+            if pending and pending[0]["type"] == "spectate":
+                await self.spectate(reader, writer, pending[0]["data"])
+                return
+            limits.idle_timer = self.timers.schedule(self.idle_timeout, self.check_idle, writer, limits)
+            if pending and pending[0]["type"] in QUERY_TYPES:
+                await self.serve_queries(reader, writer, decoder, pending, limits)
+                return
+            if pending and pending[0]["type"] == "resume":
+                resumed = self.resume(writer, pending.pop(0)["data"])
+                if resumed is None:
+                    writer.write(encode_message({"type": "resume_failed", "data": {}}))
+                    return
+                room, player_id = resumed
+            elif len(self.rooms) >= self.max_rooms:
+                self.reject(writer, "rooms")
+                return
+            else:
+                matched = await self.matchmake(reader, writer, decoder, pending, limits)
+                if matched is None:
+                    return  # 매칭 전에 연결 종료
+                room, player_id = matched
+                room.log("접속", player=player_id + 1, addr=addr)
+
+            while not room.game_state.game_over:
+                # 한 번의 읽기에 여러 메시지가 들어있을 수 있음
+                now = time.monotonic()
+                dropped = []  # 버린 메시지의 요청 id (id가 없으면 None)
+                for message in pending:
+                    if not limits.allow(now):
+                        dropped.append(message.get("id"))  # 처리하기 전에 버려 과부하가 다른 방으로 번지지 않도록
+                        continue
+                    room.log("수신", DEBUG, player=player_id + 1, type=message["type"])
+                    started = time.perf_counter()
+                    tracer.current = trace  # 방 안의 단계(점수 계산, 브로드캐스트)가 같은 기록기에 이어서 기록
+                    room.process_message(message, player_id)
+                    tracer.current = None
+                    metrics.observe("yacht_message_seconds", time.perf_counter() - started, message_label(message["type"]))
+                    if trace is not None:
+                        trace.add("process_message", started, type=message["type"])
+                room.watch_turn()
+                if dropped:
+                    metrics.inc("yacht_rate_limited_total", len(dropped))
+                    # 응답을 기다리는 클라이언트가 버려진 요청을 알 수 있도록 id를 함께 보냄
+                    notice = {"dropped": len(dropped)}
+                    ids = [request_id for request_id in dropped if request_id is not None]
+                    if ids:
+                        notice["ids"] = ids
+                    writer.write(encode_message({"type": "rate_limited", "data": notice}))
+                    if limits.dropped >= RATE_LIMIT_STRIKES:
+                        room.log("속도 제한 초과 - 연결 종료", WARNING, player=player_id + 1, dropped=limits.dropped)
+                        break
+                await writer.drain()
+
+                # 추적은 읽기 단위로 표본 추출 (read 스팬에는 클라이언트를 기다린 시간도 포함)
+                trace = tracer.sample(room.room_id * 2 + player_id, f"방 {room.room_id} 플레이어 {player_id + 1}",
+                                      room=room.room_id, player=player_id + 1)
+                started = time.perf_counter()
+                data = await reader.read(65536)
+                if not data:
+                    break
+                metrics.inc("yacht_bytes_received_total", len(data))
+                if trace is not None:
+                    trace.add("read", started, bytes=len(data))
+                    started = time.perf_counter()
+                pending = decoder.feed(data)
+                if trace is not None:
+                    trace.add("decode", started, messages=len(pending))
+
+        except ValueError as e:
+            # 프레임이 깨지면 이후 경계를 알 수 없으므로 invalid_request를 알린 뒤 연결 종료
+            self.log("잘못된 프레임 - 연결 종료", WARNING, addr=addr, error=e)
+            writer.write(encode_message(error_message("invalid_request")))
+        except Exception as e:
+            self.log("클라이언트 오류", ERROR, addr=addr, error=e)
+        finally:
+            if trace is not None and tracer.current is trace:
+                tracer.current = None  # 처리 도중 예외로 빠져나온 경우
+            if limits.idle_timer is not None:
+                limits.idle_timer.cancel()
+            if room is not None:
+                self.leave_room(room, writer)
+                room.log("연결 종료", player=player_id + 1)
+            self.connections -= 1
+            writer.close()
+
+    async def serve_queries(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+                            decoder: FrameDecoder, pending: list, limits: ConnectionLimits) -> None:
+        """게임에 참여하지 않고 순위표와 플레이어 통계만 조회하는 연결 처리.
+
+        조회 요청이 아닌 메시지는 무시하고 (id가 있으면 unknown_type error로 응답),
+        연결이 끊길 때까지 요청마다 응답 (id가 있으면 응답 뒤에 ack).
+
+        Args:
+            reader: 클라이언트 StreamReader
+            writer: 클라이언트 StreamWriter
+            decoder: 연결의 FrameDecoder
+            pending: 이미 받은 메시지 목록
+            limits: 연결의 속도 제한과 유휴 감시 상태
+        """
+        while True:
+            now = time.monotonic()
+            for message in pending:
+                if message["type"] not in QUERY_TYPES:
+                    if "id" in message:
+                        writer.write(encode_message(error_message("unknown_type", message["id"])))
+                    continue
+                if not limits.allow(now):
+                    metrics.inc("yacht_rate_limited_total")
+                    continue
+                started = time.perf_counter()
+                writer.write(encode_message(answer_query(self.results, message)))
+                if "id" in message:
+                    writer.write(encode_message(ack_message(message["id"])))
+                metrics.observe("yacht_message_seconds", time.perf_counter() - started, message_label(message["type"]))
+            await writer.drain()
+            data = await reader.read(65536)
+            if not data:
+                return
+            metrics.inc("yacht_bytes_received_total", len(data))
+            pending = decoder.feed(data)
+
+    def reject(self, writer: asyncio.StreamWriter, reason: str) -> None:
+        """상한에 도달해 새 연결을 거절 (아무것도 읽지 않고 바로 종료).
+
+        Args:
+            writer: 거절할 연결의 StreamWriter
+            reason: 거절 이유 ("connections" 또는 "rooms")
+        """
+        metrics.inc("yacht_rejected_connections_total")
+        self.log("연결 거절", DEBUG, reason=reason)
+        writer.write(encode_message({"type": "server_busy", "data": {"reason": reason}}))
+        writer.close()
+
+    def check_idle(self, writer: asyncio.StreamWriter, limits: ConnectionLimits) -> None:
+        """유휴 타이머 만료 - 마지막 수신 이후 idle_timeout이 지났으면 연결 종료.
+
+        메시지를 받을 때마다 타이머를 다시 걸지 않고, 만료 시 남은 시간만큼 다시 걺.
+
+        Args:
+            writer: 확인할 연결의 StreamWriter
+            limits: 연결의 마지막 수신 시각을 가진 상태
+        """
+        if writer.is_closing():
+            return
+        idle = time.monotonic() - limits.last_seen
+        if idle < self.idle_timeout:
+            limits.idle_timer = self.timers.schedule(self.idle_timeout - idle, self.check_idle, writer, limits)
+            return
+        limits.idle_timer = None
+        metrics.inc("yacht_idle_disconnects_total")
+        self.log("유휴 시간 초과 - 연결 종료", WARNING, idle=round(idle, 1))
+        writer.write(encode_message({"type": "idle_timeout", "data": {}}))
+        writer.close()  # 읽고 있던 handle_client가 연결 종료로 정리
+
+    def leave_room(self, room: AsyncYachtRoom, writer: asyncio.StreamWriter) -> None:
+        """연결이 끊어진 클라이언트를 방에서 정리.
+
+        끝난 게임에 남은 클라이언트가 없으면 방 목록에서 제거.
+        진행 중인 게임은 재접속할 수 있도록 RESUME_TIMEOUT 동안 남겨둠.
+
+        Args:
+            room: 클라이언트가 속한 방
+            writer: 연결이 끊어진 클라이언트의 StreamWriter
+        """
+        room.binary_clients.discard(writer)
+        if all(client is None or client is writer or client.is_closing() for client in room.clients):
+            if room.game_state.game_over:
+                self.close_room(room)
+            elif room.room_id not in self._expiry:
+                self.schedule_expiry(room)
+
+    def schedule_expiry(self, room: AsyncYachtRoom) -> None:
+        """아무도 재접속하지 않으면 RESUME_TIMEOUT 뒤에 방을 정리하도록 예약.
+
+        Args:
+            room: 모든 플레이어의 연결이 끊긴 방
+        """
+        def expire() -> None:
+            self._expiry.pop(room.room_id, None)
+            if all(client is None or client.is_closing() for client in room.clients):
+                room.log("재접속 대기 시간 초과 - 방 정리")
+                self.close_room(room)
+
+        self._expiry[room.room_id] = self.timers.schedule(RESUME_TIMEOUT, expire)
+
+    def close_room(self, room: AsyncYachtRoom) -> None:
+        """방을 목록에서 제거하고 종료 기록.
+
+        Args:
+            room: 정리할 방
+        """
+        if self.rooms.pop(room.room_id, None) is not None:
+            if room.turn_timer is not None:
+                room.turn_timer.cancel()
+            for outbox in room.spectators:
+                outbox.close()  # 남은 메시지(game_end 등)를 보낸 뒤 종료
+            room.spectators.clear()
+            if self.journal is not None:
+                self.journal.record_end(room.room_id)
+            if room.game_state.game_over:
+                self.games_finished += 1
+            else:
+                metrics.inc("yacht_games_abandoned_total")
+
+
+def add_limit_arguments(parser: argparse.ArgumentParser) -> None:
+    """제한 시간과 수용 한도 명령행 옵션 추가 (멀티 프로세스 서버와 공유).
+
+    Args:
+        parser: 옵션을 추가할 파서
+    """
+    parser.add_argument("--turn-timeout", type=float, default=TURN_TIMEOUT,
+                        help=f"턴 제한 시간(초) - 넘기면 서버가 대신 기록, 연속으로 넘기면 기권 (기본: {TURN_TIMEOUT:g})")
+    parser.add_argument("--idle-timeout", type=float, default=IDLE_TIMEOUT,
+                        help=f"아무 메시지도 없는 연결을 끊을 시간(초) (기본: {IDLE_TIMEOUT:g})")
+    parser.add_argument("--max-connections", type=int, default=MAX_CONNECTIONS, help="동시 연결 상한 (워커마다)")
+    parser.add_argument("--max-rooms", type=int, default=MAX_ROOMS, help="진행 중인 방 상한 (워커마다)")
+    parser.add_argument("--rate-limit", type=float, default=RATE_LIMIT, help="연결당 초당 메시지 수 (0이면 제한 없음)")
+    parser.add_argument("--rate-burst", type=int, default=RATE_BURST, help="연결당 한꺼번에 보낼 수 있는 메시지 수")
+
+
+def limit_options(args: argparse.Namespace) -> dict:
+    """add_limit_arguments로 받은 값을 AsyncYachtServer 키워드 인자로 변환."""
+    return {"turn_timeout": args.turn_timeout, "idle_timeout": args.idle_timeout,
+            "max_connections": args.max_connections, "max_rooms": args.max_rooms,
+            "rate_limit": args.rate_limit, "rate_burst": args.rate_burst}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="야추 asyncio 멀티 룸 서버")
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=8888)
+    parser.add_argument("--listen", action="append", metavar="ADDRESS",
+                        help="접속을 받을 주소 (여러 번 지정 가능, 예: tcp://0.0.0.0:8888, unix:/tmp/yacht.sock)")
+    parser.add_argument("--journal", help="게임 기록 디렉터리 (지정하면 재시작 시 진행 중인 게임 복구)")
+    parser.add_argument("--snapshot-interval", type=float, default=30.0, help="스냅샷 주기(초)")
+    parser.add_argument("--metrics-port", type=int, help="Prometheus 형식 지표를 제공할 포트")
+    parser.add_argument("--log-level", choices=LEVELS, default="info", help="debug면 메시지마다 로그 (기본: info)")
+    parser.add_argument("--log-format", choices=("text", "json"), default="text")
+    parser.add_argument("--seed", type=int, help="기준 주사위 시드 (방 번호와 섞어 방마다 다른 시드 사용)")
+    parser.add_argument("--secure-dice", action="store_true", help="모든 방에서 암호학적 난수로 주사위 굴리기")
+    parser.add_argument("--results", metavar="PATH", help="게임 결과와 플레이어 통계를 기록할 SQLite 파일 (순위표)")
+    add_limit_arguments(parser)
+    add_trace_arguments(parser)
+    args = parser.parse_args()
+
+    logger.configure(args.log_level, args.log_format)
+    start_tracing(**trace_options(args))
+    server = AsyncYachtServer(args.host, args.port, journal_dir=args.journal, snapshot_interval=args.snapshot_interval,
+                              metrics_port=args.metrics_port, seed=args.seed, secure_dice=args.secure_dice,
+                              listen=parse_endpoints(args.listen, args.host, args.port), results_path=args.results,
+                              **limit_options(args))
+    try:
+        asyncio.run(server.start_server())
+    finally:
+        stop_tracing()
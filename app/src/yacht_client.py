@@ -1,22 +1,37 @@
-import socket
-import json
-import threading
+import argparse
+import asyncio
 import sys
+from collections import deque
+
+from yacht_render import MESSAGE_LINES, ScreenRenderer, build_screen, dice_rows
+from yacht_scoring import CATEGORIES, score, score_all, total_score
+from yacht_session import GameSession
+from yacht_transport import Endpoint
 
 
 class YachtClient:
     """야추 게임 클라이언트 클래스.
     
     서버에 연결하여 야추 게임을 플레이하는 클라이언트.
-    소켓 통신을 통해 서버와 메시지를 주고받고 사용자 입력을 처리.
+    연결 처리는 GameSession에 맡기고, 서버 메시지와 사용자 입력이 도착하는 즉시
+    하나의 이벤트 루프에서 처리하므로 입력 상태를 여러 스레드가 동시에 바꾸지 않음.
     """
     
-    def __init__(self):
+    def __init__(self, binary: bool = False, join: dict | None = None, host: str = 'localhost', port: int = 8888,
+                 screen: bool = False, endpoint: Endpoint | None = None):
         """클라이언트 초기화.
         
-        소켓, 게임 상태, 입력 상태 관리 변수들을 초기화.
+        세션, 게임 상태, 입력 상태 관리 변수들을 초기화.
+
+        Args:
+            binary: 접속 시 바이너리 인코딩을 제안할지 여부 (기본은 JSON)
+            join: 매칭에 사용할 이름·게임 모드·레이팅 (None이면 서버 기본값)
+            host: 서버 호스트
+            port: 서버 포트
+            screen: 고정 배치 화면에서 바뀐 칸만 다시 그릴지 여부 (False면 줄 단위로 이어서 출력)
+            endpoint: 접속할 주소 (지정하면 host, port 대신 사용)
         """
-        self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.session = GameSession(self, host, port, binary=binary, join=join, endpoint=endpoint)
         self.player_id = None  # 서버에서 할당받을 플레이어 ID (0 또는 1)
         self.game_state = None  # 서버에서 받은 게임 상태
         self.current_dice = []  # 현재 턴의 주사위 결과
@@ -24,70 +39,71 @@ class YachtClient:
 
         # 입력 상태 관리 - 현재 어떤 입력을 기다리는지 추적
         self.input_state = "waiting"  # waiting, roll, reroll, category, finished
-        self.waiting_for_input = False  # 사용자 입력 대기 플래그
+        self.waiting_for_input = False  # 사용자 입력 대기 플래그 (요청을 보낸 뒤 응답 전까지 False)
+
+        # 화면 모드 - 알림과 프롬프트를 모아 두었다가 바뀐 부분만 다시 그림
+        self.renderer = ScreenRenderer() if screen else None
+        self.messages: deque[str] = deque(maxlen=MESSAGE_LINES)  # 최근 알림
+        self.prompt_text = ""  # 마지막 줄에 표시할 프롬프트
 
-    def connect(self) -> bool:
-        """서버에 연결 시도.
+    def handle_message(self, message: dict) -> bool:
+        """서버에서 받은 메시지 처리.
         
+        Args:
+            message: 서버에서 받은 메시지 딕셔너리
+
         Returns:
-            연결 성공 시 True, 실패 시 False
+            게임이 끝났으면 True
         """
-        try:
-            self.socket.connect(('localhost', 8888))  # 로컬호스트 8888번 포트로 연결
-            print("서버 접속 완료")
-            # 메시지 수신을 별도 스레드에서 처리 (daemon으로 설정하여 메인 종료 시 함께 종료)
-            threading.Thread(target=self.receive_messages, daemon=True).start()
+        if message["type"] == "player_id":
+            # 서버에서 할당한 플레이어 ID 저장 (세션 토큰은 GameSession이 보관)
+            self.player_id = message["data"]["id"]
+            if message["data"].get("resumed"):
+                self.notify(f"재접속 완료 - 플레이어 {self.player_id + 1}")
+            else:
+                self.notify(f"플레이어 {self.player_id + 1}로 게임 참여")
+
+        elif message["type"] == "resume_failed":
+            # 방이 이미 정리되었거나 토큰이 유효하지 않음
+            self.notify("\n재접속 실패 - 게임이 이미 종료되었습니다")
+            self.input_state = "finished"
+            self.waiting_for_input = False
             return True
-        except Exception as e:
-            print(f"접속 실패: {e}")
-            return False
 
-    def receive_messages(self) -> None:
-        """서버로부터 메시지 수신 처리.
-        
-        별도 스레드에서 실행되어 서버 메시지를 지속적으로 수신.
-        """
-        while True:
-            try:
-                data = self.socket.recv(1024).decode()  # 1KB 버퍼로 데이터 수신
-                if not data:
-                    break
+        elif message["type"] == "server_busy":
+            # 서버 연결 수 또는 방 수 상한 초과
+            self.notify("\n서버가 가득 찼습니다 - 잠시 후 다시 접속하세요")
+            self.input_state = "finished"
+            self.waiting_for_input = False
+            return True
 
-                message = json.loads(data)
-                self.handle_message(message)
+        elif message["type"] == "turn_timeout":
+            # 제한 시간 초과 - 서버가 대신 굴리고 기록하거나 기권 처리
+            data = message["data"]
+            who = "당신" if data["player"] == self.player_id else f"플레이어 {data['player'] + 1}"
+            self.notify(f"\n{who}의 턴 시간 초과 - " + ("기권 처리" if data["forfeit"] else "서버가 대신 기록"))
 
-            except Exception as e:
-                print(f"수신 오류: {e}")
-                break
+        elif message["type"] == "rate_limited":
+            self.notify(f"\n요청이 너무 많아 {message['data']['dropped']}개를 처리하지 않았습니다")
+            if message["data"].get("ids"):
+                self.resume_input()  # 버려진 요청의 응답을 기다리지 않고 다시 입력받음
 
-    def clear_input_buffer(self) -> None:
-        """입력 버퍼 클리어.
-        
-        터미널 입력 버퍼를 클리어하여 이전 입력이 남아있지 않도록 처리.
-        Unix/Linux 시스템에서만 동작.
-        """
-        try:
-            import termios, tty
-            sys.stdin.flush()
-        except:
-            # Windows나 termios 미지원 시스템에서는 무시
-            pass
+        elif message["type"] == "error":
+            # 보낸 요청이 규칙에 맞지 않아 처리되지 않음 - 이유를 알리고 다시 입력받음
+            self.notify(f"\n요청 거절: {message['data']['message']}")
+            if message["request"] is not None:
+                self.resume_input()
 
-    def handle_message(self, message: dict) -> None:
-        """서버에서 받은 메시지 처리.
-        
-        Args:
-            message: 서버에서 받은 메시지 딕셔너리
-        """
-        if message["type"] == "player_id":
-            # 서버에서 할당한 플레이어 ID 저장
-            self.player_id = message["data"]["id"]
-            print(f"플레이어 {self.player_id + 1}로 게임 참여")
+        elif message["type"] == "idle_timeout":
+            self.notify("\n오랫동안 입력이 없어 연결이 종료되었습니다")
+
+        elif message["type"] == "reconnecting":
+            self.notify(f"\n연결이 끊겼습니다 - 재접속 중... ({message['data']['attempt']}회)")
 
         elif message["type"] == "game_start":
             # 게임 시작 - 초기 게임 상태 수신
             self.game_state = message["data"]
-            print("\n=== 게임 시작 ===")
+            self.notify("\n=== 게임 시작 ===")
             self.show_game_status()
             self.update_input_state()
 
@@ -97,9 +113,10 @@ class YachtClient:
             if data["player"] == self.player_id:  # 본인의 주사위 결과만 처리
                 self.current_dice = data["dice"]
                 self.rolls_left = data["rolls_left"]
-                print(f"\n주사위 결과:")
-                print(self.render_ascii_art_dice(self.current_dice))
-                print(f"남은 굴리기: {self.rolls_left}")
+                if self.renderer is None:
+                    print(f"\n주사위 결과:")
+                    print(self.render_ascii_art_dice(self.current_dice))
+                    print(f"남은 굴리기: {self.rolls_left}")
 
                 # 굴리기 횟수에 따라 다음 입력 상태 결정
                 if self.rolls_left > 0:
@@ -112,21 +129,100 @@ class YachtClient:
                 self.waiting_for_input = True
 
         elif message["type"] == "turn_end":
-            # 턴 종료 - 점수 기록 및 게임 상태 업데이트
+            # 턴 종료 - 바뀐 부분(delta)만 로컬 게임 상태에 반영
             data = message["data"]
-            self.game_state = data["game_state"]
-            print(f"\n플레이어 {data['player'] + 1}: {data['category']} = {data['score']}점")
+            if data["player"] == self.player_id:
+                self.current_dice = []  # 기록을 마쳤으니 화면에서 주사위를 치움
+            self.notify(f"\n플레이어 {data['player'] + 1}: {data['category']} = {data['score']}점")
+            if not self.apply_turn_delta(data):
+                # 중간 버전을 놓침 - 전체 스냅샷을 요청하고 도착하면 화면 갱신
+                self.send_message({"type": "sync_request", "data": {}})
+                return False
+            self.show_game_status()
+            self.update_input_state()
+
+        elif message["type"] == "state_snapshot":
+            # 전체 게임 상태 스냅샷으로 로컬 상태 교체
+            self.game_state = message["data"]
             self.show_game_status()
             self.update_input_state()
 
+        elif message["type"] == "hint":
+            # 최적 수 안내 표시 후 현재 프롬프트 유지
+            data = message["data"]
+            if not data["available"]:
+                self.notify("\n힌트를 사용할 수 없습니다 (서버에 기대값 테이블 없음)")
+            elif data["action"] == "roll":
+                self.notify("\n힌트: 주사위를 굴리세요")
+            elif data["action"] == "reroll":
+                positions = ",".join(str(i + 1) for i in data["reroll"])
+                self.notify(f"\n힌트: {positions}번 주사위 다시 굴리기 (기대 점수 {data['expected']:.1f})")
+            else:
+                self.notify(f"\n힌트: {data['category']} 에 기록 (기대 점수 {data['expected']:.1f})")
+            if self.renderer is None:
+                print(">>> 입력: ", end='', flush=True)
+
+        elif message["type"] == "leaderboard":
+            # 순위표 상위 몇 명을 알림 한 줄로 표시
+            data = message["data"]
+            if not data["available"]:
+                self.notify("\n순위표를 사용할 수 없습니다 (서버에 결과 저장소 없음)")
+            elif not data["entries"]:
+                self.notify("\n순위표: 아직 기록된 게임이 없습니다")
+            else:
+                value = {"wins": lambda e: f"{e['wins']}승", "best": lambda e: f"{e['best']}점",
+                         "mean": lambda e: f"평균 {e['mean']:.1f}"}[data["by"]]
+                self.notify("\n순위표: " + "  ".join(f"{e['rank']}. {e['name']} {value(e)}" for e in data["entries"][:5]))
+
+        elif message["type"] == "player_stats":
+            # 누적 통계와 기준별 순위
+            data = message["data"]
+            if not data["available"]:
+                self.notify("\n통계를 사용할 수 없습니다 (서버에 결과 저장소 없음 또는 이름 없이 접속)")
+            elif not data["found"]:
+                self.notify(f"\n{data['name']}: 아직 기록된 게임이 없습니다")
+            else:
+                rank = data["rank"]
+                ranks = " / ".join(f"{label} {rank[by]}위" for by, label in (("wins", "승수"), ("best", "최고"), ("mean", "평균"))
+                                   if rank[by] is not None)
+                self.notify(f"\n{data['name']}: {data['games']}게임 {data['wins']}승 ({data['win_rate']:.0%}), "
+                            f"평균 {data['mean']:.1f}, 최고 {data['best']}, 보너스 {data['bonus_rate']:.0%} - {ranks}")
+
         elif message["type"] == "game_end":
             # 게임 종료 - 승자 및 최종 점수 표시
             data = message["data"]
-            print(f"\n=== 게임 종료 ===")
-            print(f"승자: 플레이어 {data['winner'] + 1}")
-            print(f"점수: {data['scores']}")
             self.input_state = "finished"
             self.waiting_for_input = False
+            if self.renderer is not None:
+                # 최종 점수표를 남겨 두고 그 아래에 결과 출력
+                self.prompt_text = ""
+                self.redraw()
+                self.renderer.close()
+            print(f"\n=== 게임 종료 ===")
+            print(f"승자: 플레이어 {data['winner'] + 1}" + (" (상대 기권)" if data.get("forfeit") is not None else ""))
+            print(f"점수: {data['scores']}")
+            return True
+        return False
+
+    def apply_turn_delta(self, data: dict) -> bool:
+        """turn_end 메시지의 변경분을 로컬 게임 상태에 적용.
+
+        Args:
+            data: turn_end 메시지의 data 딕셔너리
+
+        Returns:
+            적용 성공 시 True, 버전이 이어지지 않아 스냅샷이 필요하면 False
+        """
+        if not self.game_state or data["version"] != self.game_state["version"] + 1:
+            return False
+
+        player = self.game_state["players"][data["player"]]
+        player["scores"][data["category"]] = data["score"]
+        player["turn_data"] = {}
+        self.game_state["current_player"] = data["current_player"]
+        self.game_state["round"] = data["round"]
+        self.game_state["version"] = data["version"]
+        return True
 
     def update_input_state(self) -> None:
         """게임 상태에 따라 입력 상태 업데이트.
@@ -143,24 +239,46 @@ class YachtClient:
             # 본인 턴 - 주사위 굴리기 대기
             self.input_state = "roll"
             self.waiting_for_input = True
-            print("\n>>> 당신의 턴! 주사위를 굴리려면 'r' 입력: ", end='', flush=True)
+            self.prompt("\n>>> 당신의 턴! 주사위를 굴리려면 'r' 입력 (힌트 'h'): ")
         else:
             # 상대방 턴 - 대기 상태
             self.input_state = "waiting"
             self.waiting_for_input = False
-            print(f"\n>>> 플레이어 {current + 1}의 턴 대기중...")
+            self.prompt(f"\n>>> 플레이어 {current + 1}의 턴 대기중... (순위표 'l', 내 통계 's')\n")
+
+    def resume_input(self) -> None:
+        """처리되지 않은 요청 대신 현재 상태에 맞는 입력을 다시 받음.
+
+        이번 턴에 이미 굴렸으면 재굴리기 또는 점수 선택부터, 아니면 턴 상태에 따라 다시 시작.
+        """
+        if self.input_state == "finished":
+            return
+        if self.current_dice and self.game_state and self.game_state["current_player"] == self.player_id:
+            if self.rolls_left > 0:
+                self.input_state = "reroll"
+                self.show_reroll_prompt()
+            else:
+                self.input_state = "category"
+                self.show_category_prompt()
+            self.waiting_for_input = True
+        else:
+            self.update_input_state()
 
     def show_game_status(self) -> None:
         """현재 게임 상태 표시.
         
         현재 턴 플레이어와 각 플레이어의 점수를 출력.
+        화면 모드에서는 점수표 자리의 바뀐 칸만 다시 그림.
         """
+        if self.renderer is not None:
+            self.redraw()
+            return
         current = self.game_state["current_player"]
         print(f"\n현재 턴: 플레이어 {current + 1}")
 
         for i, player in enumerate(self.game_state["players"]):
             print(f"플레이어 {i + 1} 점수:")
-            total = sum(player["scores"].values())
+            total = total_score(player["scores"])  # 상단 보너스 포함
             print(f"  총점: {total}")
             # 기록된 카테고리별 점수 표시
             for cat, score in player["scores"].items():
@@ -171,27 +289,27 @@ class YachtClient:
         
         사용자가 다시 굴릴 주사위를 선택하거나 점수 선택으로 넘어갈 수 있음을 안내.
         """
-        print("\n>>> 다시 굴릴 주사위 선택 (예: 1,3,5) 또는 엔터로 점수 선택: ", end='', flush=True)
+        self.prompt("\n>>> 다시 굴릴 주사위 선택 (예: 1,3,5) 또는 엔터로 점수 선택: ")
 
     def show_category_prompt(self) -> None:
         """점수 카테고리 선택 프롬프트 표시.
         
         아직 선택하지 않은 카테고리 목록과 예상 점수를 표시.
+        화면 모드에서는 점수표에 번호와 예상 점수가 이미 있으므로 프롬프트만 바꿈.
         """
+        if self.renderer is not None:
+            self.prompt(">>> 선택 (숫자): ")
+            return
         print("\n점수 카테고리 선택:")
-        # 야추 게임의 13개 카테고리 정의
-        categories = [
-            "ones", "twos", "threes", "fours", "fives", "sixes",
-            "three_of_kind", "four_of_kind", "full_house",
-            "small_straight", "large_straight", "yacht", "chance"
-        ]
+        filled = self.game_state["players"][self.player_id]["scores"]
+        # 13개 카테고리 점수를 한 번에 조회
+        scores = score_all(self.current_dice)
 
         # 아직 선택하지 않은 카테고리만 표시
-        available = [c for c in categories if c not in self.game_state["players"][self.player_id]["scores"]]
+        available = [i for i, c in enumerate(CATEGORIES) if c not in filled]
 
-        for i, cat in enumerate(available):
-            score = self.preview_score(self.current_dice, cat)
-            print(f"{i + 1}. {cat}: {score}점")
+        for i, index in enumerate(available):
+            print(f"{i + 1}. {CATEGORIES[index]}: {scores[index]}점")
 
         print(">>> 선택 (숫자): ", end='', flush=True)
 
@@ -202,15 +320,35 @@ class YachtClient:
             user_input: 사용자가 입력한 문자열
         """
         user_input = user_input.strip()
+        if self.renderer is not None:
+            # 입력한 글자와 줄바꿈이 프롬프트 줄에 남아 있으므로 다음에 줄 전체를 다시 그림
+            self.renderer.touch(len(self.renderer.lines or ()) - 1)
+
+        if user_input.lower() in ('l', 's') and self.input_state != "finished":
+            # 순위표 / 내 통계 조회는 게임 진행과 관계없으므로 차례와 상관없이 가능
+            request = "leaderboard_request" if user_input.lower() == 'l' else "player_stats_request"
+            self.send_message({"type": request, "data": {}})
+            return
+
+        if not self.waiting_for_input:
+            # 상대 턴이거나 보낸 요청의 응답을 기다리는 중 - 입력 무시
+            if user_input and self.input_state != "finished":
+                self.notify(">>> 지금은 입력할 수 없습니다 (차례를 기다리는 중)")
+            return
+
+        if user_input.lower() == 'h' and self.input_state in ("roll", "reroll", "category"):
+            # 어느 입력 단계에서나 최적 수 안내 요청 가능
+            self.send_message({"type": "hint_request", "data": {}})
+            return
 
         if self.input_state == "roll":
             # 주사위 굴리기 상태
             if user_input.lower() == 'r':
-                self.send_message({"type": "roll_dice", "data": {}})
+                self.send_request({"type": "roll_dice", "data": {}})
                 self.waiting_for_input = False
-                print("주사위 굴리는 중...")
+                self.notify("주사위 굴리는 중...")
             else:
-                print(">>> 주사위를 굴리려면 'r'을 입력하세요: ", end='', flush=True)
+                self.prompt(">>> 주사위를 굴리려면 'r'을 입력하세요: ")
 
         elif self.input_state == "reroll":
             # 재굴리기 선택 상태
@@ -223,38 +361,35 @@ class YachtClient:
                     # 콤마로 구분된 주사위 인덱스 파싱 (1-based를 0-based로 변환)
                     indices = [int(x) - 1 for x in user_input.split(',')]
                     if all(0 <= i < 5 for i in indices):  # 유효한 인덱스 범위 체크 (0-4)
-                        self.send_message({"type": "roll_dice", "data": {"reroll": indices}})
+                        self.send_request({"type": "roll_dice", "data": {"reroll": indices}})
                         self.waiting_for_input = False
-                        print("선택된 주사위 다시 굴리는 중...")
+                        self.notify("선택된 주사위 다시 굴리는 중...")
                     else:
-                        print(">>> 1-5 범위의 숫자를 입력하세요: ", end='', flush=True)
+                        self.prompt(">>> 1-5 범위의 숫자를 입력하세요: ")
                 except:
-                    print(">>> 잘못된 형식입니다 (예: 1,3,5): ", end='', flush=True)
+                    self.prompt(">>> 잘못된 형식입니다 (예: 1,3,5): ")
 
         elif self.input_state == "category":
             # 카테고리 선택 상태
             try:
                 choice = int(user_input) - 1  # 1-based 입력을 0-based로 변환
-                categories = [
-                    "ones", "twos", "threes", "fours", "fives", "sixes",
-                    "three_of_kind", "four_of_kind", "full_house",
-                    "small_straight", "large_straight", "yacht", "chance"
-                ]
                 # 아직 선택하지 않은 카테고리만 필터링
-                available = [c for c in categories if c not in self.game_state["players"][self.player_id]["scores"]]
+                available = [c for c in CATEGORIES if c not in self.game_state["players"][self.player_id]["scores"]]
 
                 if 0 <= choice < len(available):
                     category = available[choice]
-                    self.send_message({"type": "select_category", "data": {"category": category}})
+                    self.send_request({"type": "select_category", "data": {"category": category}})
                     self.waiting_for_input = False
-                    print(f"{category} 선택됨")
+                    self.notify(f"{category} 선택됨")
                 else:
-                    print(f">>> 1-{len(available)} 범위의 숫자를 입력하세요: ", end='', flush=True)
+                    self.prompt(f">>> 1-{len(available)} 범위의 숫자를 입력하세요: ")
             except:
-                print(">>> 숫자를 입력하세요: ", end='', flush=True)
+                self.prompt(">>> 숫자를 입력하세요: ")
 
     def preview_score(self, dice: list, category: str) -> int:
         """특정 카테고리에서 현재 주사위로 얻을 수 있는 점수 미리보기.
+
+        서버와 같은 공용 점수표(yacht_scoring)에서 조회.
         
         Args:
             dice: 5개 주사위 값의 리스트
@@ -263,44 +398,37 @@ class YachtClient:
         Returns:
             해당 카테고리에서 얻을 수 있는 점수
         """
-        # 각 숫자(1-6)의 개수를 세기 위한 배열 (인덱스 0은 미사용)
-        counts = [0] * 7
-        for d in dice:
-            counts[d] += 1
-
-        # 숫자 카테고리 (1-6): 해당 숫자의 개수 × 숫자 값
-        if category in ["ones", "twos", "threes", "fours", "fives", "sixes"]:
-            num = ["", "ones", "twos", "threes", "fours", "fives", "sixes"].index(category)
-            return counts[num] * num
-        # 3 of a kind: 같은 숫자 3개 이상 시 모든 주사위 합
-        elif category == "three_of_kind":
-            return sum(dice) if max(counts) >= 3 else 0
-        # 4 of a kind: 같은 숫자 4개 이상 시 모든 주사위 합
-        elif category == "four_of_kind":
-            return sum(dice) if max(counts) >= 4 else 0
-        # Full house: 3개 + 2개 조합 시 25점 고정
-        elif category == "full_house":
-            return 25 if (3 in counts and 2 in counts) else 0
-        # Small straight: 연속된 4개 숫자 시 30점 고정
-        elif category == "small_straight":
-            straights = [[1, 2, 3, 4], [2, 3, 4, 5], [3, 4, 5, 6]]  # 가능한 연속 4개 조합
-            for straight in straights:
-                if all(counts[i] > 0 for i in straight):
-                    return 30
-            return 0
-        # Large straight: 연속된 5개 숫자 시 40점 고정
-        elif category == "large_straight":
-            # (1,2,3,4,5) 또는 (2,3,4,5,6) 패턴 체크
-            if (counts[1:6] == [1, 1, 1, 1, 1]) or (counts[2:7] == [1, 1, 1, 1, 1]):
-                return 40
-            return 0
-        # Yacht: 같은 숫자 5개 시 50점 고정
-        elif category == "yacht":
-            return 50 if max(counts) == 5 else 0
-        # Chance: 모든 주사위 합
-        elif category == "chance":
-            return sum(dice)
-        return 0
+        return score(dice, category)
+
+    def notify(self, text: str) -> None:
+        """알림 한 줄 표시.
+
+        Args:
+            text: 알림 문자열 (화면 모드에서는 앞뒤 줄바꿈을 빼고 알림 영역에 추가)
+        """
+        if self.renderer is None:
+            print(text)
+            return
+        self.messages.append(text.strip())
+        self.redraw()
+
+    def prompt(self, text: str) -> None:
+        """입력 프롬프트 표시.
+
+        Args:
+            text: 프롬프트 문자열 (화면 모드에서는 마지막 줄의 내용을 교체)
+        """
+        if self.renderer is None:
+            print(text, end='', flush=True)
+            return
+        self.prompt_text = text.strip().removeprefix(">>> ")
+        self.redraw()
+
+    def redraw(self) -> None:
+        """현재 상태로 화면을 만들어 이전 화면과 달라진 칸만 다시 그림 (화면 모드)."""
+        lines = build_screen(self.game_state, self.player_id, self.current_dice, self.rolls_left,
+                             self.input_state == "category", list(self.messages), self.prompt_text)
+        self.renderer.draw(lines, len(lines) - 1)
 
     def send_message(self, message: dict) -> None:
         """서버에 메시지 전송.
@@ -308,40 +436,37 @@ class YachtClient:
         Args:
             message: 전송할 메시지 딕셔너리
         """
-        try:
-            data = json.dumps(message).encode()
-            self.socket.send(data)
-        except Exception as e:
-            print(f"전송 오류: {e}")
+        self.session.send(message)
+
+    def send_request(self, message: dict) -> None:
+        """id를 붙여 서버에 요청 전송 (처리되면 ack, 거절되면 같은 id의 error가 옴).
+
+        Args:
+            message: 전송할 요청 메시지 딕셔너리
+        """
+        self.session.request(message)
 
     def start(self) -> None:
         """클라이언트 시작.
         
-        서버에 연결하고 메인 입력 루프를 실행.
-        사용자 입력을 받아 적절히 처리하고 게임이 끝날 때까지 실행.
+        서버에 연결하고 게임이 끝날 때까지 서버 메시지와 사용자 입력을 이벤트 방식으로 처리.
         """
-        if self.connect():
-            print("게임 시작 대기중...")
+        self.notify("게임 시작 대기중...")
+        try:
+            asyncio.run(self.session.run(stdin=True))
+        except KeyboardInterrupt:
+            self.close_screen()
+            print("\n게임 종료")
+        except (ConnectionError, OSError) as e:
+            self.close_screen()
+            print(f"\n접속 실패: {e}")
+        else:
+            self.close_screen()
 
-            try:
-                while True:
-                    if self.input_state == "finished":
-                        break
-
-                    # 입력 대기 상태일 때만 입력 받기
-                    if self.waiting_for_input:
-                        self.clear_input_buffer()
-                        user_input = input()
-                        self.process_input(user_input)
-                    else:
-                        # 대기 중일 때는 잠시 대기
-                        import time
-                        time.sleep(0.1)  # 100ms 대기
-
-            except KeyboardInterrupt:
-                print("\n게임 종료")
-            finally:
-                self.socket.close()
+    def close_screen(self) -> None:
+        """화면 모드를 끝내고 커서를 화면 아래로 옮김 (일반 출력으로 돌아가기 전에 호출)."""
+        if self.renderer is not None:
+            self.renderer.close()
     
     @staticmethod
     def render_ascii_art_dice(dices: list[int]) -> str:
@@ -353,69 +478,27 @@ class YachtClient:
         Returns:
             ASCII art로 표현된 주사위 문자열
         """
-        # 각 주사위 면의 ASCII 패턴 정의 (5줄 × 7문자)
-        patterns = {
-            1: [
-                "┌─────┐",
-                "│     │",
-                "│  ●  │", 
-                "│     │",
-                "└─────┘"
-            ],
-            2: [
-                "┌─────┐",
-                "│ ●   │",
-                "│     │",
-                "│   ● │", 
-                "└─────┘"
-            ],
-            3: [
-                "┌─────┐",
-                "│ ●   │",
-                "│  ●  │",
-                "│   ● │",
-                "└─────┘"
-            ],
-            4: [
-                "┌─────┐",
-                "│ ● ● │",
-                "│     │",
-                "│ ● ● │",
-                "└─────┘"
-            ],
-            5: [
-                "┌─────┐",
-                "│ ● ● │", 
-                "│  ●  │",
-                "│ ● ● │",
-                "└─────┘"
-            ],
-            6: [
-                "┌─────┐",
-                "│ ● ● │",
-                "│ ● ● │", 
-                "│ ● ● │",
-                "└─────┘"
-            ]
-        }
-        
-        if not dices:
-            return ""
-        
-        # 각 주사위의 패턴 가져오기
-        dice_patterns = [patterns[dice] for dice in dices]
-        
-        # 5줄로 구성된 결과 생성
-        result_lines = []
-        for line_idx in range(5):
-            line_parts = []
-            for pattern in dice_patterns:
-                line_parts.append(pattern[line_idx])
-            # 주사위 사이에 공백 하나 추가
-            result_lines.append(" ".join(line_parts))
-        
-        return "\n".join(result_lines)
+        # 면 패턴과 조합별 줄은 yacht_render에 한 번만 만들어 캐시됨
+        return "\n".join(dice_rows(tuple(dices)))
 
 if __name__ == "__main__":
-    client = YachtClient()
+    parser = argparse.ArgumentParser(description="야추 게임 클라이언트")
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=8888)
+    parser.add_argument("--connect", metavar="ADDRESS", help="접속할 주소 (예: unix:/tmp/yacht.sock, 지정하면 --host, --port 무시)")
+    parser.add_argument("--binary", action="store_true", help="바이너리 인코딩 사용 (기본은 디버깅하기 쉬운 JSON)")
+    parser.add_argument("--name", help="게임에 표시할 이름")
+    parser.add_argument("--mode", help="매칭할 게임 모드")
+    parser.add_argument("--rating", type=int, help="매칭에 사용할 레이팅")
+    screen = parser.add_mutually_exclusive_group()
+    screen.add_argument("--screen", action="store_true", default=None,
+                        help="고정 배치 화면에서 바뀐 칸만 다시 그림 (터미널이면 기본)")
+    screen.add_argument("--plain", dest="screen", action="store_false", help="줄 단위로 이어서 출력")
+    args = parser.parse_args()
+
+    join = {key: value for key, value in (("name", args.name), ("mode", args.mode), ("rating", args.rating))
+            if value is not None}
+    screen = sys.stdout.isatty() if args.screen is None else args.screen
+    client = YachtClient(binary=args.binary, join=join or None, host=args.host, port=args.port, screen=screen,
+                         endpoint=Endpoint.parse(args.connect) if args.connect else None)
     client.start()
\ No newline at end of file
@@ -0,0 +1,145 @@
+from yacht_rng import DiceRNG, derive_seed
+from yacht_scoring import CATEGORY_INDEX, score
+from yacht_state import GameState
+
+FIRST_ROLL_MASK = 0x1F  # 첫 굴림은 주사위 5개를 모두 굴린 것으로 봄 (게임 기록도 같은 값 사용)
+
+
+class YachtEngine:
+    """입출력이 없는 야추 규칙 상태 기계.
+
+    요청이 규칙에 맞는지 확인하고 게임 상태와 주사위만 바꾸며,
+    메시지 전송, 기록, 로그는 호출한 쪽(서버 방, 토너먼트)이 반환값을 보고 처리.
+    소켓 없이도 게임 한 판을 끝까지 진행할 수 있으므로 봇 대전과 테스트에 그대로 사용.
+    """
+
+    __slots__ = ("state", "rng")
+
+    def __init__(self, state: GameState | None = None, rng: DiceRNG | None = None):
+        """엔진 초기화.
+
+        Args:
+            state: 진행할 게임 상태 (None이면 새 게임)
+            rng: 주사위 생성기 (None이면 새 시드로 생성)
+        """
+        self.state = state or GameState()
+        self.rng = rng or DiceRNG(derive_seed(None, 0))
+
+    def roll_error(self, player_id: int) -> str | None:
+        """주사위 굴리기 요청을 받아들일 수 없는 이유.
+
+        Args:
+            player_id: 요청한 플레이어 ID
+
+        Returns:
+            거절 코드 (game_over, not_your_turn, no_rolls_left), 받아들일 수 있으면 None
+        """
+        state = self.state
+        if state.game_over:
+            return "game_over"
+        if player_id != state.current_player:
+            return "not_your_turn"
+        if state.dice is not None and state.rolls_left <= 0:
+            return "no_rolls_left"
+        return None
+
+    def select_error(self, player_id: int, category: str) -> str | None:
+        """카테고리 선택 요청을 받아들일 수 없는 이유.
+
+        Args:
+            player_id: 요청한 플레이어 ID
+            category: 카테고리명
+
+        Returns:
+            거절 코드 (game_over, not_your_turn, not_rolled, unknown_category, category_filled),
+            받아들일 수 있으면 None
+        """
+        state = self.state
+        if state.game_over:
+            return "game_over"
+        if player_id != state.current_player:
+            return "not_your_turn"
+        if state.dice is None:
+            return "not_rolled"
+        index = CATEGORY_INDEX.get(category)
+        if index is None:
+            return "unknown_category"
+        if state.players[player_id].has(index):
+            return "category_filled"
+        return None
+
+    def roll(self, player_id: int, reroll: list[int] | None = None) -> int | None:
+        """주사위 굴리기.
+
+        아직 굴리지 않았으면 5개를 모두 굴리고, 굴렸으면 reroll 위치만 다시 굴림.
+
+        Args:
+            player_id: 요청한 플레이어 ID
+            reroll: 다시 굴릴 주사위 위치 (0-4, 범위 밖은 무시)
+
+        Returns:
+            굴린 주사위 비트마스크 (첫 굴림은 FIRST_ROLL_MASK),
+            받아들일 수 없는 요청이면 None (이유는 roll_error)
+        """
+        if self.roll_error(player_id) is not None:
+            return None
+        state = self.state
+        if state.dice is None:
+            state.roll(self.rng.roll(5))
+            return FIRST_ROLL_MASK
+
+        mask = 0
+        for i in reroll or ():
+            if 0 <= i < 5:  # 유효한 인덱스 범위 체크 (0-4)
+                mask |= 1 << i
+        # 선택된 주사위만 위치 순서대로 새 값으로 교체 (중복 인덱스는 한 번만)
+        dice = state.dice.copy()
+        positions = [i for i in range(5) if mask >> i & 1]
+        for i, value in zip(positions, self.rng.roll(len(positions))):
+            dice[i] = value
+        state.roll(dice)
+        return mask
+
+    def select(self, player_id: int, category: str) -> int | None:
+        """현재 주사위로 카테고리에 점수를 기록하고 턴 종료.
+
+        Args:
+            player_id: 요청한 플레이어 ID
+            category: 카테고리명
+
+        Returns:
+            기록한 점수, 받아들일 수 없는 요청이면 None (이유는 select_error)
+        """
+        if self.select_error(player_id, category) is not None:
+            return None
+        state = self.state
+        value = score(state.dice, category)
+        state.select(CATEGORY_INDEX[category], value)
+        return value
+
+    @property
+    def finished(self) -> bool:
+        """두 플레이어가 점수표를 모두 채웠는지 여부."""
+        return self.state.finished
+
+    def result(self) -> tuple[int, list[int]]:
+        """게임 종료 처리 후 결과.
+
+        Returns:
+            (승자 플레이어 ID - 동점이면 플레이어 2, 상단 보너스를 포함한 플레이어별 총점)
+        """
+        self.state.game_over = True
+        scores = [player.final_score() for player in self.state.players]
+        return (0 if scores[0] > scores[1] else 1), scores
+
+    def forfeit(self, player_id: int) -> tuple[int, list[int]]:
+        """한 플레이어의 기권으로 게임 종료.
+
+        Args:
+            player_id: 기권한 플레이어 ID
+
+        Returns:
+            (승자 플레이어 ID - 기권하지 않은 쪽, 그때까지의 플레이어별 총점)
+        """
+        _, scores = self.result()
+        return 1 - player_id, scores
@@ -0,0 +1,304 @@
+import argparse
+import json
+import os
+import struct
+import threading
+import time
+
+from yacht_engine import FIRST_ROLL_MASK
+from yacht_protocol import pack_dice, unpack_dice
+from yacht_state import GameState
+
+LOG_FILE = "journal.log"
+SNAPSHOT_FILE = "snapshot.json"
+
+# 이벤트 레코드: 종류, 방 번호, 플레이어, 인자(재굴리기 마스크 / 카테고리 인덱스), 값(압축한 주사위 / 점수)
+# 게임 시작·재시드 레코드는 플레이어·인자·값 자리에 32비트 주사위 시드를 나눠 담음
+RECORD = struct.Struct("!BIBBH")
+GAME_START = 1
+ROLL = 2
+SELECT = 3
+ROOM_END = 4
+RESEED = 5  # 복구한 방이 새 주사위 생성기로 이어서 굴림 (게임 상태는 그대로)
+
+
+def pack_seed(seed: int) -> tuple[int, int, int]:
+    """32비트 시드를 게임 시작 레코드의 (플레이어, 인자, 값) 필드로 분할."""
+    return seed >> 24 & 0xFF, seed >> 16 & 0xFF, seed & 0xFFFF
+
+
+def unpack_seed(player: int, arg: int, value: int) -> int:
+    """게임 시작 레코드 필드에서 시드 복원 (0이면 암호학적 난수 또는 시드 기록 이전의 기록)."""
+    return player << 24 | arg << 16 | value
+
+
+def apply_records(data: bytes, games: dict[int, GameState], finished: dict[int, GameState] | None = None,
+                  seeds: dict[int, int] | None = None) -> int:
+    """이벤트 레코드를 순서대로 게임 상태에 반영.
+
+    주사위와 점수가 기록되어 있으므로 난수나 점수 계산 없이 상태 전이만 수행.
+
+    Args:
+        data: RECORD 크기의 배수 길이인 레코드 바이트
+        games: 방 번호 → 진행 중인 게임 상태 (제자리에서 갱신)
+        finished: 방이 정리된 게임을 모을 딕셔너리 (None이면 버림)
+        seeds: 방 번호 → 마지막 주사위 시드를 모을 딕셔너리 (None이면 버림, 0이면 암호학적 난수)
+
+    Returns:
+        반영한 레코드 수
+    """
+    count = 0
+    for kind, room_id, player, arg, value in RECORD.iter_unpack(data):
+        count += 1
+        if kind == GAME_START:
+            games[room_id] = GameState()
+            if seeds is not None:
+                seeds[room_id] = unpack_seed(player, arg, value)
+            continue
+        state = games.get(room_id)
+        if state is None:
+            continue  # 스냅샷 이전에 정리된 방
+        if kind == RESEED:
+            if seeds is not None:
+                seeds[room_id] = unpack_seed(player, arg, value)
+        elif kind == ROLL:
+            state.roll(unpack_dice(value))
+        elif kind == SELECT:
+            state.select(arg, value)
+            state.game_over = state.finished
+        elif kind == ROOM_END:
+            del games[room_id]
+            if finished is not None:
+                finished[room_id] = state
+    return count
+
+
+class Journal:
+    """추가 전용 게임 이벤트 기록 클래스.
+
+    레코드는 메모리 버퍼에 쌓기만 하고, 전용 스레드가 버퍼를 통째로 가져가
+    한 번의 write + fsync로 디스크에 반영 (그룹 커밋).
+    fsync가 진행되는 동안 들어온 레코드는 다음 묶음으로 함께 기록되므로
+    턴 처리는 디스크 지연을 기다리지 않음.
+    """
+
+    def __init__(self, directory: str, commit_delay: float = 0.005):
+        """기록 파일을 열고 쓰기 스레드 시작.
+
+        Args:
+            directory: 기록 파일과 스냅샷을 둘 디렉터리
+            commit_delay: 첫 레코드가 들어온 뒤 묶음을 모으며 기다릴 시간(초)
+        """
+        self.commit_delay = commit_delay
+        os.makedirs(directory, exist_ok=True)
+        self.log_path = os.path.join(directory, LOG_FILE)
+        self.snapshot_path = os.path.join(directory, SNAPSHOT_FILE)
+        self._file = open(self.log_path, "ab")
+        # 비정상 종료로 잘린 마지막 레코드는 버림 (이후 레코드 경계가 어긋나지 않도록)
+        size = self._file.tell()
+        if size % RECORD.size:
+            self._file.truncate(size - size % RECORD.size)
+        self.position = self._file.seek(0, os.SEEK_END)  # 버퍼를 포함한 논리적 기록 위치
+        self._buffer = bytearray()
+        self._snapshot = None  # 쓰기 스레드가 저장할 스냅샷
+        self._closed = False
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="yacht-journal", daemon=True)
+        self._thread.start()
+
+    def append(self, kind: int, room_id: int, player: int = 0, arg: int = 0, value: int = 0) -> None:
+        """레코드 하나를 버퍼에 추가.
+
+        Args:
+            kind: 레코드 종류
+            room_id: 방 번호
+            player: 플레이어 ID
+            arg: 재굴리기 마스크 또는 카테고리 인덱스
+            value: 압축한 주사위 또는 점수
+        """
+        with self._cond:
+            if not self._buffer:
+                self._cond.notify()  # 쓰기 스레드는 버퍼가 비어 있을 때만 대기 중
+            self._buffer += RECORD.pack(kind, room_id, player, arg, value)
+            self.position += RECORD.size
+
+    def record_start(self, room_id: int, seed: int = 0) -> None:
+        """게임 시작 기록.
+
+        Args:
+            room_id: 방 번호
+            seed: 방의 32비트 주사위 시드 (0이면 재현할 수 없는 난수원)
+        """
+        self.append(GAME_START, room_id, *pack_seed(seed))
+
+    def record_reseed(self, room_id: int, seed: int = 0) -> None:
+        """복구한 방의 새 주사위 시드 기록 (GAME_START와 달리 게임 상태를 초기화하지 않음).
+
+        Args:
+            room_id: 방 번호
+            seed: 이어서 굴릴 32비트 주사위 시드 (0이면 암호학적 난수)
+        """
+        self.append(RESEED, room_id, *pack_seed(seed))
+
+    def record_roll(self, room_id: int, player: int, mask: int, dice: list[int]) -> None:
+        """굴림 기록.
+
+        Args:
+            room_id: 방 번호
+            player: 굴린 플레이어 ID
+            mask: 다시 굴린 주사위 비트마스크 (첫 굴림은 FIRST_ROLL_MASK)
+            dice: 굴린 뒤의 주사위 5개
+        """
+        self.append(ROLL, room_id, player, mask, pack_dice(dice))
+
+    def record_select(self, room_id: int, player: int, index: int, score: int) -> None:
+        """카테고리 선택 기록.
+
+        Args:
+            room_id: 방 번호
+            player: 선택한 플레이어 ID
+            index: 카테고리 인덱스
+            score: 기록된 점수
+        """
+        self.append(SELECT, room_id, player, index, score)
+
+    def record_end(self, room_id: int) -> None:
+        """방 정리 기록 (게임 종료 또는 모든 플레이어 이탈)."""
+        self.append(ROOM_END, room_id)
+
+    def snapshot(self, games: dict[int, GameState], next_room_id: int, seeds: dict[int, int] | None = None) -> None:
+        """진행 중인 게임 상태의 스냅샷 저장 요청.
+
+        스냅샷에는 현재 기록 위치를 함께 남기고, 쓰기 스레드가 그 위치까지의
+        레코드를 먼저 디스크에 반영한 뒤 스냅샷 파일을 교체.
+
+        Args:
+            games: 방 번호 → 게임 상태
+            next_room_id: 다음에 만들 방 번호 (재시작 후 번호가 겹치지 않도록)
+            seeds: 방 번호 → 주사위 시드 (복구 후에도 암호학적 난수 방을 그대로 유지하도록)
+        """
+        rooms = {str(room_id): state.to_dict() for room_id, state in games.items()}
+        with self._cond:
+            self._snapshot = {"offset": self.position, "next_room_id": next_room_id, "rooms": rooms,
+                              "seeds": {str(room_id): seed for room_id, seed in (seeds or {}).items()}}
+            self._cond.notify()
+
+    def close(self) -> None:
+        """남은 레코드를 모두 기록하고 쓰기 스레드 종료."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._thread.join()
+        self._file.close()
+
+    def _run(self) -> None:
+        """쓰기 스레드 - 쌓인 레코드를 묶어서 기록하고 fsync."""
+        while True:
+            with self._cond:
+                while not self._buffer and self._snapshot is None and not self._closed:
+                    self._cond.wait()
+                if not self._closed and self.commit_delay:
+                    # 잠시 더 모아서 한 번에 기록 (fsync 횟수와 스레드 전환 감소)
+                    self._cond.wait(self.commit_delay)
+                data, self._buffer = self._buffer, bytearray()
+                snapshot, self._snapshot = self._snapshot, None
+                closed = self._closed
+
+            if data:
+                self._file.write(data)
+                self._file.flush()
+                os.fsync(self._file.fileno())
+            if snapshot is not None:
+                # 임시 파일에 쓴 뒤 교체해 항상 완전한 스냅샷만 남김
+                temp_path = self.snapshot_path + ".tmp"
+                with open(temp_path, "w") as f:
+                    json.dump(snapshot, f, separators=(",", ":"))
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_path, self.snapshot_path)
+            if closed and not data and snapshot is None:
+                return
+
+
+def recover(directory: str, seeds: dict[int, int] | None = None) -> tuple[dict[int, GameState], int]:
+    """마지막 스냅샷과 그 이후의 기록으로 진행 중이던 게임 복구.
+
+    Args:
+        directory: Journal이 사용한 디렉터리
+        seeds: 방 번호 → 마지막 주사위 시드를 모을 딕셔너리 (None이면 버림, 0이면 암호학적 난수)
+
+    Returns:
+        (방 번호 → 진행 중인 게임 상태, 다음에 만들 방 번호)
+    """
+    games = {}
+    offset = 0
+    next_room_id = 1
+    snapshot_path = os.path.join(directory, SNAPSHOT_FILE)
+    if os.path.exists(snapshot_path):
+        with open(snapshot_path) as f:
+            snapshot = json.load(f)
+        offset = snapshot["offset"]
+        next_room_id = snapshot["next_room_id"]
+        games = {int(room_id): GameState.from_dict(data) for room_id, data in snapshot["rooms"].items()}
+        if seeds is not None:
+            # 시드를 남기기 전의 스냅샷에는 없음 (그 방은 기본 생성기로 복구)
+            seeds.update({int(room_id): seed for room_id, seed in snapshot.get("seeds", {}).items()})
+
+    log_path = os.path.join(directory, LOG_FILE)
+    if os.path.exists(log_path):
+        with open(log_path, "rb") as f:
+            f.seek(offset)
+            tail = f.read()
+        tail = tail[:len(tail) - len(tail) % RECORD.size]
+        apply_records(tail, games, seeds=seeds)
+        # 스냅샷 이후에 시작된 방 번호와도 겹치지 않도록
+        for kind, room_id, *_ in RECORD.iter_unpack(tail):
+            if kind == GAME_START:
+                next_room_id = max(next_room_id, room_id + 1)
+
+    # 점수표를 다 채웠지만 방 정리 전에 중단된 게임은 제외
+    games = {room_id: state for room_id, state in games.items() if not state.finished}
+    return games, next_room_id
+
+
+def replay(directory: str, seeds: dict[int, int] | None = None) -> tuple[dict[int, GameState], dict[int, GameState], int]:
+    """기록 전체를 처음부터 일괄 재생해 모든 게임 재구성.
+
+    Args:
+        directory: Journal이 사용한 디렉터리
+        seeds: 방 번호 → 주사위 시드를 모을 딕셔너리 (None이면 버림)
+
+    Returns:
+        (방 번호 → 정리된 게임 상태, 방 번호 → 아직 진행 중인 게임 상태, 레코드 수)
+    """
+    with open(os.path.join(directory, LOG_FILE), "rb") as f:
+        data = f.read()
+    data = data[:len(data) - len(data) % RECORD.size]
+    games, finished = {}, {}
+    count = apply_records(data, games, finished, seeds)
+    return finished, games, count
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="야추 게임 기록 재생")
+    parser.add_argument("directory", help="서버의 --journal 디렉터리")
+    parser.add_argument("--room", type=int, help="지정한 방의 최종 상태를 JSON으로 출력")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    seeds = {}
+    finished, active, count = replay(args.directory, seeds)
+    elapsed = time.perf_counter() - started
+
+    if args.room is not None:
+        state = finished.get(args.room) or active.get(args.room)
+        if state is None:
+            parser.exit(1, f"방 {args.room} 기록 없음\n")
+        print(json.dumps({**state.to_dict(), "seed": seeds.get(args.room) or None}, indent=2))
+    else:
+        completed = [state for state in finished.values() if state.finished]
+        print(f"레코드: {count} ({count / elapsed:,.0f} records/s, {elapsed:.3f}초)")
+        print(f"게임: 완료 {len(completed)}, 중단 {len(finished) - len(completed)}, 진행 중 {len(active)}")
+        if completed:
+            totals = [player.final_score() for state in completed for player in state.players]
+            print(f"평균 점수: {sum(totals) / len(totals):.1f}, 최고 점수: {max(totals)}")
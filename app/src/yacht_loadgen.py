@@ -0,0 +1,359 @@
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import random
+import time
+from collections import Counter
+
+from yacht_protocol import FrameDecoder, encode_message
+from yacht_scoring import CATEGORIES, CATEGORY_INDEX, score_all
+from yacht_session import GameSession
+from yacht_transport import Endpoint
+
+
+class LoadStats:
+    """부하 테스트 결과 집계 클래스.
+
+    메시지 종류별 왕복 지연 시간과 처리한 턴·게임 수를 모음.
+    """
+
+    def __init__(self):
+        """집계 변수 초기화."""
+        self.latencies: dict[str, list[float]] = {}  # 요청 메시지 종류 → 왕복 시간(초) 목록
+        self.turns = 0  # 점수 기록까지 끝난 턴 수
+        self.games = 0  # 끝까지 진행된 게임 수
+        self.errors = 0  # 연결 오류로 중단된 봇 게임 수
+        self.rejected = 0  # 서버가 수용 한도 초과로 거절한 연결 수
+        self.request_errors = 0  # 서버가 error로 거절한 요청 수
+        self.spectator_messages = 0  # 관전자들이 받은 메시지 수
+
+    def record(self, message_type: str, seconds: float) -> None:
+        """요청 하나의 왕복 시간 기록.
+
+        Args:
+            message_type: 보낸 요청 메시지 종류
+            seconds: 요청 전송부터 응답 수신까지 걸린 시간
+        """
+        self.latencies.setdefault(message_type, []).append(seconds)
+
+    def report(self, elapsed: float) -> dict:
+        """처리량과 지연 시간 백분위수 요약.
+
+        Args:
+            elapsed: 전체 실행 시간(초)
+
+        Returns:
+            처리량과 메시지 종류별 p50/p95/p99(ms)를 담은 딕셔너리
+        """
+        latency = {}
+        for message_type, values in sorted(self.latencies.items()):
+            values = sorted(values)
+            latency[message_type] = {
+                "count": len(values),
+                **{f"p{p}": round(percentile(values, p) * 1000, 3) for p in (50, 95, 99)}
+            }
+        return {
+            "elapsed": round(elapsed, 3),
+            "turns": self.turns,
+            "games": self.games,
+            "errors": self.errors,
+            "rejected": self.rejected,
+            "request_errors": self.request_errors,
+            "spectator_messages": self.spectator_messages,
+            "turns_per_sec": round(self.turns / elapsed, 1) if elapsed else 0.0,
+            "games_per_sec": round(self.games / elapsed, 2) if elapsed else 0.0,
+            "latency_ms": latency
+        }
+
+
+def percentile(sorted_values: list[float], p: float) -> float:
+    """정렬된 값 목록의 백분위수 (최근접 순위 방식).
+
+    Args:
+        sorted_values: 오름차순으로 정렬된 값 목록
+        p: 0-100 범위의 백분위
+
+    Returns:
+        해당 백분위 값 (목록이 비어 있으면 0)
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, int(round(p / 100 * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[rank]
+
+
+class BotPlayer:
+    """자동으로 게임을 진행하는 헤드리스 클라이언트 클래스.
+
+    기존 roll_dice / select_category 프로토콜에 요청 id를 붙여 보내고 ack까지의 왕복 시간을 측정.
+    기본은 가장 많이 나온 눈을 남기고 재굴린 뒤 점수가 가장 높은 빈 카테고리를 선택하고,
+    pipeline 모드에서는 주사위를 보지 않고 한 턴의 요청(굴리기, 재굴리기, 점수 선택)을 한꺼번에 보냄.
+    요청이 거절되면 전체 상태를 다시 받아 이어서 진행.
+    연결 처리는 대화형 클라이언트와 같은 GameSession 코어를 사용.
+    """
+
+    def __init__(self, stats: LoadStats, rerolls: int = 2, binary: bool = False, rating: int | None = None,
+                 pipeline: bool = False, name: str = "bot"):
+        """봇 초기화.
+
+        Args:
+            stats: 결과를 기록할 LoadStats
+            rerolls: 한 턴에 사용할 최대 재굴리기 횟수 (0-2)
+            binary: 바이너리 인코딩 협상 여부
+            rating: 매칭 요청에 보낼 레이팅 (None이면 서버 기본값)
+            pipeline: 응답을 기다리지 않고 한 턴의 요청을 한꺼번에 보낼지 여부
+            name: 매칭 요청에 보낼 이름 (순위표 통계가 이름별로 쌓이므로 봇마다 달라야 함)
+        """
+        self.stats = stats
+        self.name = name
+        self.rating = rating
+        self.rerolls = rerolls
+        self.request_binary = binary
+        self.pipeline = pipeline
+        self.player_id = None
+        self.filled = set()  # 본인이 기록한 카테고리
+        self.sent: dict[int, tuple[str, float]] = {}  # 응답을 기다리는 요청 id → (요청 종류, 보낸 시각)
+        self.session: GameSession | None = None
+        self.connected_at = 0.0  # 접속 시각 (매칭 대기 시간 측정용)
+
+    def send(self, message_type: str, data: dict) -> None:
+        """요청에 id를 붙여 보내고 왕복 시간 측정 시작.
+
+        Args:
+            message_type: 메시지 종류
+            data: 메시지 데이터
+        """
+        request_id = self.session.request({"type": message_type, "data": data})
+        self.sent[request_id] = (message_type, time.perf_counter())
+
+    def complete(self, request_id) -> None:
+        """요청의 응답(ack)을 받았을 때 왕복 시간 기록.
+
+        Args:
+            request_id: 응답에 담긴 요청 id
+        """
+        sent = self.sent.pop(request_id, None)
+        if sent is not None:
+            message_type, sent_at = sent
+            self.stats.record(message_type, time.perf_counter() - sent_at)
+
+    def start_turn(self) -> None:
+        """본인 턴 시작 - 굴리기 요청 (pipeline 모드면 턴 전체의 요청을 이어서 보냄)."""
+        self.send("roll_dice", {})
+        if not self.pipeline:
+            return
+        for _ in range(self.rerolls):
+            self.send("roll_dice", {"reroll": random.sample(range(5), random.randint(1, 5))})
+        self.send("select_category", {"category": next(c for c in CATEGORIES if c not in self.filled)})
+
+    def choose(self, dice: list[int], rolls_left: int) -> None:
+        """주사위 결과를 보고 재굴리기 또는 카테고리 선택 요청 전송.
+
+        Args:
+            dice: 현재 주사위 값
+            rolls_left: 남은 굴리기 횟수
+        """
+        if rolls_left > 0 and 2 - rolls_left < self.rerolls:
+            # 가장 많이 나온 눈만 남기고 나머지를 재굴림
+            target, count = Counter(dice).most_common(1)[0]
+            if count < 5:
+                reroll = [i for i, d in enumerate(dice) if d != target]
+                self.send("roll_dice", {"reroll": reroll})
+                return
+
+        scores = score_all(dice)
+        category = max((c for c in CATEGORIES if c not in self.filled), key=lambda c: scores[CATEGORY_INDEX[c]])
+        self.send("select_category", {"category": category})
+
+    def handle_message(self, message: dict) -> bool:
+        """서버 메시지 처리.
+
+        Args:
+            message: 서버에서 받은 메시지 딕셔너리
+
+        Returns:
+            게임이 끝났으면 True
+        """
+        data = message["data"]
+        if message["type"] == "player_id":
+            self.player_id = data["id"]
+
+        elif message["type"] == "game_start":
+            self.stats.record("match", time.perf_counter() - self.connected_at)
+            if data["current_player"] == self.player_id:
+                self.start_turn()
+
+        elif message["type"] == "dice_result":
+            if data["player"] == self.player_id and not self.pipeline:
+                self.choose(data["dice"], data["rolls_left"])
+
+        elif message["type"] == "turn_end":
+            if data["player"] == self.player_id:
+                self.filled.add(data["category"])
+                self.stats.turns += 1
+            if data["current_player"] == self.player_id:
+                self.start_turn()
+
+        elif message["type"] == "ack":
+            self.complete(message["id"])
+
+        elif message["type"] == "error":
+            # 거절된 요청 - 뒤이어 보낸 요청도 어긋났을 수 있으므로 전체 상태를 받아 다시 이어감
+            self.stats.request_errors += 1
+            self.sent.pop(message.get("id"), None)
+            if not self.sent:
+                self.session.send({"type": "sync_request", "data": {}})
+
+        elif message["type"] == "state_snapshot":
+            if data["current_player"] == self.player_id and not data["game_over"]:
+                self.filled = set(data["players"][self.player_id]["scores"])
+                turn = data["players"][self.player_id]["turn_data"]
+                if turn:
+                    self.choose(turn["dice"], turn["rolls_left"])
+                else:
+                    self.start_turn()
+
+        elif message["type"] == "server_busy":
+            self.stats.rejected += 1
+            return True
+
+        elif message["type"] == "game_end":
+            for request_id, (message_type, _) in list(self.sent.items()):
+                if message_type == "select_category":
+                    # 마지막 턴의 점수 기록 - ack는 game_end 뒤에 오므로 여기서 집계
+                    self.complete(request_id)
+                    self.stats.turns += 1
+            if self.player_id == 0:
+                self.stats.games += 1  # 게임당 한 번만 집계
+            return True
+        return False
+
+    async def play(self, endpoint: Endpoint) -> None:
+        """서버에 접속해 게임 하나를 끝까지 진행.
+
+        Args:
+            endpoint: 서버 주소
+        """
+        join = {"name": self.name} if self.rating is None else {"name": self.name, "rating": self.rating}
+        # 봇은 재접속하지 않고 오류로 집계
+        self.session = GameSession(self, binary=self.request_binary, join=join, reconnect_attempts=0,
+                                   endpoint=endpoint)
+        self.connected_at = time.perf_counter()
+        await self.session.run()
+
+
+async def spectate(endpoint: Endpoint, stats: LoadStats, duration: float) -> None:
+    """관전자로 접속해 정해진 시간 동안 메시지를 받기만 함.
+
+    Args:
+        endpoint: 서버 주소
+        stats: 받은 메시지 수를 기록할 LoadStats
+        duration: 관전할 최대 시간(초)
+    """
+    reader, writer = await endpoint.open()
+    writer.write(encode_message({"type": "spectate", "data": {}}))
+    decoder = FrameDecoder()
+    deadline = time.perf_counter() + duration
+    try:
+        while (remaining := deadline - time.perf_counter()) > 0:
+            data = await asyncio.wait_for(reader.read(65536), remaining)
+            if not data:
+                break
+            stats.spectator_messages += len(decoder.feed(data))
+    except (asyncio.TimeoutError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+async def run_load(endpoint: Endpoint, connections: int, games: int, rerolls: int,
+                   binary: bool = False, spectators: int = 0, rating_spread: int = 0, pipeline: bool = False) -> dict:
+    """여러 봇을 동시에 실행해 부하 테스트 진행.
+
+    Args:
+        endpoint: 서버 주소 (같은 호스트라면 유닉스 소켓으로 TCP 비용 없이 측정 가능)
+        connections: 동시 연결 수 (두 연결이 한 게임)
+        games: 연결마다 연속으로 진행할 게임 수
+        rerolls: 턴당 최대 재굴리기 횟수
+        binary: 바이너리 인코딩 사용 여부
+        spectators: 게임이 시작된 뒤 접속시킬 관전자 수
+        rating_spread: 봇 레이팅의 표준편차 (0이면 레이팅 없이 매칭)
+        pipeline: 봇이 응답을 기다리지 않고 한 턴의 요청을 한꺼번에 보낼지 여부
+
+    Returns:
+        LoadStats.report 결과
+    """
+    stats = LoadStats()
+    names = itertools.count(1)  # 게임마다 봇 이름이 겹치지 않도록 (프로세스 ID를 붙여 여러 부하 테스트도 구분)
+
+    async def bot_loop() -> None:
+        for _ in range(games):
+            try:
+                rating = round(random.gauss(1500, rating_spread)) if rating_spread else None
+                name = f"bot-{os.getpid()}-{next(names)}"
+                await BotPlayer(stats, rerolls, binary, rating, pipeline, name).play(endpoint)
+            except (ConnectionError, OSError):
+                stats.errors += 1
+
+    async def spectator_loop() -> None:
+        await asyncio.sleep(0.2)  # 방이 만들어진 뒤 접속
+        try:
+            await spectate(endpoint, stats, duration=3600)  # 봇이 모두 끝나면 취소
+        except OSError:
+            stats.errors += 1
+
+    started = time.perf_counter()
+    bots = asyncio.gather(*(bot_loop() for _ in range(connections)))
+    watchers = [asyncio.create_task(spectator_loop()) for _ in range(spectators)]
+    await bots
+    for task in watchers:
+        task.cancel()
+    return stats.report(time.perf_counter() - started)
+
+
+def print_report(report: dict) -> None:
+    """부하 테스트 결과를 사람이 읽기 좋은 형태로 출력.
+
+    Args:
+        report: LoadStats.report 결과
+    """
+    print(f"실행 시간: {report['elapsed']}초")
+    print(f"게임: {report['games']} ({report['games_per_sec']} games/s)")
+    print(f"턴: {report['turns']} ({report['turns_per_sec']} turns/s)")
+    print(f"오류: {report['errors']}")
+    if report["rejected"]:
+        print(f"거절된 연결: {report['rejected']}")
+    if report["request_errors"]:
+        print(f"거절된 요청: {report['request_errors']}")
+    if report["spectator_messages"]:
+        print(f"관전자 수신 메시지: {report['spectator_messages']}")
+    for message_type, values in report["latency_ms"].items():
+        print(f"  {message_type}: n={values['count']} "
+              f"p50={values['p50']}ms p95={values['p95']}ms p99={values['p99']}ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="야추 서버 부하 테스트")
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=8888)
+    parser.add_argument("--connect", metavar="ADDRESS", help="접속할 주소 (예: unix:/tmp/yacht.sock, 지정하면 --host, --port 무시)")
+    parser.add_argument("-c", "--connections", type=int, default=100, help="동시 연결 수 (짝수 권장)")
+    parser.add_argument("-g", "--games", type=int, default=1, help="연결마다 진행할 게임 수")
+    parser.add_argument("--rerolls", type=int, default=2, help="턴당 최대 재굴리기 횟수")
+    parser.add_argument("--binary", action="store_true", help="바이너리 인코딩 사용")
+    parser.add_argument("--spectators", type=int, default=0, help="게임 시작 후 접속시킬 관전자 수")
+    parser.add_argument("--rating-spread", type=int, default=0, help="봇 레이팅 표준편차 (레이팅 매칭 부하 확인용)")
+    parser.add_argument("--pipeline", action="store_true",
+                        help="응답을 기다리지 않고 한 턴의 요청을 한꺼번에 보냄 (주사위를 보지 않는 봇)")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args()
+
+    endpoint = Endpoint.parse(args.connect) if args.connect else Endpoint.tcp(args.host, args.port)
+    result = asyncio.run(run_load(endpoint, args.connections, args.games, args.rerolls, args.binary,
+                                  args.spectators, args.rating_spread, args.pipeline))
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print_report(result)
@@ -0,0 +1,204 @@
+import asyncio
+import math
+import time
+from bisect import bisect_left, insort
+from collections import deque
+
+DEFAULT_MODE = "classic"
+RANKED_MODE = "ranked"  # 주사위를 암호학적 난수로 굴리는 모드
+DEFAULT_RATING = 1500
+MAX_RATING = 4000
+RATING_BUCKET = 100  # 같은 구간으로 묶는 레이팅 폭
+MATCH_SPREAD = 2  # 바로 매칭할 수 있는 최대 구간 차이 (±200점)
+WIDEN_AFTER = 5.0  # 이 시간(초) 이상 기다리면 구간 차이와 관계없이 가장 가까운 상대와 매칭
+MAX_NAME_LENGTH = 20
+MAX_MODE_LENGTH = 32
+WAIT_SAMPLES = 1024  # 매칭 대기 시간 통계에 사용할 최근 표본 수
+
+
+class Ticket:
+    """매칭 대기열에 들어간 연결 하나.
+
+    대기 중 연결이 끊기면 큐에서 바로 빼지 않고 active만 끄며,
+    나중에 큐 앞에 왔을 때 버림 (취소도 O(1)).
+    """
+
+    __slots__ = ("client", "name", "mode", "rating", "bucket", "enqueued_at", "future", "active")
+
+    def __init__(self, client, data: dict):
+        """join 메시지 데이터로 대기표 생성.
+
+        잘못된 값은 오류로 처리하지 않고 기본값으로 대체.
+
+        Args:
+            client: 매칭 결과를 돌려줄 연결 (서버의 StreamWriter)
+            data: join 메시지 데이터 (name, mode, rating 모두 생략 가능)
+        """
+        name = data.get("name")
+        mode = data.get("mode")
+        rating = data.get("rating")
+        self.client = client
+        self.name = name[:MAX_NAME_LENGTH] if isinstance(name, str) and name else None
+        self.mode = mode if isinstance(mode, str) and 0 < len(mode) <= MAX_MODE_LENGTH else DEFAULT_MODE
+        # json.loads는 NaN, Infinity도 받아들이므로 유한한 실수만 레이팅으로 사용 (정수는 크기와 관계없이 범위로 자름)
+        valid = isinstance(rating, int) or isinstance(rating, float) and math.isfinite(rating)
+        self.rating = min(max(int(rating), 0), MAX_RATING) if valid else DEFAULT_RATING
+        self.bucket = self.rating // RATING_BUCKET
+        self.enqueued_at = time.monotonic()
+        self.future: asyncio.Future | None = None  # 매칭되면 (방, 플레이어 ID)를 받을 Future
+        self.active = True
+
+
+class Lobby:
+    """게임 모드와 레이팅 구간별 매칭 대기열.
+
+    모드마다 레이팅 구간 → FIFO 큐, 그리고 비어 있지 않은 구간 번호의 정렬된 목록을 유지.
+    새 대기표는 정렬된 목록을 이분 탐색해 가장 가까운 구간의 가장 오래 기다린 상대와 바로 짝을 지으므로
+    대기 인원과 관계없이 O(log 구간 수)로 매칭되고, 큐 전체를 훑지 않음.
+    """
+
+    def __init__(self, spread: int = MATCH_SPREAD, widen_after: float = WIDEN_AFTER):
+        """빈 로비 생성.
+
+        Args:
+            spread: 바로 매칭할 수 있는 최대 구간 차이
+            widen_after: 구간 제한 없이 매칭해 줄 대기 시간(초)
+        """
+        self.spread = spread
+        self.widen_after = widen_after
+        self.queues: dict[str, dict[int, deque[Ticket]]] = {}  # 모드 → 레이팅 구간 → 대기표 큐
+        self.buckets: dict[str, list[int]] = {}  # 모드 → 대기표가 있는 구간 번호 (오름차순)
+        self.depth = 0  # 대기 중인 연결 수
+        self.matched = 0  # 지금까지 만든 매칭 수
+        self.waits: deque[float] = deque(maxlen=WAIT_SAMPLES)  # 최근 매칭 대기 시간(초)
+
+    def enqueue(self, ticket: Ticket) -> tuple[Ticket, Ticket] | None:
+        """대기표를 넣고, 가까운 상대가 있으면 바로 매칭.
+
+        Args:
+            ticket: 새 대기표
+
+        Returns:
+            매칭되면 (먼저 기다린 대기표, 새 대기표), 아니면 None
+        """
+        partner = self._take_nearest(ticket.mode, ticket.bucket, self.spread)
+        if partner is not None:
+            return self._pair(partner, ticket)
+        self._push(ticket)
+        return None
+
+    def cancel(self, ticket: Ticket) -> None:
+        """매칭 전에 연결이 끊긴 대기표 취소.
+
+        Args:
+            ticket: 취소할 대기표
+        """
+        if ticket.active:
+            ticket.active = False
+            self.depth -= 1
+
+    def sweep(self) -> list[tuple[Ticket, Ticket]]:
+        """오래 기다린 대기표를 구간 차이와 관계없이 가장 가까운 상대와 매칭.
+
+        각 구간의 맨 앞(가장 오래 기다린 대기표)만 보므로 비용은 대기 인원이 아닌 구간 수에 비례.
+        주기적으로 호출.
+
+        Returns:
+            새로 만든 매칭 목록
+        """
+        pairs = []
+        deadline = time.monotonic() - self.widen_after
+        for mode, queues in list(self.queues.items()):  # 매칭하면서 빈 모드를 지우므로 복사본을 순회
+            while True:
+                heads = [queues[bucket][0] for bucket in list(queues) if self._prune(mode, bucket)]
+                oldest = min(heads, key=lambda ticket: ticket.enqueued_at, default=None)
+                if oldest is None or oldest.enqueued_at > deadline or len(heads) < 2:
+                    break
+                queues[oldest.bucket].popleft()
+                self._prune(mode, oldest.bucket)
+                self.depth -= 1
+                partner = self._take_nearest(mode, oldest.bucket, None)
+                pairs.append(self._pair(oldest, partner))
+        return pairs
+
+    def stats(self) -> dict:
+        """대기열 상태 요약.
+
+        Returns:
+            대기 인원, 누적 매칭 수, 최근 매칭 대기 시간 p50/p95(ms)를 담은 딕셔너리
+        """
+        waits = sorted(self.waits)
+        p50 = waits[len(waits) // 2] if waits else 0.0
+        p95 = waits[min(len(waits) - 1, int(len(waits) * 0.95))] if waits else 0.0
+        return {"queued": self.depth, "matched": self.matched,
+                "match_wait_ms": {"p50": round(p50 * 1000, 1), "p95": round(p95 * 1000, 1)}}
+
+    def _push(self, ticket: Ticket) -> None:
+        """대기표를 해당 모드·구간 큐의 끝에 추가."""
+        queues = self.queues.setdefault(ticket.mode, {})
+        queue = queues.get(ticket.bucket)
+        if queue is None:
+            queue = queues[ticket.bucket] = deque()
+            insort(self.buckets.setdefault(ticket.mode, []), ticket.bucket)
+        queue.append(ticket)
+        self.depth += 1
+
+    def _prune(self, mode: str, bucket: int) -> bool:
+        """구간 큐 앞의 취소된 대기표를 버리고, 빈 구간은 목록에서 제거 (구간이 모두 비면 모드도 제거).
+
+        Returns:
+            살아 있는 대기표가 남아 있으면 True
+        """
+        queues = self.queues[mode]
+        queue = queues[bucket]
+        while queue and not queue[0].active:
+            queue.popleft()
+        if queue:
+            return True
+        del queues[bucket]
+        buckets = self.buckets[mode]
+        del buckets[bisect_left(buckets, bucket)]
+        if not buckets:
+            # 모드 이름은 클라이언트가 정하므로 빈 모드를 남겨 두면 사전과 sweep 순회가 끝없이 커짐
+            del self.queues[mode]
+            del self.buckets[mode]
+        return False
+
+    def _take_nearest(self, mode: str, bucket: int, spread: int | None) -> Ticket | None:
+        """가장 가까운 구간에서 가장 오래 기다린 대기표를 꺼냄.
+
+        Args:
+            mode: 게임 모드
+            bucket: 기준 레이팅 구간
+            spread: 허용할 최대 구간 차이 (None이면 제한 없음)
+
+        Returns:
+            꺼낸 대기표, 조건에 맞는 상대가 없으면 None
+        """
+        buckets = self.buckets.get(mode)
+        while buckets:
+            i = bisect_left(buckets, bucket)
+            # 기준 미만인 가장 가까운 구간과 기준 이상인 가장 가까운 구간만 후보
+            candidates = buckets[max(i - 1, 0):i + 1]
+            if not all([self._prune(mode, b) for b in candidates]):
+                continue  # 취소된 대기표만 남은 구간을 정리했으니 다시 탐색
+            queues = self.queues[mode]
+            nearest = min(candidates, key=lambda b: (abs(b - bucket), queues[b][0].enqueued_at))
+            if spread is not None and abs(nearest - bucket) > spread:
+                return None
+            ticket = queues[nearest].popleft()
+            self._prune(mode, nearest)
+            self.depth -= 1
+            return ticket
+        return None
+
+    def _pair(self, first: Ticket, second: Ticket) -> tuple[Ticket, Ticket]:
+        """매칭 결과 기록 후 먼저 기다린 대기표가 앞에 오도록 반환."""
+        if second.enqueued_at < first.enqueued_at:
+            first, second = second, first
+        now = time.monotonic()
+        first.active = second.active = False
+        self.waits.append(now - first.enqueued_at)
+        self.waits.append(now - second.enqueued_at)
+        self.matched += 1
+        return first, second
@@ -0,0 +1,139 @@
+import atexit
+import json
+import os
+import sys
+import threading
+import time
+
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+OFF = 100
+LEVELS = {"debug": DEBUG, "info": INFO, "warning": WARNING, "error": ERROR, "off": OFF}
+LEVEL_NAMES = {DEBUG: "DEBUG", INFO: "INFO", WARNING: "WARN", ERROR: "ERROR"}
+FLUSH_INTERVAL = 0.2  # 쌓인 로그를 출력하는 주기(초)
+MAX_BUFFERED = 10000  # 출력이 밀릴 때 메모리에 쌓아둘 최대 줄 수 (넘으면 버리고 개수만 기록)
+
+
+class Logger:
+    """레벨과 필드를 가진 버퍼링 로거.
+
+    호출한 스레드에서는 레벨 확인과 한 줄 포맷만 하고 버퍼에 쌓으며,
+    실제 출력은 전용 스레드가 FLUSH_INTERVAL마다 모아서 한 번에 write.
+    레벨보다 낮은 로그는 포맷도 하지 않으므로 부하가 클 때 레벨을 올려 비용을 거의 없앨 수 있음.
+    """
+
+    def __init__(self, level: int = INFO, fmt: str = "text", stream=None):
+        """로거 초기화. 출력 스레드는 첫 로그가 들어올 때 시작.
+
+        Args:
+            level: 출력할 최소 레벨
+            fmt: "text" (사람이 읽는 형식) 또는 "json" (한 줄에 JSON 객체 하나)
+            stream: 출력 스트림 (None이면 sys.stdout)
+        """
+        self.level = level
+        self.fmt = fmt
+        self.stream = stream
+        self.dropped = 0  # 버퍼가 가득 차 버린 줄 수
+        self.context: dict = {}  # 모든 로그에 붙일 필드 (워커 번호 등)
+        self._lines: list[str] = []
+        self._lock = threading.Lock()
+        self._thread = None
+        self._clock = (0, "")  # (초, 포맷한 시각) - 같은 초 안에서는 strftime을 다시 호출하지 않음
+        os.register_at_fork(after_in_child=self._after_fork)
+
+    def configure(self, level: str | None = None, fmt: str | None = None) -> None:
+        """명령행 옵션으로 레벨과 형식 변경.
+
+        Args:
+            level: LEVELS의 키 (None이면 유지)
+            fmt: "text" 또는 "json" (None이면 유지)
+        """
+        if level is not None:
+            self.level = LEVELS[level]
+        if fmt is not None:
+            self.fmt = fmt
+
+    def level_name(self) -> str:
+        """현재 레벨의 LEVELS 키 (다른 프로세스에 같은 설정을 넘길 때 사용)."""
+        return next(name for name, value in LEVELS.items() if value == self.level)
+
+    def enabled(self, level: int) -> bool:
+        """해당 레벨의 로그가 출력되는지 여부 (비싼 인자를 만들기 전에 확인용)."""
+        return level >= self.level
+
+    def log(self, level: int, message: str, **fields) -> None:
+        """로그 한 줄 기록.
+
+        Args:
+            level: 로그 레벨
+            message: 메시지
+            **fields: 함께 남길 구조화 필드 (방 번호, 플레이어 등)
+        """
+        if level < self.level:
+            return
+        if self.context:
+            fields = {**self.context, **fields}
+        now = time.time()
+        second = int(now)
+        if second != self._clock[0]:
+            self._clock = (second, time.strftime("%H:%M:%S", time.localtime(second)))
+        if self.fmt == "json":
+            line = json.dumps({"ts": round(now, 3), "level": LEVEL_NAMES[level], "msg": message, **fields},
+                              ensure_ascii=False, default=str)
+        else:
+            extra = "".join(f" {key}={value}" for key, value in fields.items())
+            line = f"[{self._clock[1]}] {LEVEL_NAMES[level]} {message}{extra}"
+        with self._lock:
+            if len(self._lines) >= MAX_BUFFERED:
+                self.dropped += 1
+                return
+            self._lines.append(line)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="yacht-log", daemon=True)
+                self._thread.start()
+                atexit.register(self.flush)
+
+    def debug(self, message: str, **fields) -> None:
+        """DEBUG 레벨 로그 기록."""
+        self.log(DEBUG, message, **fields)
+
+    def info(self, message: str, **fields) -> None:
+        """INFO 레벨 로그 기록."""
+        self.log(INFO, message, **fields)
+
+    def warning(self, message: str, **fields) -> None:
+        """WARNING 레벨 로그 기록."""
+        self.log(WARNING, message, **fields)
+
+    def error(self, message: str, **fields) -> None:
+        """ERROR 레벨 로그 기록."""
+        self.log(ERROR, message, **fields)
+
+    def flush(self) -> None:
+        """버퍼에 쌓인 로그를 지금 바로 출력."""
+        with self._lock:
+            lines, self._lines = self._lines, []
+            dropped, self.dropped = self.dropped, 0
+        if dropped:
+            lines.append(f"... 출력 지연으로 로그 {dropped}줄 생략")
+        if lines:
+            stream = self.stream or sys.stdout
+            stream.write("\n".join(lines) + "\n")
+            stream.flush()
+
+    def _after_fork(self) -> None:
+        """fork한 자식 프로세스(워커)에는 출력 스레드가 없으므로 새로 시작하도록 초기화."""
+        self._lines = []
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def _run(self) -> None:
+        """출력 스레드 - 주기적으로 버퍼를 비움."""
+        while True:
+            time.sleep(FLUSH_INTERVAL)
+            self.flush()
+
+
+logger = Logger()  # 프로세스 전체에서 함께 쓰는 로거
@@ -0,0 +1,250 @@
+import asyncio
+import threading
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable
+
+# 지연 시간 히스토그램 구간 상한(초) - 50µs부터 1초까지
+LATENCY_BUCKETS = (0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+# 매칭 대기 시간 히스토그램 구간 상한(초)
+WAIT_BUCKETS = (0.001, 0.01, 0.05, 0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+# 히스토그램을 따로 두는 클라이언트 메시지 종류 (그 밖의 종류는 "other"로 묶어 레이블 수 제한)
+MESSAGE_TYPES = ("roll_dice", "select_category", "sync_request", "hello", "hint_request",
+                 "leaderboard_request", "player_stats_request")
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+PAGES: dict[str, tuple[str, Callable[[], bytes]]] = {}  # 경로 → (Content-Type, 본문 콜백) - 그 밖의 경로는 지표
+
+
+class Histogram:
+    """고정 구간 누적 히스토그램.
+
+    관측값마다 구간 하나의 개수만 늘리고, 누적 합은 출력할 때 계산.
+    """
+
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: tuple[float, ...]):
+        """빈 히스토그램 생성.
+
+        Args:
+            bounds: 오름차순 구간 상한
+        """
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # 마지막 칸은 +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """관측값 하나 기록.
+
+        Args:
+            value: 관측값 (초 등)
+        """
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class Metrics:
+    """서버 지표 모음.
+
+    카운터와 히스토그램은 값을 바로 갱신하고, 게이지는 수집 요청이 올 때 콜백으로 읽음.
+    스레드 서버는 클라이언트·쓰기·타이머 스레드가 함께 갱신하므로 갱신과 출력은 lock으로 직렬화
+    (+=는 원자적이지 않아 동시에 올리면 값을 잃을 수 있음).
+    Prometheus 텍스트 형식으로 출력.
+    """
+
+    def __init__(self):
+        """빈 지표 모음 생성."""
+        self.counters: dict[str, float] = {}
+        self.gauges: dict[str, Callable[[], float]] = {}
+        self.histograms: dict[str, dict[str, Histogram]] = {}  # 이름 → 레이블 값 → 히스토그램
+        self.labels: dict[str, str] = {}  # 히스토그램 이름 → 레이블 이름
+        self.buckets: dict[str, tuple[float, ...]] = {}
+        self.help: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, help_text: str) -> None:
+        """카운터 등록."""
+        self.counters.setdefault(name, 0)
+        self.help[name] = help_text
+
+    def gauge(self, name: str, help_text: str, read: Callable[[], float]) -> None:
+        """게이지 등록 (같은 이름이면 콜백 교체).
+
+        Args:
+            name: 지표 이름
+            help_text: 설명
+            read: 현재 값을 돌려주는 콜백
+        """
+        self.gauges[name] = read
+        self.help[name] = help_text
+
+    def histogram(self, name: str, help_text: str, buckets: tuple[float, ...] = LATENCY_BUCKETS,
+                  label: str | None = None) -> None:
+        """히스토그램 등록.
+
+        Args:
+            name: 지표 이름
+            help_text: 설명
+            buckets: 구간 상한
+            label: 레이블 이름 (None이면 레이블 없음)
+        """
+        self.histograms.setdefault(name, {})
+        self.buckets[name] = buckets
+        self.help[name] = help_text
+        if label is not None:
+            self.labels[name] = label
+
+    def inc(self, name: str, value: float = 1) -> None:
+        """카운터 증가."""
+        with self._lock:
+            self.counters[name] += value
+
+    def observe(self, name: str, value: float, label: str = "") -> None:
+        """히스토그램에 관측값 기록.
+
+        Args:
+            name: 지표 이름
+            value: 관측값
+            label: 레이블 값 (레이블 없는 히스토그램은 생략)
+        """
+        with self._lock:
+            series = self.histograms[name]
+            histogram = series.get(label)
+            if histogram is None:
+                histogram = series[label] = Histogram(self.buckets[name])
+            histogram.observe(value)
+
+    def render(self) -> str:
+        """Prometheus 텍스트 형식으로 출력.
+
+        Returns:
+            # HELP / # TYPE 줄을 포함한 지표 텍스트
+        """
+        # 갱신 중인 값을 읽지 않도록 lock 안에서 복사한 뒤 출력 (게이지 콜백은 lock 밖에서 호출)
+        with self._lock:
+            counters = list(self.counters.items())
+            histograms = [(name, [(value, list(histogram.counts), histogram.sum, histogram.count, histogram.bounds)
+                                  for value, histogram in sorted(series.items())])
+                          for name, series in self.histograms.items()]
+        lines = []
+        for name, value in counters:
+            lines += [f"# HELP {name} {self.help[name]}", f"# TYPE {name} counter", f"{name} {value}"]
+        for name, read in list(self.gauges.items()):
+            lines += [f"# HELP {name} {self.help[name]}", f"# TYPE {name} gauge", f"{name} {read()}"]
+        for name, series in histograms:
+            lines += [f"# HELP {name} {self.help[name]}", f"# TYPE {name} histogram"]
+            label = self.labels.get(name)
+            for value, counts, total, count, bounds in series:
+                prefix = f'{label}="{value}",' if label else ""
+                cumulative = 0
+                for bound, count_in_bucket in zip(bounds + (float("inf"),), counts):
+                    cumulative += count_in_bucket
+                    le = "+Inf" if bound == float("inf") else repr(bound)
+                    lines.append(f'{name}_bucket{{{prefix}le="{le}"}} {cumulative}')
+                suffix = f"{{{prefix[:-1]}}}" if prefix else ""
+                lines.append(f"{name}_sum{suffix} {total}")
+                lines.append(f"{name}_count{suffix} {count}")
+        return "\n".join(lines) + "\n"
+
+
+def add_page(path: str, content_type: str, render: Callable[[], bytes]) -> None:
+    """지표 대신 다른 내용을 돌려줄 경로 등록 (추적 기록, 프로파일 등).
+
+    Args:
+        path: 요청 경로 (예: "/trace")
+        content_type: 응답 Content-Type
+        render: 요청마다 본문을 만들 콜백
+    """
+    PAGES[path] = (content_type, render)
+
+
+def render_page(path: str) -> tuple[str, bytes]:
+    """요청 경로에 맞는 응답 본문 (등록하지 않은 경로는 전체 지표).
+
+    Args:
+        path: 요청 경로 (쿼리 문자열 무시)
+
+    Returns:
+        (Content-Type, 본문)
+    """
+    page = PAGES.get(path.split("?", 1)[0])
+    if page is None:
+        return CONTENT_TYPE, metrics.render().encode()
+    return page[0], page[1]()
+
+
+def message_label(message_type: str) -> str:
+    """히스토그램 레이블로 쓸 메시지 종류 (알 수 없는 종류는 "other")."""
+    return message_type if message_type in MESSAGE_TYPES else "other"
+
+
+async def handle_scrape(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    """asyncio 서버용 지표 수집 요청 처리 (add_page로 등록한 경로가 아니면 전체 지표로 응답).
+
+    이벤트 루프 안에서 출력하므로 게이지 콜백이 서버 상태를 안전하게 읽을 수 있음.
+
+    Args:
+        reader: 수집기 연결 StreamReader
+        writer: 수집기 연결 StreamWriter
+    """
+    try:
+        request = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), 5.0)
+        parts = request.split(b" ", 2)
+        content_type, body = render_page(parts[1].decode("latin-1") if len(parts) > 2 else "/")
+        writer.write(f"HTTP/1.0 200 OK\r\nContent-Type: {content_type}\r\n"
+                     f"Content-Length: {len(body)}\r\n\r\n".encode() + body)
+        await writer.drain()
+    except (asyncio.TimeoutError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+class ScrapeHandler(BaseHTTPRequestHandler):
+    """스레드 서버용 지표 수집 요청 처리."""
+
+    def do_GET(self) -> None:
+        """등록한 경로의 내용 또는 전체 지표로 응답."""
+        content_type, body = render_page(self.path)
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        """수집 요청마다 접근 로그를 남기지 않음."""
+
+
+def serve_in_thread(host: str, port: int) -> ThreadingHTTPServer:
+    """별도 스레드에서 지표 HTTP 서버 실행 (이벤트 루프가 없는 스레드 서버용).
+
+    Args:
+        host: 바인딩할 호스트 주소
+        port: 바인딩할 포트 번호
+
+    Returns:
+        실행 중인 HTTP 서버
+    """
+    server = ThreadingHTTPServer((host, port), ScrapeHandler)
+    threading.Thread(target=server.serve_forever, name="yacht-metrics", daemon=True).start()
+    return server
+
+
+metrics = Metrics()  # 프로세스 전체에서 함께 쓰는 지표 모음
+metrics.counter("yacht_bytes_received_total", "클라이언트에게서 받은 바이트 수")
+metrics.counter("yacht_bytes_sent_total", "클라이언트에게 보낸 바이트 수 (관전자 포함)")
+metrics.counter("yacht_games_started_total", "시작한 게임 수")
+metrics.counter("yacht_games_finished_total", "끝까지 진행된 게임 수")
+metrics.counter("yacht_games_abandoned_total", "끝나기 전에 정리된 게임 수")
+metrics.counter("yacht_turn_timeouts_total", "제한 시간을 넘겨 서버가 대신 진행한 턴 수")
+metrics.counter("yacht_forfeits_total", "연속 시간 초과로 기권 처리된 게임 수")
+metrics.counter("yacht_idle_disconnects_total", "유휴 시간 초과로 끊은 연결 수")
+metrics.counter("yacht_rejected_connections_total", "연결·방 수 상한으로 거절한 연결 수")
+metrics.counter("yacht_rate_limited_total", "속도 제한으로 처리하지 않고 버린 메시지 수")
+metrics.counter("yacht_rejected_requests_total", "규칙에 맞지 않아 error로 응답한 요청 수")
+metrics.histogram("yacht_message_seconds", "클라이언트 메시지 종류별 처리 시간(초)", label="type")
+metrics.histogram("yacht_broadcast_seconds", "브로드캐스트 직렬화와 전송 시간(초)")
+metrics.histogram("yacht_match_wait_seconds", "로비에 들어와서 매칭되기까지 걸린 시간(초)", WAIT_BUCKETS)
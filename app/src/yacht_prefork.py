@@ -0,0 +1,263 @@
+import argparse
+import asyncio
+import multiprocessing
+import os
+import queue
+import signal
+import socket
+import time
+
+from yacht_async_server import AsyncYachtServer, add_limit_arguments, limit_options
+from yacht_log import LEVELS, logger
+from yacht_rng import derive_seed
+from yacht_trace import add_trace_arguments, start_tracing, stop_tracing, trace_options
+from yacht_transport import parse_endpoints
+
+
+def worker_main(index: int, host: str, port: int, stats_queue: multiprocessing.Queue,
+                shared: dict[str, socket.socket], stats_interval: float, journal_dir: str | None = None,
+                metrics_port: int | None = None, log_level: str = "info", log_format: str = "text",
+                seed: int | None = None, secure_dice: bool = False, listen: list[str] | None = None,
+                limits: dict | None = None, results_path: str | None = None, trace: dict | None = None) -> None:
+    """워커 프로세스 진입점.
+
+    자체 이벤트 루프에서 AsyncYachtServer를 실행하고,
+    주기적으로 상태를 감독 프로세스에 보고.
+
+    Args:
+        index: 워커 번호
+        host: 바인딩할 호스트 주소
+        port: 바인딩할 포트 번호
+        stats_queue: 상태 보고용 큐
+        shared: 주소 문자열 → 감독 프로세스가 만든 공유 listen 소켓 (없는 주소는 워커가 SO_REUSEPORT로 바인딩)
+        stats_interval: 상태 보고 주기(초)
+        journal_dir: 게임 기록 상위 디렉터리 (워커마다 하위 디렉터리 사용)
+        metrics_port: 지표 포트 시작 번호 (워커 i는 metrics_port + i, None이면 제공하지 않음)
+        log_level: 로그 레벨
+        log_format: 로그 형식 ("text" 또는 "json")
+        seed: 기준 주사위 시드 (워커 번호와 섞어 워커마다 다른 기준 시드 사용)
+        secure_dice: 모든 방에서 암호학적 난수로 주사위를 굴릴지 여부
+        listen: 접속을 받을 주소 문자열 목록 (None이면 host:port)
+        limits: 제한 시간과 수용 한도 (AsyncYachtServer 키워드 인자, 워커마다 적용)
+        results_path: 게임 결과 SQLite 파일 (모든 워커가 같은 파일에 기록해 순위표 공유)
+        trace: 추적과 프로파일링 옵션 (start_tracing 키워드 인자, 기록 파일 이름에 워커 번호를 붙임)
+    """
+    logger.configure(log_level, log_format)
+    logger.context = {"worker": index}
+    if trace is not None:
+        trace = dict(trace)
+        if trace["path"] is not None:
+            base, ext = os.path.splitext(trace["path"])
+            trace["path"] = f"{base}-worker-{index}{ext}"
+        start_tracing(**trace)
+    if journal_dir is not None:
+        # 재시작한 워커는 같은 번호의 기록에서 자기 방을 복구
+        journal_dir = os.path.join(journal_dir, f"worker-{index}")
+    server = AsyncYachtServer(host, port, reuse_port=True, journal_dir=journal_dir,
+                              metrics_port=None if metrics_port is None else metrics_port + index,
+                              seed=None if seed is None else derive_seed(seed, index), secure_dice=secure_dice,
+                              listen=parse_endpoints(listen, host, port), results_path=results_path,
+                              **(limits or {}))
+
+    async def report() -> None:
+        while True:
+            await asyncio.sleep(stats_interval)
+            stats_queue.put((index, os.getpid(), server.stats()))
+
+    async def run() -> None:
+        reporter = asyncio.create_task(report())
+        try:
+            await server.start_server(shared)
+        finally:
+            reporter.cancel()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stop_tracing()
+
+
+class Supervisor:
+    """멀티 프로세스 서버 감독 클래스.
+
+    여러 워커 프로세스가 같은 포트에서 각자 게임 방을 운영하도록 실행하고,
+    죽은 워커는 다시 띄우며 워커별 상태를 모아 출력.
+    SO_REUSEPORT를 지원하면 워커마다 TCP 포트를 바인딩하고,
+    지원하지 않으면 감독 프로세스가 만든 listen 소켓을 공유.
+    유닉스 소켓은 경로 하나를 여러 프로세스가 바인딩할 수 없으므로 항상 공유.
+    """
+
+    def __init__(self, workers: int, host: str = 'localhost', port: int = 8888, stats_interval: float = 5.0,
+                 journal_dir: str | None = None, metrics_port: int | None = None, seed: int | None = None,
+                 secure_dice: bool = False, listen: list[str] | None = None, limits: dict | None = None,
+                 results_path: str | None = None, trace: dict | None = None):
+        """감독 프로세스 초기화.
+
+        Args:
+            workers: 워커 프로세스 수
+            host: 바인딩할 호스트 주소
+            port: 바인딩할 포트 번호
+            stats_interval: 상태 보고 및 출력 주기(초)
+            journal_dir: 게임 기록 상위 디렉터리 (None이면 기록하지 않음)
+            metrics_port: 워커 지표 포트 시작 번호 (워커 i는 metrics_port + i)
+            seed: 기준 주사위 시드 (None이면 방마다 임의 시드)
+            secure_dice: 모든 방에서 암호학적 난수로 주사위를 굴릴지 여부
+            listen: 접속을 받을 주소 문자열 목록 (None이면 host:port)
+            limits: 워커마다 적용할 제한 시간과 수용 한도 (AsyncYachtServer 키워드 인자)
+            results_path: 게임 결과 SQLite 파일 (모든 워커가 공유, None이면 순위표 없음)
+            trace: 워커마다 적용할 추적과 프로파일링 옵션 (start_tracing 키워드 인자)
+        """
+        self.workers = workers
+        self.host = host
+        self.port = port
+        self.stats_interval = stats_interval
+        self.journal_dir = journal_dir
+        self.metrics_port = metrics_port
+        self.seed = seed
+        self.secure_dice = secure_dice
+        self.listen = listen
+        self.limits = limits
+        self.results_path = results_path
+        self.trace = trace
+        self.endpoints = parse_endpoints(listen, host, port)
+        self.stats_queue = multiprocessing.Queue()
+        self.processes: dict[int, multiprocessing.Process] = {}
+        self.worker_stats: dict[int, dict] = {}  # 워커 번호 → 마지막으로 보고된 상태
+        self.restarts: dict[int, int] = {}  # 워커 번호 → 재시작 횟수
+        self.shared: dict[str, socket.socket] = {}  # 주소 문자열 → 워커가 공유할 listen 소켓
+
+    def log(self, message: str) -> None:
+        """감독 프로세스 로그 기록.
+
+        Args:
+            message: 로그 메시지
+        """
+        logger.info(message, process="supervisor")
+
+    def spawn(self, index: int) -> None:
+        """워커 프로세스 하나 실행.
+
+        Args:
+            index: 워커 번호
+        """
+        process = multiprocessing.Process(
+            target=worker_main,
+            args=(index, self.host, self.port, self.stats_queue, self.shared, self.stats_interval, self.journal_dir,
+                  self.metrics_port, logger.level_name(), logger.fmt, self.seed, self.secure_dice, self.listen,
+                  self.limits, self.results_path, self.trace),
+            name=f"yacht-worker-{index}",
+            daemon=True
+        )
+        process.start()
+        self.processes[index] = process
+        self.log(f"워커 {index} 시작 (pid {process.pid})")
+
+    def collect_stats(self, timeout: float) -> None:
+        """워커가 보낸 상태 보고를 모두 수집.
+
+        Args:
+            timeout: 첫 보고를 기다릴 최대 시간(초)
+        """
+        try:
+            while True:
+                index, pid, stats = self.stats_queue.get(timeout=timeout)
+                self.worker_stats[index] = {"pid": pid, **stats}
+                timeout = 0
+        except queue.Empty:
+            pass
+
+    def check_workers(self) -> None:
+        """종료된 워커를 찾아 다시 실행."""
+        for index, process in list(self.processes.items()):
+            if process.is_alive():
+                continue
+            self.log(f"워커 {index} 종료 (exit code {process.exitcode}) - 재시작")
+            process.join()
+            self.restarts[index] = self.restarts.get(index, 0) + 1
+            self.worker_stats.pop(index, None)
+            self.spawn(index)
+
+    def summary(self) -> dict:
+        """워커 상태를 합친 전체 요약.
+
+        Returns:
+            전체 합계와 워커별 상태를 담은 딕셔너리
+        """
+        total = {"rooms": 0, "connections": 0, "spectators": 0, "queued": 0, "games_finished": 0}
+        for stats in self.worker_stats.values():
+            for key in total:
+                total[key] += stats[key]
+        workers = {index: {**stats, "restarts": self.restarts.get(index, 0)}
+                   for index, stats in sorted(self.worker_stats.items())}
+        return {"total": total, "workers": workers}
+
+    def forward_dump(self, *_) -> None:
+        """SIGUSR1을 살아 있는 워커 모두에 전달."""
+        for process in self.processes.values():
+            if process.pid is not None and process.is_alive():
+                os.kill(process.pid, signal.SIGUSR1)
+
+    def run(self) -> None:
+        """워커를 실행하고 종료 신호가 올 때까지 감독."""
+        reuse_port = hasattr(socket, "SO_REUSEPORT")
+        if not reuse_port:
+            self.log("SO_REUSEPORT 미지원 - listen 소켓 공유 방식 사용")
+        for endpoint in self.endpoints:
+            if endpoint.kind == "unix" or not reuse_port:
+                # 하나의 listen 소켓을 만들어 모든 워커가 공유
+                self.shared[str(endpoint)] = endpoint.bind()
+
+        for index in range(self.workers):
+            self.spawn(index)
+        if self.trace is not None and (self.trace["sample_rate"] or self.trace["profile"]) and hasattr(signal, "SIGUSR1"):
+            # 감독 프로세스가 받은 SIGUSR1을 모든 워커에 전달 (워커마다 추적 기록 저장과 프로파일 출력)
+            signal.signal(signal.SIGUSR1, self.forward_dump)
+
+        last_report = time.monotonic()
+        try:
+            while True:
+                self.collect_stats(timeout=1.0)
+                self.check_workers()
+                if time.monotonic() - last_report >= self.stats_interval:
+                    last_report = time.monotonic()
+                    summary = self.summary()
+                    self.log(f"전체 {summary['total']}")
+                    for index, stats in summary["workers"].items():
+                        self.log(f"  워커 {index}: {stats}")
+        except KeyboardInterrupt:
+            self.log("종료 중...")
+        finally:
+            for process in self.processes.values():
+                process.terminate()
+            for process in self.processes.values():
+                process.join()
+            for endpoint in self.endpoints:
+                if str(endpoint) in self.shared:
+                    self.shared[str(endpoint)].close()
+                    endpoint.cleanup()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="야추 멀티 프로세스 서버")
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 1, help="워커 프로세스 수 (기본: CPU 코어 수)")
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=8888)
+    parser.add_argument("--listen", action="append", metavar="ADDRESS",
+                        help="접속을 받을 주소 (여러 번 지정 가능, 예: tcp://0.0.0.0:8888, unix:/tmp/yacht.sock)")
+    parser.add_argument("--stats-interval", type=float, default=5.0, help="상태 출력 주기(초)")
+    parser.add_argument("--journal", help="게임 기록 디렉터리 (워커별 하위 디렉터리에 기록)")
+    parser.add_argument("--metrics-port", type=int, help="지표 포트 시작 번호 (워커 i는 이 번호 + i)")
+    parser.add_argument("--log-level", choices=LEVELS, default="info", help="debug면 메시지마다 로그 (기본: info)")
+    parser.add_argument("--log-format", choices=("text", "json"), default="text")
+    parser.add_argument("--seed", type=int, help="기준 주사위 시드 (워커 번호, 방 번호와 섞어 방마다 다른 시드 사용)")
+    parser.add_argument("--secure-dice", action="store_true", help="모든 방에서 암호학적 난수로 주사위 굴리기")
+    parser.add_argument("--results", metavar="PATH", help="게임 결과와 플레이어 통계를 기록할 SQLite 파일 (모든 워커 공유)")
+    add_limit_arguments(parser)
+    add_trace_arguments(parser)
+    args = parser.parse_args()
+
+    logger.configure(args.log_level, args.log_format)
+    Supervisor(args.workers, args.host, args.port, args.stats_interval, args.journal, args.metrics_port,
+               args.seed, args.secure_dice, args.listen, limit_options(args), args.results, trace_options(args)).run()
@@ -0,0 +1,310 @@
+import json
+import re
+import struct
+
+from yacht_scoring import CATEGORIES, CATEGORY_INDEX
+
+# 프레임 헤더: 네트워크 바이트 순서의 4바이트 부호 없는 정수 (페이로드 길이)
+HEADER = struct.Struct("!I")
+MAX_FRAME_SIZE = 1 << 20  # 한 메시지의 최대 크기 (1MB)
+
+# 지원하는 인코딩 (hello 핸드셰이크에서 선호 순서대로 제시)
+CODECS = ("binary", "json")
+
+_json_decoder = json.JSONDecoder()
+_JSON_START = ord("{")  # JSON 페이로드는 항상 '{'로 시작하므로 바이너리 타입 번호와 구분됨
+_NON_ASCII = re.compile(rb"[\x80-\xff]")  # 버퍼를 복사하지 않고 JSON 페이로드에 ASCII 밖 바이트가 있는지 확인
+
+# 바이너리 메시지 레이아웃 (첫 바이트는 메시지 타입 번호)
+_ROLL_DICE = 1
+_SELECT_CATEGORY = 2
+_DICE_RESULT = 3
+_TURN_END = 4
+_ROLL_DICE_ID = 5
+_SELECT_CATEGORY_ID = 6
+_ACK = 7
+_ROLL_LAYOUT = struct.Struct("!BB")  # 타입, 재굴리기 비트마스크 (비트 i = 주사위 i)
+_SELECT_LAYOUT = struct.Struct("!BB")  # 타입, 카테고리 인덱스 (0-12)
+_DICE_LAYOUT = struct.Struct("!BBbHI")  # 타입, 플레이어, 남은 굴리기, 주사위 5개 (3비트씩), 순번
+_TURN_END_LAYOUT = struct.Struct("!BBBhBBII")  # 타입, 플레이어, 카테고리, 점수, 다음 플레이어, 라운드, 버전, 순번
+_ROLL_ID_LAYOUT = struct.Struct("!BBI")  # 타입, 재굴리기 비트마스크, 요청 ID
+_SELECT_ID_LAYOUT = struct.Struct("!BBI")  # 타입, 카테고리 인덱스, 요청 ID
+_ACK_LAYOUT = struct.Struct("!BI")  # 타입, 요청 ID
+
+# 요청을 처리하지 않은 이유 (error 메시지의 code) → 설명
+ERROR_CODES = {
+    "not_your_turn": "차례가 아님",
+    "no_rolls_left": "남은 굴리기 없음",
+    "not_rolled": "주사위를 굴리기 전",
+    "unknown_category": "알 수 없는 카테고리",
+    "category_filled": "이미 기록한 카테고리",
+    "game_over": "이미 끝난 게임",
+    "invalid_request": "잘못된 요청 형식",
+    "unknown_type": "알 수 없는 메시지 종류",
+}
+
+
+def pack_dice(dice: list[int]) -> int:
+    """주사위 5개를 3비트씩 16비트 정수 하나로 압축."""
+    if len(dice) != 5:
+        raise ValueError("주사위는 5개여야 함")
+    packed = 0
+    for i, d in enumerate(dice):
+        if not 1 <= d <= 6:
+            raise ValueError("주사위 값 범위 초과")
+        packed |= d << (3 * i)
+    return packed
+
+
+def unpack_dice(packed: int) -> list[int]:
+    """pack_dice로 압축한 정수를 주사위 5개로 복원."""
+    return [packed >> (3 * i) & 7 for i in range(5)]
+
+
+def ack_message(request_id) -> dict:
+    """요청을 처리했다는 응답.
+
+    Args:
+        request_id: 요청 메시지의 id
+
+    Returns:
+        ack 메시지 딕셔너리
+    """
+    return {"type": "ack", "data": {}, "id": request_id}
+
+
+def error_message(code: str, request_id=None) -> dict:
+    """요청을 처리하지 않았다는 응답.
+
+    Args:
+        code: ERROR_CODES의 거절 코드
+        request_id: 요청 메시지의 id (None이면 id 없이 보냄)
+
+    Returns:
+        error 메시지 딕셔너리
+    """
+    message = {"type": "error", "data": {"code": code, "message": ERROR_CODES[code]}}
+    if request_id is not None:
+        message["id"] = request_id
+    return message
+
+
+def _encode_binary(message: dict) -> bytes | None:
+    """고정 레이아웃이 있는 메시지를 바이너리 페이로드로 인코딩.
+
+    레이아웃과 필드 구성이 정확히 일치하는 메시지만 변환하고,
+    그 밖의 메시지는 None을 돌려 JSON으로 보내도록 함.
+    서버가 보내는 메시지(dice_result, turn_end)는 순번(seq)이 있어야 하고,
+    요청 ID(id)는 32비트 부호 없는 정수일 때만 바이너리로 실음 (그 밖의 값은 JSON).
+
+    Args:
+        message: 전송할 메시지 딕셔너리
+
+    Returns:
+        바이너리 페이로드, 변환할 수 없으면 None
+    """
+    seq = message.get("seq")
+    request_id = message.get("id")
+    keys = {"type", "data"}
+    if seq is not None:
+        keys.add("seq")
+    if request_id is not None:
+        keys.add("id")
+    if message.keys() != keys or (seq is not None and request_id is not None):
+        return None
+    kind = message["type"]
+    data = message["data"]
+    try:
+        if seq is None and kind == "roll_dice" and data.keys() <= {"reroll"}:
+            reroll = data.get("reroll", [])
+            if not all(0 <= i < 5 for i in reroll):
+                return None
+            mask = sum(1 << i for i in set(reroll))
+            if request_id is None:
+                return _ROLL_LAYOUT.pack(_ROLL_DICE, mask)
+            return _ROLL_ID_LAYOUT.pack(_ROLL_DICE_ID, mask, request_id)
+        if seq is None and kind == "select_category" and data.keys() == {"category"}:
+            index = CATEGORY_INDEX[data["category"]]
+            if request_id is None:
+                return _SELECT_LAYOUT.pack(_SELECT_CATEGORY, index)
+            return _SELECT_ID_LAYOUT.pack(_SELECT_CATEGORY_ID, index, request_id)
+        if request_id is not None and kind == "ack" and not data:
+            return _ACK_LAYOUT.pack(_ACK, request_id)
+        if seq is not None and kind == "dice_result" and data.keys() == {"dice", "player", "rolls_left"}:
+            return _DICE_LAYOUT.pack(_DICE_RESULT, data["player"], data["rolls_left"], pack_dice(data["dice"]), seq)
+        if seq is not None and kind == "turn_end" and data.keys() == {"score", "category", "player",
+                                                                      "current_player", "round", "version"}:
+            return _TURN_END_LAYOUT.pack(_TURN_END, data["player"], CATEGORY_INDEX[data["category"]], data["score"],
+                                         data["current_player"], data["round"], data["version"], seq)
+    except (KeyError, TypeError, ValueError, struct.error):
+        return None
+    return None
+
+
+def _decode_binary(buffer: bytearray, start: int, stop: int) -> dict:
+    """바이너리 페이로드를 버퍼에서 바로 읽어 메시지 딕셔너리로 변환.
+
+    Args:
+        buffer: 수신 버퍼
+        start: 페이로드 시작 위치
+        stop: 페이로드 끝 위치
+
+    Returns:
+        JSON 인코딩과 같은 형태의 메시지 딕셔너리
+
+    Raises:
+        ValueError: 알 수 없는 타입이거나 길이가 맞지 않거나 카테고리 번호가 범위를 벗어난 경우
+    """
+    kind = buffer[start]
+    layout = {_ROLL_DICE: _ROLL_LAYOUT, _SELECT_CATEGORY: _SELECT_LAYOUT,
+              _DICE_RESULT: _DICE_LAYOUT, _TURN_END: _TURN_END_LAYOUT,
+              _ROLL_DICE_ID: _ROLL_ID_LAYOUT, _SELECT_CATEGORY_ID: _SELECT_ID_LAYOUT, _ACK: _ACK_LAYOUT}.get(kind)
+    if layout is None or stop - start != layout.size:
+        raise ValueError(f"잘못된 바이너리 메시지: 타입 {kind}")
+
+    fields = layout.unpack_from(buffer, start)
+    if kind == _ROLL_DICE or kind == _ROLL_DICE_ID:
+        mask = fields[1]
+        data = {"reroll": [i for i in range(5) if mask >> i & 1]} if mask else {}
+        message = {"type": "roll_dice", "data": data}
+        if kind == _ROLL_DICE_ID:
+            message["id"] = fields[2]
+        return message
+    if kind == _SELECT_CATEGORY or kind == _SELECT_CATEGORY_ID:
+        if fields[1] >= len(CATEGORIES):
+            raise ValueError(f"잘못된 카테고리 번호: {fields[1]}")
+        message = {"type": "select_category", "data": {"category": CATEGORIES[fields[1]]}}
+        if kind == _SELECT_CATEGORY_ID:
+            message["id"] = fields[2]
+        return message
+    if kind == _ACK:
+        return ack_message(fields[1])
+    if kind == _DICE_RESULT:
+        _, player, rolls_left, packed, seq = fields
+        return {"type": "dice_result", "data": {"dice": unpack_dice(packed), "player": player, "rolls_left": rolls_left},
+                "seq": seq}
+    _, player, category, score, current_player, game_round, version, seq = fields
+    if category >= len(CATEGORIES):
+        raise ValueError(f"잘못된 카테고리 번호: {category}")
+    return {"type": "turn_end", "data": {"score": score, "category": CATEGORIES[category], "player": player,
+                                         "current_player": current_player, "round": game_round, "version": version},
+            "seq": seq}
+
+
+def encode_message(message: dict, binary: bool = False) -> bytes:
+    """메시지를 길이 접두사가 붙은 프레임으로 인코딩.
+
+    json.dumps의 기본값(ensure_ascii=True)으로 직렬화하므로
+    페이로드는 항상 ASCII이고, 바이트 오프셋과 문자 오프셋이 일치.
+    binary가 켜져 있으면 고정 레이아웃이 있는 메시지는 바이너리로 보내고,
+    나머지 메시지는 그대로 JSON으로 보냄.
+
+    Args:
+        message: 전송할 메시지 딕셔너리
+        binary: 바이너리 인코딩 사용 여부 (hello 핸드셰이크로 합의된 경우)
+
+    Returns:
+        헤더와 페이로드로 구성된 프레임 바이트
+    """
+    payload = _encode_binary(message) if binary else None
+    if payload is None:
+        payload = json.dumps(message, separators=(",", ":")).encode()
+    return HEADER.pack(len(payload)) + payload
+
+
+def choose_codec(offered: list[str]) -> str:
+    """상대가 제시한 인코딩 중 지원하는 첫 번째 인코딩 선택.
+
+    Args:
+        offered: hello 메시지로 받은 선호 순서의 인코딩 목록
+
+    Returns:
+        사용할 인코딩 이름 (공통 인코딩이 없으면 "json")
+    """
+    for codec in offered:
+        if codec in CODECS:
+            return codec
+    return "json"
+
+
+class FrameDecoder:
+    """길이 접두사 프레임의 점진적 디코더.
+
+    소켓에서 읽은 조각을 순서대로 넣으면 완성된 메시지를 모두 돌려주고,
+    아직 덜 도착한 프레임은 다음 읽기까지 버퍼에 보관.
+    TCP가 여러 메시지를 한 조각으로 합치거나 한 메시지를 나눠 보내도 안전.
+    JSON과 바이너리 페이로드는 첫 바이트로 구분하므로 섞여 와도 디코딩 가능.
+    """
+
+    def __init__(self, max_frame_size: int = MAX_FRAME_SIZE):
+        """디코더 초기화.
+
+        Args:
+            max_frame_size: 허용할 최대 페이로드 크기
+        """
+        self.max_frame_size = max_frame_size
+        self._buffer = bytearray()  # 아직 처리하지 않은 수신 바이트
+
+    def feed(self, data: bytes) -> list[dict]:
+        """수신한 바이트를 넣고 완성된 메시지 목록 반환.
+
+        JSON 페이로드는 UTF-8로 디코딩. ASCII뿐인 페이로드(encode_message가 보내는 경우)는
+        완성된 프레임 구간 전체를 한 번만 문자열로 변환한 뒤 제자리에서 파싱하므로 메시지마다 복사하지 않고,
+        ASCII 밖 바이트가 있는 페이로드만 따로 UTF-8로 디코딩.
+
+        Args:
+            data: 소켓에서 읽은 바이트
+
+        Returns:
+            이번 읽기로 완성된 메시지 딕셔너리 목록 (도착 순서)
+
+        Raises:
+            ValueError: 프레임 크기가 제한을 넘거나 페이로드가 잘못된 경우 (UTF-8이 아닌 JSON 포함)
+        """
+        buffer = self._buffer
+        buffer += data
+
+        # 완성된 프레임들의 페이로드 위치 수집
+        spans = []
+        pos = 0
+        end = len(buffer)
+        while end - pos >= HEADER.size:
+            (length,) = HEADER.unpack_from(buffer, pos)
+            if length > self.max_frame_size:
+                raise ValueError(f"프레임 크기 초과: {length}")
+            start = pos + HEADER.size
+            if end - start < length:
+                break  # 나머지는 다음 읽기에서 완성
+            spans.append((start, start + length))
+            pos = start + length
+
+        if not spans:
+            return []
+
+        messages = []
+        text = None
+        # 구간 전체가 ASCII면 프레임마다 확인하지 않음 (바이너리 페이로드나 128 이상 길이 헤더가 있으면 프레임별 확인)
+        ascii_only = buffer[:pos].isascii()
+        for start, stop in spans:
+            if stop > start and buffer[start] != _JSON_START:
+                # 바이너리 페이로드는 버퍼에서 바로 읽음
+                messages.append(_decode_binary(buffer, start, stop))
+                continue
+            if stop == start:
+                raise ValueError("빈 페이로드")
+            if ascii_only or _NON_ASCII.search(buffer, start, stop) is None:
+                if text is None:
+                    # latin-1은 바이트와 문자가 1:1로 대응하므로 오프셋을 그대로 사용 가능
+                    # (바이너리 페이로드와 헤더가 섞여 있어도 실패하지 않고, ASCII 구간은 UTF-8과 같은 문자)
+                    text = buffer[:pos].decode("latin-1")
+                message, index = _json_decoder.raw_decode(text, start)
+            else:
+                # 다른 구현이 ensure_ascii 없이 보낸 UTF-8 (문자 오프셋이 바이트 오프셋과 달라 프레임별로 변환)
+                payload = buffer[start:stop].decode("utf-8")
+                message, index = _json_decoder.raw_decode(payload)
+                start, stop = 0, len(payload)
+            if index != stop:
+                raise ValueError("프레임 길이와 페이로드가 일치하지 않음")
+            messages.append(message)
+        del buffer[:pos]
+        return messages
@@ -0,0 +1,224 @@
+import sys
+import unicodedata
+from functools import lru_cache
+
+from yacht_scoring import CATEGORIES, UPPER_BONUS_THRESHOLD, UPPER_CATEGORY_COUNT, score_all, total_score, upper_subtotal
+
+# 각 주사위 면의 ASCII 패턴 (5줄 × 7문자) - 모듈을 읽을 때 한 번만 만듦
+DICE_FACES = {
+    1: ("┌─────┐", "│     │", "│  ●  │", "│     │", "└─────┘"),
+    2: ("┌─────┐", "│ ●   │", "│     │", "│   ● │", "└─────┘"),
+    3: ("┌─────┐", "│ ●   │", "│  ●  │", "│   ● │", "└─────┘"),
+    4: ("┌─────┐", "│ ● ● │", "│     │", "│ ● ● │", "└─────┘"),
+    5: ("┌─────┐", "│ ● ● │", "│  ●  │", "│ ● ● │", "└─────┘"),
+    6: ("┌─────┐", "│ ● ● │", "│ ● ● │", "│ ● ● │", "└─────┘"),
+}
+DICE_HEIGHT = 5
+DICE_WIDTH = 7
+DICE_LABELS = " ".join(f"{i + 1:^{DICE_WIDTH}}" for i in range(5))  # 주사위 위에 표시할 번호 줄
+SHEET_WIDTH = 40  # 점수표 열 너비 (주사위는 그 오른쪽에 표시)
+NAME_WIDTH = 7  # 플레이어 점수 열 너비
+MESSAGE_LINES = 3  # 화면 아래쪽에 남겨 둘 최근 알림 줄 수
+CSI = "\x1b["
+
+
+@lru_cache(maxsize=None)
+def dice_rows(dice: tuple[int, ...]) -> tuple[str, ...]:
+    """주사위 조합의 ASCII art 줄 목록.
+
+    조합마다 한 번만 이어 붙이고 결과를 캐시 (순서 있는 조합은 최대 6^5가지).
+
+    Args:
+        dice: 1-6 범위의 주사위 값 튜플
+
+    Returns:
+        주사위 사이에 공백을 하나씩 둔 5줄
+    """
+    if not dice:
+        return ()
+    faces = [DICE_FACES[value] for value in dice]
+    return tuple(" ".join(face[row] for face in faces) for row in range(DICE_HEIGHT))
+
+
+def text_width(text: str) -> int:
+    """터미널에 표시되는 칸 수 (한글 등 전각 문자는 2칸)."""
+    if text.isascii():
+        return len(text)
+    return sum(2 if unicodedata.east_asian_width(ch) in "WF" else 1 for ch in text)
+
+
+def fit(text: str, width: int, right: bool = False) -> str:
+    """표시 너비가 정확히 width가 되도록 자르거나 공백으로 채움.
+
+    Args:
+        text: 표시할 문자열
+        width: 칸 수
+        right: 오른쪽 정렬 여부
+
+    Returns:
+        width칸을 차지하는 문자열
+    """
+    used = text_width(text)
+    while used > width:
+        text = text[:-1]
+        used = text_width(text)
+    padding = " " * (width - used)
+    return padding + text if right else text + padding
+
+
+def build_screen(game_state: dict | None, player_id: int | None, dice: list[int], rolls_left: int,
+                 choosing: bool, messages: list[str], prompt: str) -> list[str]:
+    """고정 배치의 게임 화면 줄 목록 생성.
+
+    제목, 점수표(왼쪽)와 주사위(오른쪽), 최근 알림, 입력 프롬프트가 항상 같은 줄에 오므로
+    이전 화면과 줄 단위로 비교하면 바뀐 칸만 찾을 수 있음.
+
+    Args:
+        game_state: 서버에서 받은 게임 상태 (None이면 게임 시작 전)
+        player_id: 본인 플레이어 ID
+        dice: 본인의 현재 주사위 (비어 있으면 표시하지 않음)
+        rolls_left: 남은 굴리기 횟수
+        choosing: 카테고리 선택 중이면 선택 가능한 항목에 번호 표시
+        messages: 최근 알림 (오래된 것부터)
+        prompt: 마지막 줄에 표시할 프롬프트
+
+    Returns:
+        화면 줄 목록 (항상 같은 줄 수)
+    """
+    players = game_state["players"] if game_state else []
+    if game_state is None:
+        title = "야추 - 게임 시작 대기중"
+    else:
+        current = game_state["current_player"]
+        turn = "당신" if current == player_id else players[current]["name"]
+        title = f"야추  라운드 {min(game_state['round'], len(CATEGORIES))}/{len(CATEGORIES)}  현재 턴: {turn}"
+        if player_id is not None:
+            title += f"  (플레이어 {player_id + 1})"
+
+    mine = players[player_id]["scores"] if players and player_id is not None else {}
+    preview = score_all(dice) if dice else None
+    numbers = {}
+    if choosing:
+        available = [c for c in CATEGORIES if c not in mine]
+        numbers = {c: i + 1 for i, c in enumerate(available)}
+
+    sheet = [fit("    카테고리", 19) + "".join(fit(("*" if game_state and i == game_state["current_player"] else "")
+                                                     + player["name"], NAME_WIDTH, right=True)
+                                                 for i, player in enumerate(players))
+             + (fit("예상", 6, right=True) if preview is not None else "")]
+    for index, category in enumerate(CATEGORIES):
+        number = f"{numbers[category]:>2}. " if category in numbers else "    "
+        row = number + fit(category, 15)
+        row += "".join(fit(str(player["scores"].get(category, "-")), NAME_WIDTH, right=True) for player in players)
+        if preview is not None and category not in mine:
+            row += fit(str(preview[index]), 6, right=True)
+        sheet.append(row)
+        if index == UPPER_CATEGORY_COUNT - 1:
+            sheet.append(fit("    상단 합계", 19) + "".join(
+                fit(f"{upper_subtotal(player['scores'])}/{UPPER_BONUS_THRESHOLD}", NAME_WIDTH, right=True)
+                for player in players))
+    sheet.append(fit("    총점", 19) + "".join(fit(str(total_score(player["scores"])), NAME_WIDTH, right=True)
+                                              for player in players))
+
+    side = [""] * len(sheet)
+    if dice:
+        side[0] = DICE_LABELS
+        side[1:1 + DICE_HEIGHT] = dice_rows(tuple(dice))
+        side[1 + DICE_HEIGHT] = f"남은 굴리기: {rolls_left}"
+
+    lines = [title, ""]
+    lines += [fit(row, SHEET_WIDTH) + extra if extra else row for row, extra in zip(sheet, side)]
+    lines.append("")
+    recent = messages[-MESSAGE_LINES:]
+    lines += [""] * (MESSAGE_LINES - len(recent)) + recent
+    lines.append(">>> " + prompt)
+    return lines
+
+
+class ScreenRenderer:
+    """이전에 그린 화면과 비교해 바뀐 칸만 다시 그리는 터미널 렌더러.
+
+    화면 전체를 지우고 다시 출력하는 대신 줄마다 이전 내용과 비교하고,
+    바뀐 줄은 앞뒤 공통 부분을 뺀 구간만 ANSI 커서 이동 후 덮어씀.
+    """
+
+    def __init__(self, stream=None):
+        """렌더러 초기화. 첫 draw에서 화면을 지우고 전체를 그림.
+
+        Args:
+            stream: 출력 스트림 (None이면 sys.stdout)
+        """
+        self.stream = stream or sys.stdout
+        self.lines: list[str | None] | None = None  # 마지막으로 그린 줄 (None인 줄은 내용을 모름)
+
+    def touch(self, row: int) -> None:
+        """화면 밖에서 바뀐 줄 (입력 에코 등) - 다음 draw에서 줄 전체를 다시 그림."""
+        if self.lines is not None and row < len(self.lines):
+            self.lines[row] = None
+
+    def draw(self, lines: list[str], cursor_row: int) -> None:
+        """바뀐 부분만 출력.
+
+        커서 줄이 바뀌지 않았으면 사용자가 입력 중인 위치를 지키도록 커서를 저장했다가 복원하고,
+        바뀌었으면 그 줄 끝으로 커서를 옮김.
+
+        Args:
+            lines: 새 화면 줄 목록
+            cursor_row: 입력 커서를 둘 줄 번호
+        """
+        out = []
+        previous = self.lines
+        if previous is None:
+            out.append(f"{CSI}H{CSI}2J")
+            previous = []
+        for row, line in enumerate(lines):
+            old = previous[row] if row < len(previous) else None
+            if line != old:
+                out.append(self._patch(row, old, line))
+        for row in range(len(lines), len(previous)):
+            out.append(f"{CSI}{row + 1};1H{CSI}K")
+        self.lines = list(lines)
+        if not out:
+            return
+        if cursor_row < len(previous) and previous[cursor_row] == lines[cursor_row]:
+            out = ["\x1b7", *out, "\x1b8"]
+        else:
+            out.append(f"{CSI}{cursor_row + 1};{text_width(lines[cursor_row]) + 1}H")
+        self.stream.write("".join(out))
+        self.stream.flush()
+
+    def close(self) -> None:
+        """그린 화면 아래로 커서를 옮겨 이후 일반 출력이 화면을 덮지 않도록 함."""
+        if self.lines is not None:
+            self.stream.write(f"{CSI}{len(self.lines) + 1};1H{CSI}J")
+            self.stream.flush()
+            self.lines = None
+
+    @staticmethod
+    def _patch(row: int, old: str | None, new: str) -> str:
+        """줄 하나를 old에서 new로 바꾸는 출력.
+
+        Args:
+            row: 줄 번호 (0부터)
+            old: 화면에 있는 내용 (None이면 모름)
+            new: 새 내용
+
+        Returns:
+            커서 이동과 덮어쓸 문자열
+        """
+        if old is None:
+            return f"{CSI}{row + 1};1H{new}{CSI}K"
+        limit = min(len(old), len(new))
+        start = 0
+        while start < limit and old[start] == new[start]:
+            start += 1
+        end = 0
+        while end < limit - start and old[-1 - end] == new[-1 - end]:
+            end += 1
+        old_part = old[start:len(old) - end]
+        new_part = new[start:len(new) - end]
+        column = text_width(new[:start]) + 1
+        if text_width(old_part) == text_width(new_part):
+            # 같은 너비의 구간만 바뀜 - 그 칸만 덮어씀
+            return f"{CSI}{row + 1};{column}H{new_part}"
+        return f"{CSI}{row + 1};{column}H{new[start:]}{CSI}K"
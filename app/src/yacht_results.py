@@ -0,0 +1,388 @@
+import argparse
+import json
+import sqlite3
+import threading
+import time
+from array import array
+from collections import Counter
+
+from yacht_log import logger
+from yacht_scoring import CATEGORIES, UPPER_BONUS_THRESHOLD
+from yacht_state import GameState
+
+RESULTS_FILE = "results.db"
+BOARDS = {"wins": "wins", "best": "best_score", "mean": "mean_score"}  # 순위 기준 → 정렬 컬럼 (모두 인덱스)
+MIN_MEAN_GAMES = 10  # 평균 점수 순위에 들어가기 위한 최소 완료 게임 수
+MAX_LEADERBOARD = 100  # 한 번에 돌려줄 수 있는 순위 수
+QUERY_TYPES = ("leaderboard_request", "player_stats_request")  # 게임 진행과 관계없이 답하는 조회 요청
+CATEGORY_COLUMNS = [f"sum_{category}" for category in CATEGORIES]  # 카테고리별 점수 합계 (완료 게임만)
+PLAYER_COLUMNS = ["name", "games", "wins", "scored", "total_score", "best_score", "mean_score", "bonuses",
+                  *CATEGORY_COLUMNS]
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    finished_at REAL NOT NULL,
+    room INTEGER NOT NULL,
+    seed INTEGER,
+    winner INTEGER NOT NULL,
+    forfeit INTEGER,
+    name0 TEXT,
+    name1 TEXT,
+    score0 INTEGER NOT NULL,
+    score1 INTEGER NOT NULL,
+    sheet0 BLOB NOT NULL,
+    sheet1 BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS players (
+    name TEXT PRIMARY KEY,
+    games INTEGER NOT NULL,  -- 기권 포함 게임 수 (scored는 끝까지 진행한 게임 수)
+    wins INTEGER NOT NULL,
+    scored INTEGER NOT NULL,
+    total_score INTEGER NOT NULL,
+    best_score INTEGER NOT NULL,
+    mean_score REAL NOT NULL,  -- 0.1점 단위로 반올림 (순위 분포의 값 개수를 줄임)
+    bonuses INTEGER NOT NULL,
+    {", ".join(f"{column} INTEGER NOT NULL" for column in CATEGORY_COLUMNS)}
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS players_wins ON players (wins DESC, name);
+CREATE INDEX IF NOT EXISTS players_best ON players (best_score DESC, name);
+CREATE INDEX IF NOT EXISTS players_mean ON players (mean_score DESC, name) WHERE scored >= {MIN_MEAN_GAMES};
+CREATE TABLE IF NOT EXISTS ranks (
+    board TEXT NOT NULL,
+    value INTEGER NOT NULL,
+    players INTEGER NOT NULL,
+    PRIMARY KEY (board, value)
+) WITHOUT ROWID;
+"""
+
+# 배치 하나의 플레이어별 증가분을 기존 집계에 더함 (SET의 컬럼은 갱신 전 값)
+UPSERT = f"""
+INSERT INTO players ({", ".join(PLAYER_COLUMNS)})
+VALUES ({", ".join("?" * len(PLAYER_COLUMNS))})
+ON CONFLICT (name) DO UPDATE SET
+    games = games + excluded.games,
+    wins = wins + excluded.wins,
+    scored = scored + excluded.scored,
+    total_score = total_score + excluded.total_score,
+    best_score = max(best_score, excluded.best_score),
+    mean_score = round(CAST(total_score + excluded.total_score AS REAL) / max(scored + excluded.scored, 1), 1),
+    bonuses = bonuses + excluded.bonuses,
+    {", ".join(f"{column} = {column} + excluded.{column}" for column in CATEGORY_COLUMNS)}
+"""
+
+# 순위 기준별 값 → 그 값을 가진 플레이어 수 (순위 = 더 높은 값의 플레이어 수 합 + 1)
+UPDATE_RANKS = """
+INSERT INTO ranks (board, value, players) VALUES (?, ?, ?)
+ON CONFLICT (board, value) DO UPDATE SET players = players + excluded.players
+"""
+
+INSERT_GAME = """
+INSERT INTO games (finished_at, room, seed, winner, forfeit, name0, name1, score0, score1, sheet0, sheet1)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+class ResultStore:
+    """끝난 게임과 플레이어별 누적 통계를 담는 SQLite 저장소.
+
+    게임 결과는 메모리 버퍼에 넣기만 하고, 전용 스레드가 모아서 한 트랜잭션으로
+    게임 행 추가와 플레이어 집계 갱신(배치 안에서 먼저 합친 뒤 이름당 한 번의 upsert)을 수행.
+    조회는 게임 기록을 훑지 않고 집계만 사용 - 상위 N명은 정렬 인덱스로 O(log 플레이어 수 + N),
+    순위 하나는 기준별 값 분포(값 → 플레이어 수)에서 더 높은 값의 인원을 더해 계산하므로
+    플레이어가 많아도 서로 다른 값의 개수(승수, 최고 점수 0-375, 평균 점수 0.1 단위)만큼만 읽음.
+
+    플레이어는 클라이언트가 join으로 밝힌 이름으로만 구분하고 인증하지 않으므로
+    같은 이름을 쓰는 누구나 그 이름의 통계에 게임을 더할 수 있음 (친선 순위표 용도).
+    두 자리가 같은 이름인 게임은 게임 기록에만 남기고 집계하지 않음.
+    """
+
+    def __init__(self, path: str, commit_delay: float = 0.1):
+        """데이터베이스를 열고(없으면 생성) 쓰기 스레드 시작.
+
+        Args:
+            path: SQLite 파일 경로
+            commit_delay: 첫 결과가 들어온 뒤 묶음을 모으며 기다릴 시간(초)
+        """
+        self.path = path
+        self.commit_delay = commit_delay
+        writer = self._open(check_same_thread=False)  # 스키마를 만든 뒤에는 쓰기 스레드만 사용
+        writer.executescript(SCHEMA)
+        # 조회는 호출한 쪽 스레드에서 (서버는 이벤트 루프 또는 방 잠금 아래에서만 조회하므로 직렬화됨)
+        self._reader = self._open(check_same_thread=False)
+        self._cache: dict[tuple, tuple[int, list[dict]]] = {}  # (기준, 개수) → (data_version, 순위 목록)
+        self._buffer: list[tuple] = []
+        self._closed = False
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._run, args=(writer,), name="yacht-results", daemon=True)
+        self._thread.start()
+
+    def _open(self, check_same_thread: bool = True) -> sqlite3.Connection:
+        """WAL 모드 연결 생성 (쓰는 동안에도 조회가 막히지 않음, 여러 워커 프로세스가 같은 파일 공유)."""
+        connection = sqlite3.connect(self.path, timeout=10.0, isolation_level=None,
+                                     check_same_thread=check_same_thread)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")  # 전원 장애 시 마지막 커밋 몇 개만 유실 가능
+        return connection
+
+    def record(self, room_id: int, state: GameState, winner: int, scores: list[int],
+               names: tuple[str | None, str | None], seed: int | None = None, forfeit: int | None = None) -> None:
+        """끝난 게임 하나를 기록 대기열에 추가 (디스크는 기다리지 않음).
+
+        Args:
+            room_id: 방 번호
+            state: 끝난 게임 상태 (점수표)
+            winner: 승자 플레이어 ID
+            scores: 상단 보너스를 포함한 플레이어별 총점
+            names: 집계에 사용할 플레이어 이름 - 클라이언트가 밝힌 이름 그대로이며 검증하지 않음
+                (None이거나 두 이름이 같으면 게임만 기록하고 집계하지 않음)
+            seed: 방의 주사위 시드 (암호학적 난수면 None)
+            forfeit: 기권한 플레이어 ID (기권으로 끝난 게임은 점수 통계에서 제외)
+        """
+        sheets = [player.scores.tobytes() for player in state.players]
+        bonuses = [player.upper >= UPPER_BONUS_THRESHOLD for player in state.players]
+        with self._cond:
+            if not self._buffer:
+                self._cond.notify()  # 쓰기 스레드는 버퍼가 비어 있을 때만 대기 중
+            self._buffer.append((time.time(), room_id, seed, winner, forfeit, names, scores, sheets, bonuses))
+
+    def close(self) -> None:
+        """남은 결과를 모두 기록하고 쓰기 스레드 종료."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._thread.join()
+        self._reader.close()
+
+    def _run(self, writer: sqlite3.Connection) -> None:
+        """쓰기 스레드 - 쌓인 결과를 묶어서 한 트랜잭션으로 기록."""
+        while True:
+            with self._cond:
+                while not self._buffer and not self._closed:
+                    self._cond.wait()
+                if not self._closed and self.commit_delay:
+                    self._cond.wait(self.commit_delay)
+                batch, self._buffer = self._buffer, []
+                closed = self._closed
+            if batch:
+                self._write(writer, batch)
+            if closed and not batch:
+                writer.close()
+                return
+
+    def _write(self, writer: sqlite3.Connection, batch: list[tuple]) -> None:
+        """결과 묶음 하나를 기록하고 플레이어 집계를 증가분만큼 갱신.
+
+        Args:
+            writer: 쓰기 스레드 전용 연결
+            batch: record가 쌓은 결과 목록
+        """
+        games = []
+        totals: dict[str, list] = {}  # 이름 → UPSERT 인자 (배치 안에서 먼저 합산)
+        for finished_at, room_id, seed, winner, forfeit, names, scores, sheets, bonuses in batch:
+            games.append((finished_at, room_id, seed, winner, forfeit, *names, *scores, *sheets))
+            if names[0] == names[1]:
+                continue  # 한 사람이 두 자리를 모두 차지한 게임은 승패 없이 한 행에 두 번 더해지므로 제외
+            for player_id, name in enumerate(names):
+                if name is None:
+                    continue
+                row = totals.get(name)
+                if row is None:
+                    row = totals[name] = [name, 0, 0, 0, 0, 0, 0.0, 0] + [0] * len(CATEGORIES)
+                row[1] += 1
+                row[2] += winner == player_id
+                if forfeit is not None:
+                    continue  # 다 채우지 못한 점수표는 평균과 카테고리 통계를 왜곡
+                row[3] += 1
+                row[4] += scores[player_id]
+                row[5] = max(row[5], scores[player_id])
+                row[6] = round(row[4] / row[3], 1)
+                row[7] += bonuses[player_id]
+                for i, value in enumerate(array("h", sheets[player_id])):
+                    row[8 + i] += value
+        try:
+            writer.execute("BEGIN IMMEDIATE")
+            try:
+                writer.executemany(INSERT_GAME, games)
+                before = [rank_values(writer, name) for name in totals]
+                writer.executemany(UPSERT, totals.values())
+                # 순위 분포에서 바뀐 플레이어의 이전 값을 빼고 새 값을 더함
+                changes = Counter()
+                for name, old in zip(totals, before):
+                    for key in old:
+                        changes[key] -= 1
+                    for key in rank_values(writer, name):
+                        changes[key] += 1
+                changes = [(board, value, delta) for (board, value), delta in changes.items() if delta]
+                writer.executemany(UPDATE_RANKS, changes)
+                writer.executemany("DELETE FROM ranks WHERE board = ? AND value = ? AND players = 0",
+                                   [(board, value) for board, value, delta in changes if delta < 0])
+                writer.execute("COMMIT")
+            except BaseException:
+                writer.execute("ROLLBACK")
+                raise
+        except sqlite3.Error as e:
+            # 디스크 문제 등으로 실패해도 쓰기 스레드는 계속 (게임 진행에는 영향 없음)
+            logger.error("결과 기록 실패", games=len(games), error=e)
+
+    def leaderboard(self, by: str = "wins", limit: int = 10) -> list[dict]:
+        """순위표 상위 limit명.
+
+        같은 조건의 결과는 다음 커밋 전까지 캐시하므로 여러 클라이언트가 반복 요청해도 한 번만 조회.
+        커밋 여부는 SQLite data_version으로 확인하므로 같은 파일을 쓰는 다른 워커 프로세스의 커밋도 반영.
+
+        Args:
+            by: 순위 기준 ("wins", "best", "mean" - mean은 완료 게임 MIN_MEAN_GAMES판 이상만)
+            limit: 돌려줄 순위 수 (최대 MAX_LEADERBOARD)
+
+        Returns:
+            순위(동점이면 같은 순위)와 통계를 담은 딕셔너리 목록
+
+        Raises:
+            ValueError: 알 수 없는 순위 기준
+        """
+        column = BOARDS.get(by)
+        if column is None:
+            raise ValueError(f"알 수 없는 순위 기준: {by} ({', '.join(BOARDS)})")
+        limit = max(1, min(limit, MAX_LEADERBOARD))
+        version = self._reader.execute("PRAGMA data_version").fetchone()[0]
+        cached = self._cache.get((by, limit))
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        where = f"WHERE scored >= {MIN_MEAN_GAMES}" if by == "mean" else ""
+        rows = self._reader.execute(
+            f"SELECT * FROM players INDEXED BY players_{by} {where} ORDER BY {column} DESC, name LIMIT ?",
+            (limit,)).fetchall()
+        index = PLAYER_COLUMNS.index(column)
+        entries = []
+        for i, row in enumerate(rows):
+            entry = self._summary(row)
+            # 동점이면 앞 사람과 같은 순위 (rank와 같은 규칙)
+            entry["rank"] = entries[-1]["rank"] if i and row[index] == rows[i - 1][index] else i + 1
+            entries.append(entry)
+        self._cache[(by, limit)] = (version, entries)
+        return entries
+
+    def player(self, name: str) -> dict | None:
+        """플레이어 한 명의 누적 통계와 기준별 순위.
+
+        Args:
+            name: 플레이어 이름
+
+        Returns:
+            통계 딕셔너리 (카테고리별 평균, 기준별 순위 포함), 기록이 없으면 None
+        """
+        row = self._reader.execute("SELECT * FROM players WHERE name = ?", (name,)).fetchone()
+        if row is None:
+            return None
+        stats = self._summary(row)
+        scored = row[3]
+        stats["category_means"] = {category: round(row[8 + i] / scored, 2) if scored else 0.0
+                                   for i, category in enumerate(CATEGORIES)}
+        stats["rank"] = {by: self.rank(by, row) for by in BOARDS}
+        return stats
+
+    def rank(self, by: str, row: tuple) -> int | None:
+        """players 행 하나의 기준별 순위 (더 높은 값을 가진 플레이어 수 + 1, 순위 분포 테이블 사용).
+
+        Args:
+            by: 순위 기준
+            row: players 테이블 행
+
+        Returns:
+            순위, 평균 점수 순위 조건(완료 게임 수)을 채우지 못했으면 None
+        """
+        value = rank_value(by, row)
+        if value is None:
+            return None
+        query = "SELECT total(players) FROM ranks WHERE board = ? AND value > ?"
+        return int(self._reader.execute(query, (by, value)).fetchone()[0]) + 1
+
+    @staticmethod
+    def _summary(row: tuple) -> dict:
+        """players 행을 응답용 요약 통계로 변환."""
+        name, games, wins, scored, _, best, mean, bonuses = row[:8]
+        return {"name": name, "games": games, "wins": wins, "win_rate": round(wins / games, 4),
+                "mean": mean, "best": best, "bonus_rate": round(bonuses / scored, 4) if scored else 0.0}
+
+
+def rank_value(by: str, row: tuple) -> int | None:
+    """players 행의 순위 분포 테이블 값 (평균 점수는 0.1 단위 정수).
+
+    Args:
+        by: 순위 기준
+        row: players 테이블 행
+
+    Returns:
+        분포 테이블의 값, 평균 점수 순위 조건(완료 게임 수)을 채우지 못했으면 None
+    """
+    if by == "mean":
+        return round(row[6] * 10) if row[3] >= MIN_MEAN_GAMES else None
+    return row[PLAYER_COLUMNS.index(BOARDS[by])]
+
+
+def rank_values(connection: sqlite3.Connection, name: str) -> list[tuple[str, int]]:
+    """플레이어가 현재 순위 분포 테이블에서 차지하는 (기준, 값) 목록 (기록이 없으면 빈 목록)."""
+    row = connection.execute("SELECT * FROM players WHERE name = ?", (name,)).fetchone()
+    if row is None:
+        return []
+    return [(by, value) for by in BOARDS if (value := rank_value(by, row)) is not None]
+
+
+def answer_query(store: ResultStore | None, message: dict, name: str | None = None) -> dict:
+    """순위표 / 플레이어 통계 조회 요청에 대한 응답 메시지.
+
+    잘못된 기준이나 개수는 오류로 처리하지 않고 기본값으로 대체.
+
+    Args:
+        store: 결과 저장소 (None이면 사용 불가로 응답)
+        message: leaderboard_request 또는 player_stats_request 메시지
+        name: 이름을 생략한 통계 요청에 사용할 요청자 이름
+
+    Returns:
+        leaderboard 또는 player_stats 메시지
+    """
+    data = message["data"]
+    if message["type"] == "leaderboard_request":
+        if store is None:
+            return {"type": "leaderboard", "data": {"available": False}}
+        by = data.get("by") if data.get("by") in BOARDS else "wins"
+        limit = data.get("limit")
+        limit = limit if isinstance(limit, int) else 10
+        return {"type": "leaderboard", "data": {"available": True, "by": by, "entries": store.leaderboard(by, limit)}}
+
+    name = data.get("name") if isinstance(data.get("name"), str) else name
+    if store is None or name is None:
+        return {"type": "player_stats", "data": {"available": False}}
+    stats = store.player(name)
+    return {"type": "player_stats", "data": {"available": True, "name": name, "found": stats is not None,
+                                             **(stats or {})}}
+
+
+def print_leaderboard(entries: list[dict]) -> None:
+    """순위표를 표 형태로 출력."""
+    print("순위  이름" + " " * 12 + "    게임      승    승률    평균  최고")  # 한글은 2칸이라 직접 정렬
+    for entry in entries:
+        print(f"{entry['rank']:>4}  {entry['name']:<16}{entry['games']:>8}{entry['wins']:>8}"
+              f"{entry['win_rate']:>8.1%}{entry['mean']:>8.1f}{entry['best']:>6}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="야추 순위표와 플레이어 통계 조회")
+    parser.add_argument("path", help="서버의 --results 파일")
+    parser.add_argument("--by", choices=BOARDS, default="wins", help="순위 기준 (기본: wins)")
+    parser.add_argument("--top", type=int, default=10, help="출력할 순위 수")
+    parser.add_argument("--player", help="지정한 플레이어의 통계와 순위를 JSON으로 출력")
+    args = parser.parse_args()
+
+    store = ResultStore(args.path)
+    started = time.perf_counter()
+    if args.player is not None:
+        stats = store.player(args.player)
+        if stats is None:
+            parser.exit(1, f"플레이어 {args.player} 기록 없음\n")
+        print(json.dumps(stats, ensure_ascii=False, indent=2))
+    else:
+        print_leaderboard(store.leaderboard(args.by, args.top))
+    print(f"조회 시간: {(time.perf_counter() - started) * 1000:.2f}ms")
+    store.close()
@@ -0,0 +1,97 @@
+import os
+import secrets
+
+import numpy as np
+
+BLOCK_BYTES = 512  # 한 번에 미리 뽑아 둘 난수 바이트 수 (주사위 약 500개 - 한 게임은 최대 390개 사용)
+SECURE_SEED = 0  # 암호학적 난수를 쓰는 방의 시드 기록값 (재현 불가 - 주사위는 게임 기록에만 남음)
+SEED_MASK = 0xFFFFFFFF  # 시드는 32비트 (게임 시작 레코드에 함께 기록)
+ACCEPT_BELOW = 252  # 6의 배수 중 256 이하 최대값 - 이 값 이상인 바이트는 버려야 눈이 균등
+
+
+def derive_seed(base: int | None, key: int) -> int:
+    """기준 시드와 방 번호 등으로 방마다 다른 32비트 시드 생성.
+
+    Args:
+        base: 서버 기준 시드 (None이면 운영체제 난수로 새 시드)
+        key: 방 번호 또는 워커 번호
+
+    Returns:
+        1 이상의 시드 (0은 SECURE_SEED로 예약)
+    """
+    if base is None:
+        seed = secrets.randbits(32)
+    else:
+        # SeedSequence로 섞어 인접한 방 번호끼리도 상관없는 시드가 되도록
+        seed = int(np.random.SeedSequence((base & SEED_MASK, key)).generate_state(1)[0])
+    return seed or 1
+
+
+def bytes_to_dice(raw: np.ndarray) -> list[int]:
+    """난수 바이트 배열을 1-6 주사위 값으로 변환.
+
+    252 이상인 바이트는 버리므로 나머지 연산의 편향이 없음.
+
+    Args:
+        raw: uint8 배열
+
+    Returns:
+        주사위 값 리스트
+    """
+    raw = raw[raw < ACCEPT_BELOW]
+    return (raw % 6 + 1).tolist()
+
+
+class DiceRNG:
+    """방 하나의 주사위 난수 생성기.
+
+    주사위를 하나씩 뽑지 않고 BLOCK_BYTES만큼의 난수를 NumPy로 한 번에 주사위 값으로 바꿔 두고
+    굴릴 때마다 필요한 개수만 잘라 씀. 같은 시드면 플랫폼과 NumPy 버전에 관계없이
+    같은 순서의 주사위가 나옴 (PCG64 원시 출력을 리틀 엔디언 바이트로 사용).
+    """
+
+    __slots__ = ("seed", "drawn", "_generator", "_block", "_pos")
+
+    def __init__(self, seed: int = SECURE_SEED):
+        """생성기 초기화.
+
+        Args:
+            seed: 32비트 시드 (SECURE_SEED면 os.urandom 사용)
+        """
+        self.seed = seed
+        self.drawn = 0  # 지금까지 꺼낸 주사위 수
+        self._generator = None if seed == SECURE_SEED else np.random.PCG64(seed)
+        self._block: list[int] = []
+        self._pos = 0
+
+    @property
+    def secure(self) -> bool:
+        """암호학적 난수원을 쓰는지 여부."""
+        return self._generator is None
+
+    def roll(self, count: int = 5) -> list[int]:
+        """주사위 count개 굴림.
+
+        Args:
+            count: 굴릴 주사위 수
+
+        Returns:
+            1-6 범위의 주사위 값 리스트
+        """
+        end = self._pos + count
+        while end > len(self._block):
+            self._refill()
+            end = self._pos + count
+        dice = self._block[self._pos:end]
+        self._pos = end
+        self.drawn += count
+        return dice
+
+    def _refill(self) -> None:
+        """남은 값 뒤에 새 블록을 이어 붙임."""
+        if self._generator is None:
+            raw = np.frombuffer(os.urandom(BLOCK_BYTES), dtype=np.uint8)
+        else:
+            raw = self._generator.random_raw(BLOCK_BYTES // 8).astype("<u8").view(np.uint8)
+        self._block = self._block[self._pos:] + bytes_to_dice(raw)
+        self._pos = 0
@@ -0,0 +1,148 @@
+import itertools
+
+import numpy as np
+
+# 야추 게임의 13개 카테고리 정의 (순서가 점수표의 열 인덱스)
+CATEGORIES = (
+    "ones", "twos", "threes", "fours", "fives", "sixes",
+    "three_of_kind", "four_of_kind", "full_house",
+    "small_straight", "large_straight", "yacht", "chance"
+)
+CATEGORY_INDEX = {name: i for i, name in enumerate(CATEGORIES)}
+UPPER_CATEGORY_COUNT = 6  # 상단 항목 (ones ~ sixes) 개수
+UPPER_BONUS_THRESHOLD = 63  # 상단 보너스 기준 점수 (각 숫자 3개씩)
+UPPER_BONUS = 35  # 상단 합계가 기준 이상일 때 추가 점수
+
+# 주사위 5개를 정렬한 조합 252가지 (순서 무관 중복 조합)
+MULTISETS = tuple(itertools.combinations_with_replacement(range(1, 7), 5))
+MULTISET_INDEX = {multiset: i for i, multiset in enumerate(MULTISETS)}
+
+# 순서 있는 굴림 결과를 0-7775 인덱스로 바꾸기 위한 자릿값 (6진법)
+_PLACE = np.array([6 ** 4, 6 ** 3, 6 ** 2, 6, 1], dtype=np.int64)
+
+
+def _score_multiset(dice: tuple) -> tuple[int, ...]:
+    """정렬된 주사위 조합의 13개 카테고리 점수 계산.
+
+    점수 규칙을 정의하는 유일한 구현으로, 모듈 로드 시 점수표를 만들 때만 호출.
+
+    Args:
+        dice: 정렬된 5개 주사위 값
+
+    Returns:
+        CATEGORIES 순서의 점수 튜플
+    """
+    # 각 숫자(1-6)의 개수 (인덱스 0은 미사용)
+    counts = [0] * 7
+    for d in dice:
+        counts[d] += 1
+    total = sum(dice)
+    most = max(counts)
+
+    # 숫자 카테고리 (1-6): 해당 숫자의 개수 × 숫자 값
+    upper = [counts[num] * num for num in range(1, 7)]
+    # 연속된 4개 숫자 (1234, 2345, 3456) 존재 여부
+    small = any(all(counts[i] > 0 for i in range(start, start + 4)) for start in (1, 2, 3))
+    # 연속된 5개 숫자 (12345, 23456) 여부
+    large = counts[1:6] == [1, 1, 1, 1, 1] or counts[2:7] == [1, 1, 1, 1, 1]
+
+    return (*upper,
+            total if most >= 3 else 0,  # three_of_kind: 같은 숫자 3개 이상 시 모든 주사위 합
+            total if most >= 4 else 0,  # four_of_kind: 같은 숫자 4개 이상 시 모든 주사위 합
+            25 if (3 in counts and 2 in counts) else 0,  # full_house: 3개 + 2개 조합 시 25점
+            30 if small else 0,  # small_straight: 30점 고정
+            40 if large else 0,  # large_straight: 40점 고정
+            50 if most == 5 else 0,  # yacht: 같은 숫자 5개 시 50점
+            total)  # chance: 모든 주사위 합
+
+
+# 조합 × 카테고리 점수표 (252 × 13)
+SCORE_TABLE = np.array([_score_multiset(m) for m in MULTISETS], dtype=np.int16)
+SCORE_TABLE.setflags(write=False)
+
+# 순서 있는 굴림 결과 7776가지 → 조합 인덱스, 점수 튜플
+ROLL_TO_MULTISET = np.empty(6 ** 5, dtype=np.int16)
+_ROLL_SCORES: dict[tuple, tuple[int, ...]] = {}
+for _roll in itertools.product(range(1, 7), repeat=5):
+    _index = MULTISET_INDEX[tuple(sorted(_roll))]
+    ROLL_TO_MULTISET[sum((d - 1) * p for d, p in zip(_roll, _PLACE.tolist()))] = _index
+    _ROLL_SCORES[_roll] = tuple(SCORE_TABLE[_index].tolist())
+ROLL_TO_MULTISET.setflags(write=False)
+
+
+def score(dice: list[int], category: str) -> int:
+    """주사위 결과와 카테고리에 따른 점수를 점수표에서 조회.
+
+    Args:
+        dice: 5개 주사위 값의 리스트
+        category: 점수를 계산할 카테고리명
+
+    Returns:
+        계산된 점수 (알 수 없는 카테고리는 0)
+    """
+    index = CATEGORY_INDEX.get(category)
+    if index is None:
+        return 0
+    return _ROLL_SCORES[tuple(dice)][index]
+
+
+def score_all(dice: list[int]) -> tuple[int, ...]:
+    """주사위 결과의 13개 카테고리 점수를 한 번에 조회.
+
+    Args:
+        dice: 5개 주사위 값의 리스트
+
+    Returns:
+        CATEGORIES 순서의 점수 튜플
+    """
+    return _ROLL_SCORES[tuple(dice)]
+
+
+def multiset_indices(rolls: np.ndarray) -> np.ndarray:
+    """여러 굴림 결과를 조합 인덱스로 일괄 변환.
+
+    Args:
+        rolls: (N, 5) 크기의 1-6 정수 배열
+
+    Returns:
+        (N,) 크기의 조합 인덱스 배열 (SCORE_TABLE의 행 번호)
+    """
+    rolls = np.asarray(rolls)
+    return ROLL_TO_MULTISET[(rolls - 1) @ _PLACE]
+
+
+def score_batch(rolls: np.ndarray) -> np.ndarray:
+    """여러 굴림 결과의 모든 카테고리 점수를 일괄 계산.
+
+    Args:
+        rolls: (N, 5) 크기의 1-6 정수 배열
+
+    Returns:
+        (N, 13) 크기의 점수 행렬 (열 순서는 CATEGORIES)
+    """
+    return SCORE_TABLE[multiset_indices(rolls)]
+
+
+def upper_subtotal(scores: dict) -> int:
+    """기록된 점수에서 상단 항목 합계 계산.
+
+    Args:
+        scores: 카테고리명 → 점수 딕셔너리
+
+    Returns:
+        ones ~ sixes 점수의 합
+    """
+    return sum(scores.get(c, 0) for c in CATEGORIES[:UPPER_CATEGORY_COUNT])
+
+
+def total_score(scores: dict) -> int:
+    """상단 보너스를 포함한 총점 계산.
+
+    Args:
+        scores: 카테고리명 → 점수 딕셔너리
+
+    Returns:
+        기록된 점수 합계 + 상단 보너스
+    """
+    bonus = UPPER_BONUS if upper_subtotal(scores) >= UPPER_BONUS_THRESHOLD else 0
+    return sum(scores.values()) + bonus
@@ -1,175 +1,240 @@
+import argparse
+import queue
+import select
 import socket
-import json
 import threading
-import random
 import time
+from collections import deque
 
+from yacht_protocol import FrameDecoder, ack_message, choose_codec, encode_message, error_message
+from yacht_scoring import CATEGORIES, CATEGORY_INDEX, UPPER_BONUS_THRESHOLD, score, score_all
+from yacht_engine import YachtEngine
+from yacht_lobby import MAX_NAME_LENGTH
+from yacht_log import DEBUG, ERROR, INFO, LEVELS, WARNING, logger
+from yacht_metrics import message_label, metrics, serve_in_thread
+from yacht_results import QUERY_TYPES, ResultStore, answer_query
+from yacht_rng import DiceRNG, derive_seed
+from yacht_solver import load_strategy
+from yacht_state import GameState
+from yacht_timer import Timer, TimerWheel
+from yacht_trace import add_trace_arguments, profiler, start_tracing, stop_tracing, trace_options, tracer
+from yacht_transport import Endpoint, parse_endpoints
 
-class YachtServer:
-    """야추 게임 서버 클래스.
-    
-    최대 2명의 플레이어가 참여할 수 있는 야추 게임 서버를 관리.
-    소켓 통신을 통해 클라이언트와 연결하고 게임 로직을 처리.
+HISTORY_SIZE = 64  # 재접속 시 다시 보낼 수 있도록 방마다 보관하는 최근 메시지 수
+TURN_TIMEOUT = 60.0  # 한 턴의 제한 시간(초) - 넘기면 서버가 대신 굴리고 기록
+TIMEOUT_FORFEIT = 3  # 이 횟수만큼 연속으로 시간을 넘기면 기권 처리
+IDLE_TIMEOUT = 600.0  # 아무 메시지도 보내지 않는 연결을 끊기까지의 시간(초)
+
+
+class YachtRoom:
+    """야추 게임 방 클래스.
+
+    한 게임의 통신(메시지 전송, 순번, 재전송)과 기록을 담당하고, 규칙 처리는 YachtEngine에 맡김.
+    방마다 독립된 게임 상태와 참가 클라이언트 목록을 가지므로
+    하나의 프로세스에서 여러 게임을 동시에 진행할 수 있음.
     """
-    
-    def __init__(self):
-        """서버 초기화.
-        
+
+    def __init__(self, room_id: int = 0, rng: DiceRNG | None = None):
+        """방 초기화.
+
         게임 상태, 플레이어 정보, 카테고리 목록을 초기화.
+
+        Args:
+            room_id: 방 식별 번호
+            rng: 방 전용 주사위 생성기 (None이면 새 시드로 생성)
         """
+        self.room_id = room_id
+        # 규칙 상태 기계 - 주사위 시드는 게임 기록과 game_end에 남김
+        self.engine = YachtEngine(GameState(), rng or DiceRNG(derive_seed(None, room_id)))
         self.clients = []  # 연결된 클라이언트 소켓 목록
-        self.game_state = {
-            "current_player": 0,  # 현재 턴 플레이어 인덱스 (0 또는 1)
-            "players": [
-                {"name": "Player1", "scores": {}, "turn_data": {}},
-                {"name": "Player2", "scores": {}, "turn_data": {}}
-            ],
-            "round": 1,  # 현재 라운드 (미사용)
-            "game_over": False  # 게임 종료 플래그
-        }
+        self.binary_clients = set()  # hello 핸드셰이크로 바이너리 인코딩을 합의한 클라이언트
+        self.outbox: dict | None = None  # 요청 하나를 처리하는 동안 클라이언트별로 모아 둔 전송 데이터 (None이면 즉시 전송)
+        self.journal = None  # 굴림과 점수 기록을 남길 Journal (복구용, 선택)
+        self.results = None  # 끝난 게임과 플레이어 통계를 남길 ResultStore (순위표용, 선택)
+        self.names: list[str | None] = [None, None]  # 순위표에 기록할 이름 (join으로 이름을 밝힌 플레이어만)
+        self.seq = 0  # 마지막으로 보낸 메시지의 순번
+        self.history = deque(maxlen=HISTORY_SIZE)  # (받을 플레이어 또는 None, 메시지) 링 버퍼
+        self.timers: TimerWheel | None = None  # 턴 제한 시간을 걸 타이머 휠 (None이면 제한 없음)
+        self.turn_timeout = TURN_TIMEOUT
+        self.turn_timer: Timer | None = None
+        self.turn_key = None  # 타이머를 건 턴 (라운드, 플레이어)
+        self.timeouts = [0, 0]  # 플레이어별 연속 시간 초과 횟수
         # 야추 게임의 13개 카테고리 정의
-        self.categories = [
-            "ones", "twos", "threes", "fours", "fives", "sixes",
-            "three_of_kind", "four_of_kind", "full_house",
-            "small_straight", "large_straight", "yacht", "chance"
-        ]
-
-    def log(self, message: str) -> None:
-        """시간 스탬프와 함께 로그 메시지 출력.
-        
-        Args:
-            message: 출력할 로그 메시지
-        """
-        timestamp = time.strftime("%H:%M:%S")
-        print(f"[{timestamp}] {message}")
+        self.categories = list(CATEGORIES)
 
-    def start_server(self) -> None:
-        """서버 시작 및 클라이언트 연결 대기.
-        
-        포트 8888에서 최대 2명의 클라이언트 연결을 대기하고
-        모든 플레이어가 접속하면 게임을 시작.
-        """
-        server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)  # 포트 재사용 허용
-        server.bind(('localhost', 8888))  # 로컬호스트 8888번 포트에 바인딩
-        server.listen(2)  # 최대 2개 연결 대기
-        self.log("서버 시작 - 포트 8888")
-
-        # 2명의 플레이어가 모두 접속할 때까지 대기
-        while len(self.clients) < 2:
-            client, addr = server.accept()
-            self.clients.append(client)
-            self.log(f"플레이어 {len(self.clients)} 접속: {addr}")
-            # 각 클라이언트를 별도 스레드에서 처리
-            threading.Thread(target=self.handle_client, args=(client, len(self.clients) - 1)).start()
+    @property
+    def game_state(self) -> GameState:
+        """점수표와 턴 상태 (JSON 형태로는 전송 시에만 변환)."""
+        return self.engine.state
 
-        # 게임 시작 알림
-        self.log("게임 시작!")
-        self.broadcast({"type": "game_start", "data": self.game_state})
+    @game_state.setter
+    def game_state(self, state: GameState) -> None:
+        """매칭이나 복구로 만든 게임 상태로 교체."""
+        self.engine.state = state
 
-    def handle_client(self, client: socket.socket, player_id: int) -> None:
-        """개별 클라이언트 연결 처리.
-        
-        Args:
-            client: 클라이언트 소켓
-            player_id: 플레이어 ID (0 또는 1)
-        """
-        # 클라이언트에게 플레이어 ID 전송
-        welcome_msg = {"type": "player_id", "data": {"id": player_id}}
-        client.send(json.dumps(welcome_msg).encode())
-        self.log(f"플레이어 {player_id + 1}에게 ID 할당")
+    @property
+    def rng(self) -> DiceRNG:
+        """방 전용 주사위 생성기."""
+        return self.engine.rng
 
-        while True:
-            try:
-                data = client.recv(1024).decode()  # 1KB 버퍼로 데이터 수신
-                if not data:
-                    break
+    def log(self, message: str, level: int = INFO, **fields) -> None:
+        """로그 기록 (버퍼링되어 별도 스레드에서 출력).
 
-                message = json.loads(data)
-                self.log(f"플레이어 {player_id + 1}에서 수신: {message['type']}")
-                self.process_message(message, player_id)
+        Args:
+            message: 로그 메시지
+            level: 로그 레벨 (턴마다 남는 로그는 DEBUG)
+            **fields: 함께 남길 구조화 필드
+        """
+        logger.log(level, message, **fields)
 
-            except Exception as e:
-                self.log(f"클라이언트 {player_id + 1} 오류: {e}")
-                break
+    def load_hint_table(self) -> None:
+        """최적 수 안내용 기대값 테이블을 미리 메모리 맵으로 열기.
 
-        client.close()
-        self.log(f"플레이어 {player_id + 1} 연결 종료")
+        테이블 파일이 없으면 안내 요청에 사용 불가로 응답.
+        """
+        if load_strategy() is None:
+            self.log("기대값 테이블 없음 - 힌트 비활성화 (python app/src/yacht_solver.py 로 생성)")
+        else:
+            self.log("기대값 테이블 로드 완료 - 힌트 활성화")
 
     def process_message(self, message: dict, player_id: int) -> None:
         """클라이언트 메시지 처리.
+
+        받아들일 수 없는 요청은 거절 코드를 담은 error로 응답하고,
+        id가 붙은 요청은 처리를 마친 뒤 같은 id의 ack로 응답.
+        한 연결의 요청은 받은 순서대로 처리하므로 클라이언트는 응답을 기다리지 않고
+        여러 요청(재굴리기 후 점수 선택 등)을 이어서 보낼 수 있음.
         
         Args:
             message: 클라이언트에서 받은 메시지 딕셔너리
             player_id: 메시지를 보낸 플레이어 ID
         """
+        state = self.game_state
         if message["type"] == "roll_dice":
-            # 현재 턴 플레이어만 주사위를 굴릴 수 있음
-            if player_id == self.game_state["current_player"]:
-                current_turn = self.game_state["players"][player_id]["turn_data"]
-
-                if "dice" not in current_turn:
-                    # 첫 굴리기 - 5개 주사위 모두 굴림
-                    dice = [random.randint(1, 6) for _ in range(5)]  # 1-6 랜덤 값 5개 생성
-                    current_turn["dice"] = dice
-                    current_turn["rolls_left"] = 2  # 최대 3번까지 굴릴 수 있으므로 2번 남음
-                    self.log(f"플레이어 {player_id + 1} 첫 굴리기: {dice}")
-                else:
-                    # 재굴리기 - 선택된 주사위만 다시 굴림
-                    reroll_indices = message["data"].get("reroll", [])
-                    dice = current_turn["dice"].copy()
-                    old_dice = dice.copy()
-                    # 선택된 인덱스의 주사위만 새로 굴림
-                    for i in reroll_indices:
-                        if 0 <= i < 5:  # 유효한 인덱스 범위 체크 (0-4)
-                            dice[i] = random.randint(1, 6)
-                    current_turn["dice"] = dice
-                    current_turn["rolls_left"] -= 1
-                    self.log(f"플레이어 {player_id + 1} 재굴리기 {reroll_indices}: {old_dice} -> {dice}")
+            old_dice = state.dice
+            reroll_indices = message["data"].get("reroll", [])
+            if not isinstance(reroll_indices, list) or not all(type(i) is int for i in reroll_indices):
+                self.reject_request(player_id, message, "invalid_request")
+                return
+            mask = self.engine.roll(player_id, reroll_indices)
+            if mask is None:
+                # 차례가 아니거나 남은 굴리기가 없음
+                self.reject_request(player_id, message, self.engine.roll_error(player_id))
+                return
+            if old_dice is None:
+                self.log("첫 굴리기", DEBUG, player=player_id + 1, dice=state.dice)
+            else:
+                self.log("재굴리기", DEBUG, player=player_id + 1, reroll=reroll_indices, before=old_dice, dice=state.dice)
+            if self.journal is not None:
+                self.journal.record_roll(self.room_id, player_id, mask, state.dice)
 
-                self.broadcast({
-                    "type": "dice_result",
-                    "data": {
-                        "dice": current_turn["dice"],
-                        "player": player_id,
-                        "rolls_left": current_turn["rolls_left"]
-                    }
-                })
+            self.broadcast({
+                "type": "dice_result",
+                "data": {
+                    "dice": state.dice,
+                    "player": player_id,
+                    "rolls_left": state.rolls_left
+                }
+            })
 
         elif message["type"] == "select_category":
-            # 현재 턴 플레이어만 카테고리를 선택할 수 있음
-            if player_id == self.game_state["current_player"]:
-                category = message["data"]["category"]
-                dice = self.game_state["players"][player_id]["turn_data"]["dice"]
-                score = self.calculate_score(dice, category)
-
-                # 선택된 카테고리에 점수 기록
-                self.game_state["players"][player_id]["scores"][category] = score
-                self.game_state["players"][player_id]["turn_data"] = {}  # 턴 데이터 초기화
+            category = message["data"].get("category")
+            if not isinstance(category, str):
+                self.reject_request(player_id, message, "invalid_request")
+                return
+            trace = tracer.current
+            started = time.perf_counter() if trace is not None else 0.0
+            score = self.engine.select(player_id, category)
+            if trace is not None:
+                trace.add("calculate_score", started, category=category)
+            if score is None:
+                # 차례가 아니거나, 굴리기 전이거나, 알 수 없거나 이미 기록한 카테고리
+                self.reject_request(player_id, message, self.engine.select_error(player_id, category))
+                return
+            if self.journal is not None:
+                self.journal.record_select(self.room_id, player_id, CATEGORY_INDEX[category], score)
+            self.timeouts[player_id] = 0
 
-                self.log(f"플레이어 {player_id + 1} 점수 기록: {category} = {score}")
-
-                # 턴 변경 - 0과 1 사이를 토글
-                self.game_state["current_player"] = 1 - self.game_state["current_player"]
-
-                # 게임 종료 체크 - 각 플레이어가 13개 카테고리를 모두 채웠는지 확인
-                if len(self.game_state["players"][player_id]["scores"]) == 13:
-                    if len(self.game_state["players"][1 - player_id]["scores"]) == 13:
-                        self.end_game()
-                        return
+            self.log("점수 기록", DEBUG, player=player_id + 1, category=category, score=score)
 
+            # 게임 종료 체크 - 두 플레이어가 13개 카테고리를 모두 채웠는지 확인
+            if self.engine.finished:
+                self.end_game()
+            else:
+                # 전체 상태 대신 바뀐 부분(delta)만 전송
                 self.broadcast({
                     "type": "turn_end",
                     "data": {
                         "score": score,
                         "category": category,
                         "player": player_id,
-                        "game_state": self.game_state
+                        "current_player": state.current_player,
+                        "round": state.round,
+                        "version": state.version
                     }
                 })
 
+        elif message["type"] == "sync_request":
+            # 버전 차이를 발견한 클라이언트에게만 전체 상태 스냅샷 전송
+            self.send_to(player_id, {"type": "state_snapshot", "data": state.to_dict()})
+
+        elif message["type"] == "hello":
+            # 인코딩 협상 - 응답은 협상 전 인코딩(JSON)으로 보낸 뒤 전환
+            codec = choose_codec(message["data"].get("codecs", []))
+            self.send_to(player_id, {"type": "hello", "data": {"codec": codec}}, record=False)
+            if codec == "binary":
+                self.binary_clients.add(self.clients[player_id])
+            self.log("인코딩 협상", DEBUG, player=player_id + 1, codec=codec)
+
+        elif message["type"] == "hint_request":
+            # 최적 수 안내 - 요청한 플레이어의 점수표와 현재 주사위 기준
+            strategy = load_strategy()
+            if strategy is None:
+                hint = {"available": False}
+            else:
+                player = state.players[player_id]
+                if player_id == state.current_player and state.dice is not None:
+                    hint = strategy.hint(player.filled, player.upper, state.dice, state.rolls_left)
+                else:
+                    hint = strategy.hint(player.filled, player.upper, [], 2)
+                hint["available"] = True
+            self.send_to(player_id, {"type": "hint", "data": hint})
+
+        elif message["type"] in QUERY_TYPES:
+            # 순위표 / 플레이어 통계 조회 - 게임 상태가 아니므로 재전송용으로 보관하지 않음
+            self.send_to(player_id, answer_query(self.results, message, self.names[player_id]), record=False)
+
+        else:
+            self.reject_request(player_id, message, "unknown_type")
+            return
+        self.acknowledge(player_id, message)
+
+    def acknowledge(self, player_id: int, message: dict) -> None:
+        """처리를 마친 요청에 id가 있으면 ack 응답 (재전송용으로 보관하지 않음).
+
+        Args:
+            player_id: 요청한 플레이어 ID
+            message: 처리한 요청 메시지
+        """
+        if "id" in message:
+            self.send_to(player_id, ack_message(message["id"]), record=False)
+
+    def reject_request(self, player_id: int, message: dict, code: str) -> None:
+        """처리하지 않은 요청에 거절 코드와 요청 id를 담아 error 응답.
+
+        Args:
+            player_id: 요청한 플레이어 ID
+            message: 거절한 요청 메시지
+            code: 거절 코드 (yacht_protocol.ERROR_CODES)
+        """
+        metrics.inc("yacht_rejected_requests_total")
+        self.log("요청 거절", DEBUG, player=player_id + 1, type=message["type"], code=code)
+        self.send_to(player_id, error_message(code, message.get("id")), record=False)
+
     def calculate_score(self, dice: list, category: str) -> int:
         """주사위 결과와 카테고리에 따른 점수 계산.
+
+        미리 계산된 공용 점수표(yacht_scoring)에서 조회.
         
         Args:
             dice: 5개 주사위 값의 리스트
@@ -178,63 +243,172 @@ class YachtServer:
         Returns:
             계산된 점수
         """
-        # 각 숫자(1-6)의 개수를 세기 위한 배열 (인덱스 0은 미사용)
-        counts = [0] * 7
-        for d in dice:
-            counts[d] += 1
-
-        # 숫자 카테고리 (1-6): 해당 숫자의 개수 × 숫자 값
-        if category in ["ones", "twos", "threes", "fours", "fives", "sixes"]:
-            num = ["", "ones", "twos", "threes", "fours", "fives", "sixes"].index(category)
-            return counts[num] * num
-
-        # 3 of a kind: 같은 숫자 3개 이상 시 모든 주사위 합
-        elif category == "three_of_kind":
-            return sum(dice) if max(counts) >= 3 else 0
-        # 4 of a kind: 같은 숫자 4개 이상 시 모든 주사위 합
-        elif category == "four_of_kind":
-            return sum(dice) if max(counts) >= 4 else 0
-        # Full house: 3개 + 2개 조합 시 25점 고정
-        elif category == "full_house":
-            return 25 if (3 in counts and 2 in counts) else 0
-        # Small straight: 연속된 4개 숫자 시 30점 고정
-        elif category == "small_straight":
-            straights = [[1, 2, 3, 4], [2, 3, 4, 5], [3, 4, 5, 6]]  # 가능한 연속 4개 조합
-            for straight in straights:
-                if all(counts[i] > 0 for i in straight):
-                    return 30
-            return 0
-        # Large straight: 연속된 5개 숫자 시 40점 고정
-        elif category == "large_straight":
-            # (1,2,3,4,5) 또는 (2,3,4,5,6) 패턴 체크
-            if (counts[1:6] == [1, 1, 1, 1, 1]) or (counts[2:7] == [1, 1, 1, 1, 1]):
-                return 40
-            return 0
-        # Yacht: 같은 숫자 5개 시 50점 고정
-        elif category == "yacht":
-            return 50 if max(counts) == 5 else 0
-        # Chance: 모든 주사위 합
-        elif category == "chance":
-            return sum(dice)
-
-        return 0
-
-    def end_game(self) -> None:
+        return score(dice, category)
+
+    def end_game(self, forfeit: int | None = None) -> None:
         """게임 종료 처리.
         
         각 플레이어의 총점을 계산하고 승자를 결정한 후
         모든 클라이언트에게 게임 종료 메시지 전송.
+
+        Args:
+            forfeit: 기권한 플레이어 ID (None이면 점수로 승자 결정)
+        """
+        if forfeit is None:
+            winner, scores = self.engine.result()  # 상단 보너스 포함, 더 높은 점수의 플레이어가 승자
+        else:
+            winner, scores = self.engine.forfeit(forfeit)
+            metrics.inc("yacht_forfeits_total")
+        metrics.inc("yacht_games_finished_total")
+        seed = None if self.rng.secure else self.rng.seed  # 끝난 뒤에만 공개 (진행 중 공개하면 주사위 예측 가능)
+        self.log("게임 종료", winner=winner + 1, scores=scores, seed=seed)
+        if self.results is not None:
+            self.results.record(self.room_id, self.game_state, winner, scores, tuple(self.names), seed, forfeit)
+
+        data = {"winner": winner, "scores": scores, "seed": seed}
+        if forfeit is not None:
+            data["forfeit"] = forfeit
+        self.broadcast({"type": "game_end", "data": data})
+        self.watch_turn()  # 남은 턴 타이머 해제
+
+    def watch_turn(self) -> None:
+        """턴이 바뀌었으면 이전 턴의 타이머를 취소하고 새 턴의 제한 시간 타이머를 걺.
+
+        메시지를 처리할 때마다 호출해도 턴이 그대로면 아무 일도 하지 않음.
+        """
+        state = self.game_state
+        key = None if state.game_over else (state.round, state.current_player)
+        if key == self.turn_key:
+            return
+        self.turn_key = key
+        if self.turn_timer is not None:
+            self.turn_timer.cancel()
+            self.turn_timer = None
+        if key is not None and self.timers is not None:
+            self.turn_timer = self.timers.schedule(self.turn_timeout, self.expire_turn, key)
+
+    def expire_turn(self, key: tuple[int, int]) -> None:
+        """턴 제한 시간 초과 처리.
+
+        자리를 비운 플레이어 대신 턴을 진행해 상대가 계속 기다리지 않도록 하고,
+        TIMEOUT_FORFEIT번 연속이면 기권 처리해 방을 끝냄.
+
+        Args:
+            key: 타이머를 건 턴 (그 사이 턴이 바뀌었으면 무시)
+        """
+        self.turn_timer = None
+        if key != self.turn_key:
+            return
+        player_id = self.game_state.current_player
+        strikes = self.timeouts[player_id] + 1
+        forfeit = strikes >= TIMEOUT_FORFEIT
+        self.log("턴 시간 초과", WARNING, player=player_id + 1, strikes=strikes, forfeit=forfeit)
+        metrics.inc("yacht_turn_timeouts_total")
+        self.broadcast({"type": "turn_timeout", "data": {"player": player_id, "forfeit": forfeit}})
+        if forfeit:
+            self.end_game(forfeit=player_id)
+            return
+        self.auto_play(player_id)
+        self.timeouts[player_id] = strikes
+        self.turn_key = None  # 턴이 넘어가지 않았더라도 새 타이머를 걸어 다음 초과를 셈
+        self.watch_turn()
+
+    def auto_play(self, player_id: int) -> None:
+        """플레이어 대신 턴 진행.
+
+        아직 굴리지 않았으면 굴리고, 기대값 테이블이 있으면 힌트와 같은 카테고리를,
+        없으면 점수가 가장 높은 빈 카테고리를 골라 일반 요청과 같은 경로로 처리.
+
+        Args:
+            player_id: 시간을 넘긴 플레이어 ID
         """
-        scores = [sum(p["scores"].values()) for p in self.game_state["players"]]
-        winner = 0 if scores[0] > scores[1] else 1  # 더 높은 점수의 플레이어가 승자
+        if self.game_state.dice is None:
+            self.process_message({"type": "roll_dice", "data": {}}, player_id)
+        dice = self.game_state.dice
+        player = self.game_state.players[player_id]
+        strategy = load_strategy()
+        if strategy is not None:
+            category, _ = strategy.best_category(player.filled, min(player.upper, UPPER_BONUS_THRESHOLD), dice)
+        else:
+            scores = score_all(dice)
+            category = CATEGORIES[max((i for i in range(len(CATEGORIES)) if not player.has(i)), key=scores.__getitem__)]
+        self.process_message({"type": "select_category", "data": {"category": category}}, player_id)
 
-        self.broadcast({
-            "type": "game_end",
-            "data": {
-                "winner": winner,
-                "scores": scores
-            }
-        })
+    def stamp(self, message: dict, player_id: int | None = None) -> None:
+        """보낼 메시지에 순번을 붙이고 링 버퍼에 보관.
+
+        재접속한 클라이언트가 마지막으로 받은 순번을 알려주면
+        그 이후의 메시지만 골라 다시 보낼 수 있음.
+
+        Args:
+            message: 전송할 메시지 딕셔너리 (seq 필드가 추가됨)
+            player_id: 받을 플레이어 ID (None이면 방 전체)
+        """
+        self.seq += 1
+        message["seq"] = self.seq
+        self.history.append((player_id, message))
+
+    def missed_messages(self, player_id: int, last_seq: int) -> list[dict] | None:
+        """재접속한 플레이어가 놓친 메시지 목록.
+
+        Args:
+            player_id: 재접속한 플레이어 ID
+            last_seq: 클라이언트가 마지막으로 받은 순번
+
+        Returns:
+            놓친 메시지 목록 (보낸 순서), 링 버퍼가 이미 그 지점을 지나쳤으면 None
+        """
+        if last_seq > self.seq:
+            return None  # 서버 재시작 등으로 순번이 초기화됨
+        if last_seq < self.seq and (not self.history or self.history[0][1]["seq"] > last_seq + 1):
+            return None
+        return [message for target, message in self.history
+                if message["seq"] > last_seq and target in (None, player_id)]
+
+    def send_to(self, player_id: int, message: dict, record: bool = True) -> None:
+        """특정 플레이어에게만 메시지 전송.
+
+        Args:
+            player_id: 받을 플레이어 ID
+            message: 전송할 메시지 딕셔너리
+            record: 순번을 붙이고 재전송용으로 보관할지 여부 (연결 단위 메시지는 False)
+        """
+        if record:
+            self.stamp(message, player_id)
+        client = self.clients[player_id]
+        self.write(client, encode_message(message, binary=client in self.binary_clients))
+
+    def write(self, client: socket.socket, data: bytes) -> None:
+        """클라이언트에게 데이터 전송 (요청 처리 중이면 outbox에 모았다가 flush에서 한 번에 전송).
+
+        Args:
+            client: 받을 클라이언트 소켓
+            data: 인코딩된 메시지
+        """
+        if self.outbox is not None:
+            self.outbox.setdefault(client, bytearray()).extend(data)
+        else:
+            self.send(client, data)
+
+    def flush(self) -> None:
+        """outbox에 모아 둔 데이터를 클라이언트마다 한 덩어리로 전송하고 즉시 전송으로 복귀."""
+        outbox, self.outbox = self.outbox, None
+        for client, data in (outbox or {}).items():
+            self.send(client, bytes(data))
+
+    def send(self, client: socket.socket, data: bytes) -> None:
+        """소켓에 바로 전송하고, 전송에 성공한 바이트만 지표에 반영.
+
+        Args:
+            client: 받을 클라이언트 소켓
+            data: 전송할 바이트
+        """
+        try:
+            client.sendall(data)
+        except OSError:
+            # 전송 실패 시 무시 (연결이 끊어진 클라이언트)
+            return
+        metrics.inc("yacht_bytes_sent_total", len(data))
 
     def broadcast(self, message: dict) -> None:
         """모든 연결된 클라이언트에게 메시지 브로드캐스트.
@@ -242,15 +416,243 @@ class YachtServer:
         Args:
             message: 전송할 메시지 딕셔너리
         """
-        data = json.dumps(message).encode()
+        started = time.perf_counter()
+        self.stamp(message)
+        # 인코딩별로 한 번씩만 직렬화
+        data = encode_message(message)
+        binary_data = encode_message(message, binary=True) if self.binary_clients else data
+        sent = 0
         for client in self.clients:
+            payload = binary_data if client in self.binary_clients else data
+            self.write(client, payload)
+            sent += len(payload)
+        metrics.observe("yacht_broadcast_seconds", time.perf_counter() - started)
+        if tracer.current is not None:
+            tracer.current.add("broadcast", started, type=message["type"], bytes=sent)
+
+
+class YachtServer(YachtRoom):
+    """야추 게임 서버 클래스.
+    
+    최대 2명의 플레이어가 참여할 수 있는 야추 게임 서버를 관리.
+    소켓 통신을 통해 클라이언트와 연결하고 클라이언트마다 스레드를 두어
+    하나의 게임 방을 진행.
+    클라이언트 스레드와 턴 타이머 스레드가 같은 방을 바꾸므로 메시지 처리는 lock으로 직렬화.
+    전송은 클라이언트마다 쓰기 스레드가 맡아 느린 상대가 lock을 잡은 채 다른 스레드를 멈추지 않음.
+    """
+
+    def process_message(self, message: dict, player_id: int) -> None:
+        """로비가 없으므로 join 메시지의 이름만 직접 반영하고 나머지는 방과 같이 처리.
+
+        Args:
+            message: 클라이언트에서 받은 메시지 딕셔너리
+            player_id: 메시지를 보낸 플레이어 ID
+        """
+        if message["type"] != "join":
+            super().process_message(message, player_id)
+            return
+        name = message["data"].get("name")
+        state = self.game_state
+        # 첫 굴림 이후에는 이름을 바꾸지 않음 (순위표 기록이 게임 도중 다른 사람으로 바뀌지 않도록)
+        if isinstance(name, str) and name and state.version == 0 and state.dice is None:
+            self.names[player_id] = state.players[player_id].name = name[:MAX_NAME_LENGTH]
+            self.log("이름 지정", DEBUG, player=player_id + 1, name=self.names[player_id])
+        self.acknowledge(player_id, message)
+
+    def send(self, client: socket.socket, data: bytes) -> None:
+        """클라이언트의 쓰기 큐에 넣음 (sendall은 쓰기 스레드가 lock 밖에서 수행).
+
+        방 lock을 잡은 채 호출되므로 큐에 넣은 순서가 그대로 전송 순서가 됨.
+
+        Args:
+            client: 받을 클라이언트 소켓
+            data: 전송할 바이트
+        """
+        self.outgoing[client].put(data)
+
+    def send_loop(self, client: socket.socket, outgoing: queue.SimpleQueue) -> None:
+        """클라이언트 하나의 쓰기 큐를 비우는 스레드 (None을 꺼내면 종료).
+
+        Args:
+            client: 받을 클라이언트 소켓
+            outgoing: 전송할 바이트가 쌓이는 쓰기 큐
+        """
+        while True:
+            # 전송이 밀린 사이 쌓인 데이터는 한 번의 sendall로 묶음
+            chunks = [outgoing.get()]
+            while not outgoing.empty():
+                chunks.append(outgoing.get_nowait())
+            closing = None in chunks
+            if closing:
+                chunks = chunks[:chunks.index(None)]
+            if chunks:
+                super().send(client, b"".join(chunks))
+            if closing:
+                return
+
+    def run_timers(self) -> None:
+        """턴 타이머 휠을 틱마다 진행 (데몬 스레드)."""
+        while not self.game_state.game_over:
+            time.sleep(self.timers.tick)
+            with self.lock:
+                self.timers.advance()
+
+    def start_server(self, endpoints: list[Endpoint] | None = None) -> None:
+        """서버 시작 및 클라이언트 연결 대기.
+        
+        주어진 주소들(기본: localhost 8888번 포트)에서 최대 2명의 클라이언트 연결을 대기하고
+        모든 플레이어가 접속하면 게임을 시작.
+
+        Args:
+            endpoints: 접속을 받을 주소 목록 (TCP와 유닉스 소켓을 섞어 사용 가능)
+        """
+        endpoints = endpoints or [Endpoint.tcp('localhost', 8888)]
+        self.lock = threading.Lock()
+        self.threads = []  # 클라이언트 처리 스레드 (종료를 기다린 뒤 결과 기록을 마무리)
+        self.outgoing: dict[socket.socket, queue.SimpleQueue] = {}  # 클라이언트 → 쓰기 큐
+        self.senders: dict[socket.socket, threading.Thread] = {}  # 클라이언트 → 쓰기 스레드
+        listeners = {}  # listen 소켓 → 주소
+        for endpoint in endpoints:
+            listeners[endpoint.bind()] = endpoint
+            self.log(f"서버 시작 - {endpoint}")
+        self.load_hint_table()
+
+        # 2명의 플레이어가 모두 접속할 때까지 대기 (어느 주소로 들어와도 같은 방)
+        try:
+            while len(self.clients) < 2:
+                ready, _, _ = select.select(list(listeners), [], [])
+                for server in ready:
+                    if len(self.clients) == 2:
+                        break
+                    client, addr = server.accept()
+                    self.clients.append(client)
+                    self.log("접속", player=len(self.clients), addr=addr or str(listeners[server]))
+                    self.outgoing[client] = queue.SimpleQueue()
+                    # 플레이어 ID는 game_start보다 먼저 나가도록 쓰기 스레드를 띄우기 전에 큐에 넣음
+                    welcome_msg = {"type": "player_id", "data": {"id": len(self.clients) - 1}}
+                    self.send(client, encode_message(welcome_msg))
+                    sender = threading.Thread(target=self.send_loop, args=(client, self.outgoing[client]),
+                                              name=f"yacht-sender-{len(self.clients)}", daemon=True)
+                    sender.start()
+                    self.senders[client] = sender
+                    # 각 클라이언트를 별도 스레드에서 처리
+                    thread = threading.Thread(target=self.handle_client, args=(client, len(self.clients) - 1))
+                    thread.start()
+                    self.threads.append(thread)
+        finally:
+            for server, endpoint in listeners.items():
+                server.close()
+                endpoint.cleanup()
+
+        # 게임 시작 알림
+        self.log("게임 시작!", seed=self.rng.seed)
+        metrics.inc("yacht_games_started_total")
+        self.timers = TimerWheel()
+        with self.lock:
+            self.broadcast({"type": "game_start", "data": self.game_state.to_dict()})
+            self.watch_turn()
+        threading.Thread(target=self.run_timers, name="yacht-timers", daemon=True).start()
+
+    def handle_client(self, client: socket.socket, player_id: int) -> None:
+        """개별 클라이언트 연결 처리.
+        
+        Args:
+            client: 클라이언트 소켓
+            player_id: 플레이어 ID (0 또는 1)
+        """
+        # 플레이어 ID는 접속 직후 쓰기 큐에 들어가 있음
+        self.log("ID 할당", player=player_id + 1)
+        client.settimeout(IDLE_TIMEOUT)  # 아무것도 보내지 않는 클라이언트가 스레드를 계속 붙잡지 않도록
+        if client.family in (socket.AF_INET, socket.AF_INET6):
+            # 응답이 작은 패킷이라 Nagle 알고리즘과 지연 ACK가 겹치면 40ms씩 묶여서 나감
+            client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        profiler.watch()  # 샘플링 프로파일러는 클라이언트 처리 스레드만 표본 추출
+
+        decoder = FrameDecoder()  # 조각난 프레임을 모아 메시지 단위로 분리
+        while True:
             try:
-                client.send(data)
-            except:
-                # 전송 실패 시 무시 (연결이 끊어진 클라이언트)
-                pass
+                # 추적은 읽기 단위로 표본 추출 (read 스팬에는 클라이언트를 기다린 시간도 포함)
+                trace = tracer.sample(player_id, f"플레이어 {player_id + 1}", player=player_id + 1)
+                started = time.perf_counter()
+                data = client.recv(65536)
+                if not data:
+                    break
+                metrics.inc("yacht_bytes_received_total", len(data))
+                if trace is not None:
+                    trace.add("read", started, bytes=len(data))
+                    started = time.perf_counter()
+
+                # 한 번의 수신에 여러 메시지가 들어있을 수 있음
+                messages = decoder.feed(data)
+                if trace is not None:
+                    trace.add("decode", started, messages=len(messages))
+                for message in messages:
+                    self.log("수신", DEBUG, player=player_id + 1, type=message["type"])
+                    started = time.perf_counter()
+                    with self.lock:
+                        tracer.current = trace  # 방 안의 단계(점수 계산, 브로드캐스트)가 같은 기록기에 이어서 기록
+                        # 응답, 브로드캐스트, ack를 클라이언트마다 모아 한 번에 쓰기 큐로 넘김 (lock 밖에서 전송)
+                        self.outbox = {}
+                        try:
+                            self.process_message(message, player_id)
+                            self.watch_turn()
+                        finally:
+                            self.flush()
+                            tracer.current = None
+                    metrics.observe("yacht_message_seconds", time.perf_counter() - started, message_label(message["type"]))
+                    if trace is not None:
+                        trace.add("process_message", started, type=message["type"])
+
+            except TimeoutError:
+                self.log("유휴 시간 초과 - 연결 종료", WARNING, player=player_id + 1)
+                metrics.inc("yacht_idle_disconnects_total")
+                break
+            except ValueError as e:
+                # 프레임이 깨지면 이후 경계를 알 수 없으므로 invalid_request를 알린 뒤 연결 종료
+                self.log("잘못된 프레임 - 연결 종료", WARNING, player=player_id + 1, error=e)
+                self.send(client, encode_message(error_message("invalid_request")))
+                break
+            except Exception as e:
+                self.log("클라이언트 오류", ERROR, player=player_id + 1, error=e)
+                break
+
+        # 쓰기 큐에 남은 메시지를 모두 보낸 뒤 소켓을 닫음
+        self.outgoing[client].put(None)
+        self.senders[client].join()
+        client.close()
+        profiler.unwatch()
+        self.log("연결 종료", player=player_id + 1)
 
 
 if __name__ == "__main__":
-    server = YachtServer()
-    server.start_server()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="야추 게임 서버 (2인 1게임)")
+    parser.add_argument("--listen", action="append", metavar="ADDRESS",
+                        help="접속을 받을 주소 (여러 번 지정 가능, 기본: tcp://localhost:8888, 예: unix:/tmp/yacht.sock)")
+    parser.add_argument("--log-level", choices=LEVELS, default="info", help="debug면 메시지마다 로그 (기본: info)")
+    parser.add_argument("--log-format", choices=("text", "json"), default="text")
+    parser.add_argument("--metrics-port", type=int, help="Prometheus 형식 지표를 제공할 포트")
+    parser.add_argument("--seed", type=int, help="주사위 시드 (같은 시드와 같은 입력이면 같은 게임)")
+    parser.add_argument("--turn-timeout", type=float, default=TURN_TIMEOUT,
+                        help=f"턴 제한 시간(초) - 넘기면 서버가 대신 기록, {TIMEOUT_FORFEIT}번 연속이면 기권 (기본: {TURN_TIMEOUT:g})")
+    parser.add_argument("--results", metavar="PATH", help="게임 결과와 플레이어 통계를 기록할 SQLite 파일 (순위표)")
+    add_trace_arguments(parser)
+    args = parser.parse_args()
+
+    logger.configure(args.log_level, args.log_format)
+    start_tracing(**trace_options(args))
+    if args.metrics_port is not None:
+        serve_in_thread("localhost", args.metrics_port)
+    # asyncio 서버의 방 0과 같은 방식으로 기준 시드를 섞음 (0도 다른 값과 겹치지 않는 시드가 됨, 시드 0은 SECURE_SEED로 예약)
+    server = YachtServer(rng=DiceRNG(derive_seed(args.seed, 0)) if args.seed is not None else None)
+    server.turn_timeout = args.turn_timeout
+    if args.results is not None:
+        server.results = ResultStore(args.results)
+    try:
+        server.start_server(parse_endpoints(args.listen))
+        # 두 플레이어 연결이 끝난 뒤 쓰기 스레드에 남은 결과를 기록하고 추적 기록을 저장한 뒤 종료
+        for thread in server.threads:
+            thread.join()
+        if server.results is not None:
+            server.results.close()
+    finally:
+        stop_tracing()
\ No newline at end of file
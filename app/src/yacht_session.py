@@ -0,0 +1,243 @@
+import asyncio
+import codecs
+import os
+import sys
+from typing import Protocol
+
+from yacht_protocol import CODECS, FrameDecoder, encode_message
+from yacht_transport import Endpoint
+
+RECONNECT_ATTEMPTS = 5  # 연결이 끊겼을 때 재접속 시도 횟수
+
+
+class SessionHandler(Protocol):
+    """GameSession이 메시지와 입력을 넘겨줄 대상 (대화형 클라이언트, 봇 등)."""
+
+    def handle_message(self, message: dict) -> bool:
+        """서버 메시지 처리. 게임이 끝났으면 True를 반환해 세션 종료."""
+
+    def process_input(self, line: str) -> None:
+        """사용자 입력 한 줄 처리 (stdin을 읽는 세션에서만 호출)."""
+
+
+class GameSession:
+    """서버 연결 하나를 이벤트 방식으로 처리하는 클라이언트 공통 코어.
+
+    하나의 asyncio 루프에서 소켓과 (선택적으로) stdin을 함께 기다리고,
+    프레임이 도착하거나 입력 한 줄이 완성되는 즉시 핸들러를 호출.
+    모든 상태 변경이 루프 스레드 하나에서만 일어나므로 수신 스레드와 입력 루프 사이의 경합이 없고,
+    주기적으로 깨어나 상태를 확인하는 폴링도 없음.
+    join/hello 핸드셰이크, 메시지 순번 추적, 요청 id 발급과 응답 대기 목록, 세션 토큰으로의 재접속도 여기서 처리.
+    """
+
+    def __init__(self, handler: SessionHandler, host: str = 'localhost', port: int = 8888,
+                 binary: bool = False, join: dict | None = None, reconnect_attempts: int = RECONNECT_ATTEMPTS,
+                 endpoint: Endpoint | None = None):
+        """세션 초기화 (연결은 run에서).
+
+        Args:
+            handler: 메시지와 입력을 처리할 핸들러
+            host: 서버 호스트
+            port: 서버 포트
+            binary: 접속 시 바이너리 인코딩을 제안할지 여부
+            join: 접속 직후 보낼 join 메시지 데이터 (None이면 보내지 않음)
+            reconnect_attempts: 연결이 끊겼을 때 재접속 시도 횟수 (0이면 바로 실패)
+            endpoint: 접속할 주소 (지정하면 host, port 대신 사용 - 유닉스 소켓 등)
+        """
+        self.handler = handler
+        self.endpoint = endpoint or Endpoint.tcp(host, port)
+        self.request_binary = binary
+        self.join = join
+        self.reconnect_attempts = reconnect_attempts
+        self.binary = False  # 서버와 바이너리 인코딩을 합의했는지 여부
+        self.session = None  # 재접속에 사용할 세션 토큰
+        self.last_seq = 0  # 마지막으로 받은 메시지 순번
+        self.last_id = 0  # 마지막으로 발급한 요청 id
+        self.requests: dict[int, dict] = {}  # 응답(ack/error)을 기다리는 요청 id → 요청 메시지
+        self.writer: asyncio.StreamWriter | None = None
+        self._input: asyncio.Queue[str | None] | None = None
+
+    def send(self, message: dict) -> None:
+        """서버에 메시지 전송 (전송 버퍼에 쌓기만 하고 바로 반환).
+
+        Args:
+            message: 전송할 메시지 딕셔너리
+        """
+        if self.writer is not None and not self.writer.is_closing():
+            self.writer.write(encode_message(message, binary=self.binary))
+
+    def request(self, message: dict) -> int:
+        """요청에 id를 붙여 보내고 응답 대기 목록에 추가.
+
+        서버는 한 연결의 요청을 받은 순서대로 처리하므로 응답을 기다리지 않고
+        여러 요청을 이어서 보낼 수 있음 (재굴리기 후 점수 선택 등).
+        ack 또는 error가 오면 원래 요청을 그 메시지의 request 필드로 붙여 핸들러에 넘김.
+
+        Args:
+            message: 전송할 요청 메시지 딕셔너리 (id 필드가 추가됨)
+
+        Returns:
+            발급한 요청 id
+        """
+        self.last_id += 1
+        message["id"] = self.last_id
+        self.requests[self.last_id] = message
+        self.send(message)
+        return self.last_id
+
+    async def run(self, stdin: bool = False) -> None:
+        """서버에 접속해 게임이 끝날 때까지 메시지와 입력 처리.
+
+        Args:
+            stdin: 표준 입력도 함께 기다릴지 여부 (대화형 클라이언트)
+
+        Raises:
+            ConnectionError: 연결이 끊기고 재접속에도 실패한 경우
+        """
+        loop = asyncio.get_running_loop()
+        if stdin:
+            self._input = asyncio.Queue()
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+            buffer = []
+
+            def on_stdin() -> None:
+                # 한 번에 여러 줄이 들어와도 모두 처리하도록 직접 읽어 줄 단위로 분리
+                chunk = os.read(sys.stdin.fileno(), 4096)
+                if not chunk:
+                    loop.remove_reader(sys.stdin.fileno())
+                    self._input.put_nowait(None)
+                    return
+                buffer.append(decoder.decode(chunk))
+                *lines, rest = "".join(buffer).split("\n")
+                buffer[:] = [rest]
+                for line in lines:
+                    self._input.put_nowait(line)
+
+            loop.add_reader(sys.stdin.fileno(), on_stdin)
+        try:
+            reader = await self._connect(first=True)
+            while True:
+                if await self._pump(reader):
+                    return
+                reader = await self._reconnect()
+        finally:
+            if stdin:
+                loop.remove_reader(sys.stdin.fileno())
+            if self.writer is not None:
+                self.writer.close()
+
+    async def _connect(self, first: bool) -> asyncio.StreamReader:
+        """연결을 열고 첫 메시지(join 또는 resume)와 인코딩 협상 요청 전송."""
+        reader, self.writer = await self.endpoint.open()
+        self.binary = False  # 새 연결은 다시 협상하기 전까지 JSON
+        # 끊긴 연결로 보낸 요청의 응답은 오지 않음 (처리된 결과는 놓친 메시지로 다시 받음)
+        self.requests.clear()
+        if not first:
+            self.send({"type": "resume", "data": {"session": self.session, "last_seq": self.last_seq}})
+        elif self.join:
+            # 로비 매칭 조건 - 접속 후 첫 메시지로 보내야 함
+            self.send({"type": "join", "data": self.join})
+        if self.request_binary:
+            self.send({"type": "hello", "data": {"codecs": list(CODECS)}})
+        return reader
+
+    async def _pump(self, reader: asyncio.StreamReader) -> bool:
+        """연결이 끊길 때까지 수신 프레임과 입력을 도착 순서대로 처리.
+
+        Returns:
+            게임이 끝났으면 True, 연결이 끊겼으면 False
+        """
+        frames = FrameDecoder()
+        try:
+            if self._input is None:
+                # 소켓만 기다리면 되는 봇 - 읽기마다 태스크를 만들지 않고 바로 대기
+                while True:
+                    data = await reader.read(65536)
+                    if not data:
+                        return False
+                    if self._dispatch(frames.feed(data)):
+                        return True
+            return await self._pump_with_input(reader, frames)
+        except (ConnectionError, OSError):
+            return False
+
+    async def _pump_with_input(self, reader: asyncio.StreamReader, frames: FrameDecoder) -> bool:
+        """소켓과 입력 줄 중 먼저 도착한 쪽부터 처리 (대화형 클라이언트)."""
+        read = asyncio.ensure_future(reader.read(65536))
+        line = asyncio.ensure_future(self._input.get())
+        try:
+            while True:
+                await asyncio.wait((read, line), return_when=asyncio.FIRST_COMPLETED)
+                if line.done():
+                    text = line.result()
+                    if text is None:
+                        return True  # 입력 종료 (Ctrl-D)
+                    self.handler.process_input(text)
+                    line = asyncio.ensure_future(self._input.get())
+                if read.done():
+                    data = read.result()
+                    if not data:
+                        return False
+                    if self._dispatch(frames.feed(data)):
+                        return True
+                    read = asyncio.ensure_future(reader.read(65536))
+        finally:
+            read.cancel()
+            line.cancel()
+
+    def _dispatch(self, messages: list[dict]) -> bool:
+        """받은 메시지를 순서대로 처리.
+
+        Returns:
+            게임이 끝났거나 재접속이 거절되었으면 True
+        """
+        for message in messages:
+            if self._track(message) or self.handler.handle_message(message):
+                return True
+        return False
+
+    def _track(self, message: dict) -> bool:
+        """핸들러보다 먼저 세션 수준 메시지 처리.
+
+        Returns:
+            재접속이 거절되었거나 서버가 연결을 거절해 더 진행할 수 없으면 True
+        """
+        if "seq" in message:
+            self.last_seq = message["seq"]  # 재접속 시 이후 메시지만 다시 받기 위해 기록
+        if message["type"] == "player_id":
+            self.session = message["data"].get("session")
+        elif message["type"] == "hello":
+            # 인코딩 협상 결과 - 이후 보내는 메시지에 적용
+            self.binary = message["data"]["codec"] == "binary"
+        elif message["type"] in ("ack", "error"):
+            # 응답을 기다리던 요청을 찾아 핸들러가 볼 수 있도록 붙여 넘김 (id가 없는 error는 None)
+            message["request"] = self.requests.pop(message.get("id"), None)
+        elif message["type"] == "rate_limited":
+            # 서버가 처리하지 않고 버린 요청은 응답이 오지 않음
+            for request_id in message["data"].get("ids", ()):
+                self.requests.pop(request_id, None)
+        elif message["type"] in ("resume_failed", "server_busy"):
+            # 재접속 거절 또는 서버 수용 한도 초과 - 다시 시도하지 않고 종료
+            self.handler.handle_message(message)
+            return True
+        return False
+
+    async def _reconnect(self) -> asyncio.StreamReader:
+        """세션 토큰으로 재접속 (점점 간격을 늘려 재시도).
+
+        Raises:
+            ConnectionError: 세션 토큰이 없거나 모든 시도가 실패한 경우
+        """
+        if self.writer is not None:
+            self.writer.close()
+        if self.session is None:
+            raise ConnectionError("서버 연결 종료")
+        for attempt in range(self.reconnect_attempts):
+            await asyncio.sleep(0.5 * 2 ** attempt)
+            # 핸들러가 화면에 알릴 수 있도록 세션 내부 메시지로 전달 (모르는 종류는 무시됨)
+            self.handler.handle_message({"type": "reconnecting", "data": {"attempt": attempt + 1}})
+            try:
+                return await self._connect(first=False)
+            except OSError:
+                continue
+        raise ConnectionError("재접속 실패")
@@ -0,0 +1,308 @@
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from yacht_scoring import (
+    CATEGORIES, MULTISETS, SCORE_TABLE, UPPER_BONUS, UPPER_BONUS_THRESHOLD, UPPER_CATEGORY_COUNT,
+    multiset_indices
+)
+
+MAX_SCORE = 375  # 이론상 최고 점수 (상단 105 + 보너스 35 + 하단 235)
+_CATEGORY_BITS = np.arange(len(CATEGORIES))
+# 조합별로 가장 많이 나온 눈 (개수가 같으면 큰 눈) - 탐욕 정책이 남길 눈
+_MOST_COMMON = np.array([max(range(1, 7), key=lambda f: (m.count(f), f)) for m in MULTISETS])
+
+
+class GreedyPolicy:
+    """가장 많이 나온 눈을 남기고, 당장 점수가 가장 높은 카테고리를 고르는 정책."""
+
+    name = "greedy"
+
+    def reroll(self, dice: np.ndarray, filled: np.ndarray, upper: np.ndarray, rolls_left: int,
+               rng: np.random.Generator) -> np.ndarray:
+        """다시 굴릴 주사위 선택.
+
+        Args:
+            dice: (N, 5) 현재 주사위
+            filled: (N,) 채운 카테고리 비트마스크
+            upper: (N,) 상단 합계
+            rolls_left: 남은 굴리기 횟수
+            rng: 난수 생성기
+
+        Returns:
+            (N, 5) bool 배열. True인 위치를 다시 굴림
+        """
+        target = _MOST_COMMON[multiset_indices(dice)]
+        return dice != target[:, None]
+
+    def choose(self, dice: np.ndarray, filled: np.ndarray, upper: np.ndarray,
+               rng: np.random.Generator) -> np.ndarray:
+        """점수를 기록할 카테고리 선택.
+
+        Args:
+            dice: (N, 5) 최종 주사위
+            filled: (N,) 채운 카테고리 비트마스크
+            upper: (N,) 상단 합계
+            rng: 난수 생성기
+
+        Returns:
+            (N,) 카테고리 인덱스 배열
+        """
+        scores = np.where(_filled_matrix(filled), -1, SCORE_TABLE[multiset_indices(dice)])
+        return np.argmax(scores, axis=1)
+
+
+class RandomPolicy:
+    """무작위로 다시 굴리고 무작위 빈 카테고리를 고르는 정책 (비교 기준용)."""
+
+    name = "random"
+
+    def reroll(self, dice, filled, upper, rolls_left, rng):
+        """각 주사위를 1/2 확률로 다시 굴림."""
+        return rng.random(dice.shape) < 0.5
+
+    def choose(self, dice, filled, upper, rng):
+        """빈 카테고리 중 하나를 무작위로 선택."""
+        keys = rng.random((len(dice), len(CATEGORIES)))
+        keys[_filled_matrix(filled)] = -1
+        return np.argmax(keys, axis=1)
+
+
+class OptimalPolicy:
+    """솔버의 기대값 테이블로 최적의 수를 두는 정책.
+
+    같은 (mask, upper) 상태의 게임들을 묶어 상태별 계산을 한 번만 수행.
+    """
+
+    name = "optimal"
+
+    def __init__(self, chunk_size: int = 1024):
+        """기대값 테이블 로드.
+
+        Args:
+            chunk_size: 남길 주사위 평가를 한 번에 처리할 게임 수 (메모리 사용량 조절)
+
+        Raises:
+            FileNotFoundError: 기대값 테이블 파일이 없는 경우
+        """
+        from yacht_solver import KEEPS, SUB_KEEPS, TRANSITIONS, load_strategy
+
+        self.strategy = load_strategy()
+        if self.strategy is None:
+            raise FileNotFoundError("기대값 테이블 없음 (python app/src/yacht_solver.py 로 생성)")
+        self.chunk_size = chunk_size
+        self.sub_keeps = SUB_KEEPS
+        self.transitions = TRANSITIONS
+        # 남길 조합별 눈 개수 (462, 6)
+        self.keep_counts = np.array([[keep.count(f) for f in range(1, 7)] for keep in KEEPS])
+
+    def _after_values(self, filled: np.ndarray, upper: np.ndarray, rolls_left: int) -> np.ndarray:
+        """게임별로 다음 굴림 이후 조합 가치 배열을 모음."""
+        states, inverse = np.unique(filled * 64 + np.minimum(upper, UPPER_BONUS_THRESHOLD), return_inverse=True)
+        stage = 0 if rolls_left == 1 else 1  # 남은 굴리기 1번이면 마지막 굴림 후 가치 사용
+        table = np.stack([self.strategy.turn_values(int(s) // 64, int(s) % 64)[stage] for s in states])
+        return table[inverse.ravel()]
+
+    def reroll(self, dice, filled, upper, rolls_left, rng):
+        """기대값이 가장 높은 남길 조합을 고르고, 나머지 위치를 다시 굴림."""
+        after = self._after_values(filled, upper, rolls_left)
+        candidates = self.sub_keeps[multiset_indices(dice)]  # (N, 32)
+        best = np.empty(len(dice), dtype=np.int64)
+        for start in range(0, len(dice), self.chunk_size):
+            part = slice(start, start + self.chunk_size)
+            values = np.einsum("nkr,nr->nk", self.transitions[candidates[part]], after[part])
+            best[part] = candidates[part][np.arange(len(values)), np.argmax(values, axis=1)]
+
+        # 남길 조합에 들어가지 않는 주사위 위치를 앞에서부터 표시
+        remaining = self.keep_counts[best].copy()
+        rows = np.arange(len(dice))
+        mask = np.empty(dice.shape, dtype=bool)
+        for i in range(5):
+            face = dice[:, i] - 1
+            keep = remaining[rows, face] > 0
+            remaining[rows, face] -= keep
+            mask[:, i] = ~keep
+        return mask
+
+    def choose(self, dice, filled, upper, rng):
+        """점수 + 보너스 + 이후 기대값이 가장 큰 카테고리 선택."""
+        ev = self.strategy.ev
+        scores = SCORE_TABLE[multiset_indices(dice)].astype(np.float64)
+        capped = np.minimum(upper, UPPER_BONUS_THRESHOLD)
+        values = np.full(scores.shape, -np.inf)
+        for c in range(len(CATEGORIES)):
+            is_open = (filled >> c & 1) == 0
+            next_upper = capped
+            value = scores[:, c].copy()
+            if c < UPPER_CATEGORY_COUNT:
+                raw = capped + scores[:, c].astype(np.int64)
+                next_upper = np.minimum(raw, UPPER_BONUS_THRESHOLD)
+                value += np.where((capped < UPPER_BONUS_THRESHOLD) & (raw >= UPPER_BONUS_THRESHOLD), UPPER_BONUS, 0)
+            value += ev[filled | 1 << c, next_upper]
+            values[:, c] = np.where(is_open, value, -np.inf)
+        return np.argmax(values, axis=1)
+
+
+POLICIES = {"greedy": GreedyPolicy, "random": RandomPolicy, "optimal": OptimalPolicy}
+
+
+def _filled_matrix(filled: np.ndarray) -> np.ndarray:
+    """비트마스크를 (N, 13) bool 행렬로 변환."""
+    return (filled[:, None] >> _CATEGORY_BITS) & 1 == 1
+
+
+def play_sheets(count: int, policy, rng: np.random.Generator) -> np.ndarray:
+    """점수표 여러 장을 동시에 13턴 끝까지 진행.
+
+    Args:
+        count: 동시에 진행할 점수표 수
+        policy: reroll / choose 메서드를 가진 정책 객체
+        rng: 난수 생성기
+
+    Returns:
+        (count, 13) 카테고리별 기록 점수 배열
+    """
+    rows = np.arange(count)
+    filled = np.zeros(count, dtype=np.int64)
+    upper = np.zeros(count, dtype=np.int64)
+    sheet = np.zeros((count, len(CATEGORIES)), dtype=np.int16)
+
+    for _ in range(len(CATEGORIES)):
+        dice = rng.integers(1, 7, size=(count, 5))
+        for rolls_left in (2, 1):
+            mask = policy.reroll(dice, filled, upper, rolls_left, rng)
+            dice = np.where(mask, rng.integers(1, 7, size=(count, 5)), dice)
+        category = policy.choose(dice, filled, upper, rng)
+        scores = SCORE_TABLE[multiset_indices(dice), category]
+        sheet[rows, category] = scores
+        filled |= 1 << category
+        upper += np.where(category < UPPER_CATEGORY_COUNT, scores, 0)
+    return sheet
+
+
+def simulate_chunk(games: int, policies: tuple[str, str], seed) -> dict:
+    """2인 게임 여러 판을 진행하고 합산용 통계 반환.
+
+    Args:
+        games: 진행할 게임 수
+        policies: (플레이어 1 정책, 플레이어 2 정책) 이름
+        seed: np.random.SeedSequence 또는 정수 시드
+
+    Returns:
+        플레이어별 점수 히스토그램, 보너스 횟수, 카테고리 점수 합, 승리 횟수
+    """
+    rng = np.random.default_rng(seed)
+    totals = []
+    result = {"games": games, "players": []}
+    for name in policies:
+        sheet = play_sheets(games, POLICIES[name](), rng)
+        upper = sheet[:, :UPPER_CATEGORY_COUNT].sum(axis=1)
+        bonus = upper >= UPPER_BONUS_THRESHOLD
+        total = sheet.sum(axis=1, dtype=np.int64) + bonus * UPPER_BONUS
+        totals.append(total)
+        result["players"].append({
+            "policy": name,
+            "histogram": np.bincount(total, minlength=MAX_SCORE + 1),
+            "bonus": int(bonus.sum()),
+            "category_sums": sheet.sum(axis=0, dtype=np.int64),
+        })
+    # 동점이면 플레이어 2 승리 (YachtRoom.end_game과 같은 규칙)
+    result["wins"] = np.array([int((totals[0] > totals[1]).sum()), int((totals[0] <= totals[1]).sum())])
+    return result
+
+
+def merge(results: list[dict]) -> dict:
+    """여러 조각의 통계를 합산."""
+    merged = results[0]
+    for part in results[1:]:
+        merged["games"] += part["games"]
+        merged["wins"] += part["wins"]
+        for mine, theirs in zip(merged["players"], part["players"]):
+            mine["histogram"] += theirs["histogram"]
+            mine["bonus"] += theirs["bonus"]
+            mine["category_sums"] += theirs["category_sums"]
+    return merged
+
+
+def summarize(merged: dict) -> dict:
+    """합산한 통계를 분포 요약으로 변환.
+
+    Returns:
+        플레이어별 평균·표준편차·백분위 점수, 보너스 비율, 카테고리 평균과 승률
+    """
+    games = merged["games"]
+    players = []
+    for player in merged["players"]:
+        histogram = player["histogram"]
+        values = np.arange(len(histogram))
+        mean = float((histogram * values).sum() / games)
+        variance = float((histogram * (values - mean) ** 2).sum() / games)
+        cumulative = np.cumsum(histogram)
+        players.append({
+            "policy": player["policy"],
+            "mean": round(mean, 3),
+            "std": round(variance ** 0.5, 3),
+            "percentiles": {f"p{p}": int(np.searchsorted(cumulative, games * p / 100)) for p in (1, 10, 50, 90, 99)},
+            "max": int(values[histogram > 0].max()),
+            "bonus_rate": round(player["bonus"] / games, 4),
+            "category_means": {c: round(float(s) / games, 3) for c, s in zip(CATEGORIES, player["category_sums"])},
+        })
+    return {
+        "games": games,
+        "win_rate": [round(int(w) / games, 4) for w in merged["wins"]],
+        "players": players,
+    }
+
+
+def run_simulation(games: int, policies: tuple[str, str] = ("greedy", "greedy"), workers: int = 1,
+                   seed: int | None = None, chunk_games: int = 50_000) -> dict:
+    """게임을 조각으로 나눠 (필요하면 프로세스 풀에서) 시뮬레이션.
+
+    Args:
+        games: 전체 게임 수
+        policies: (플레이어 1 정책, 플레이어 2 정책) 이름
+        workers: 프로세스 수 (1이면 현재 프로세스에서 실행)
+        seed: 재현용 시드 (None이면 무작위)
+        chunk_games: 한 조각에서 동시에 진행할 게임 수
+
+    Returns:
+        summarize 결과
+
+    Raises:
+        ValueError: 게임 수나 조각당 게임 수가 1보다 작은 경우 (합칠 조각이 없음)
+    """
+    if games < 1 or chunk_games < 1:
+        raise ValueError(f"게임 수와 조각당 게임 수는 1 이상이어야 함: {games}, {chunk_games}")
+    sizes = [min(chunk_games, games - start) for start in range(0, games, chunk_games)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))  # 조각마다 독립된 난수열
+    if workers <= 1:
+        results = [simulate_chunk(n, policies, s) for n, s in zip(sizes, seeds)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(simulate_chunk, sizes, [policies] * len(sizes), seeds))
+    return summarize(merge(results))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="야추 몬테카를로 시뮬레이션")
+    parser.add_argument("-n", "--games", type=int, default=100_000, help="진행할 게임 수")
+    parser.add_argument("-p", "--policy", nargs="+", default=["greedy"], choices=list(POLICIES),
+                        help="플레이어 정책 (하나면 두 플레이어 모두 사용)")
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 1, help="프로세스 수")
+    parser.add_argument("--seed", type=int, help="재현용 시드")
+    parser.add_argument("--chunk", type=int, default=50_000, help="조각당 게임 수")
+    args = parser.parse_args()
+    if args.games < 1 or args.chunk < 1:
+        parser.error("--games와 --chunk는 1 이상이어야 합니다")
+
+    chosen = tuple(args.policy * 2)[:2] if len(args.policy) == 1 else tuple(args.policy[:2])
+    started = time.perf_counter()
+    summary = run_simulation(args.games, chosen, args.workers, args.seed, args.chunk)
+    elapsed = time.perf_counter() - started
+    summary["elapsed"] = round(elapsed, 3)
+    summary["games_per_minute"] = round(args.games / elapsed * 60)
+    print(json.dumps(summary, indent=2, ensure_ascii=False))
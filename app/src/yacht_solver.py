@@ -0,0 +1,349 @@
+import functools
+import itertools
+import math
+import os
+import sys
+import time
+
+import numpy as np
+
+from yacht_scoring import (
+    CATEGORIES, CATEGORY_INDEX, MULTISETS, MULTISET_INDEX, SCORE_TABLE,
+    UPPER_BONUS, UPPER_BONUS_THRESHOLD, UPPER_CATEGORY_COUNT
+)
+
+# 기대값 테이블 기본 저장 위치 (환경 변수로 변경 가능)
+DEFAULT_TABLE_PATH = os.environ.get(
+    "YACHT_EV_TABLE", os.path.join(os.path.dirname(os.path.abspath(__file__)), "yacht_ev.npy")
+)
+
+FULL_MASK = (1 << len(CATEGORIES)) - 1  # 13개 카테고리를 모두 채운 상태
+UPPER_STATES = UPPER_BONUS_THRESHOLD + 1  # 상단 합계 0-63 (63 이상은 63으로 취급)
+TURN_CACHE_SIZE = 4096  # Strategy마다 캐시할 상태별 굴림 단계 가치 수
+
+# 남겨둘 주사위 조합 462가지 (0-5개, 정렬된 중복 조합)
+KEEPS = tuple(
+    keep
+    for size in range(6)
+    for keep in itertools.combinations_with_replacement(range(1, 7), size)
+)
+KEEP_INDEX = {keep: i for i, keep in enumerate(KEEPS)}
+
+
+def _build_transitions() -> np.ndarray:
+    """남긴 주사위 → 다시 굴린 뒤 최종 조합의 확률 행렬 생성.
+
+    Returns:
+        (462, 252) 크기의 행렬. [k, r]은 조합 k를 남기고 나머지를 굴렸을 때 조합 r이 나올 확률
+    """
+    transitions = np.zeros((len(KEEPS), len(MULTISETS)))
+    for k, keep in enumerate(KEEPS):
+        n = 5 - len(keep)
+        for outcome in itertools.combinations_with_replacement(range(1, 7), n):
+            # 다항 분포 확률: n! / (각 눈 개수의 계승 곱) / 6^n
+            ways = math.factorial(n)
+            for value in set(outcome):
+                ways //= math.factorial(outcome.count(value))
+            r = MULTISET_INDEX[tuple(sorted(keep + outcome))]
+            transitions[k, r] += ways / 6 ** n
+    return transitions
+
+
+def _build_sub_keeps() -> np.ndarray:
+    """각 조합에서 남길 수 있는 부분 조합 인덱스 표 생성.
+
+    부분 조합은 최대 32가지이며, 모자란 칸은 전체 보관(조합 자신)으로 채움.
+
+    Returns:
+        (252, 32) 크기의 KEEPS 인덱스 배열
+    """
+    sub_keeps = np.empty((len(MULTISETS), 32), dtype=np.int64)
+    for r, multiset in enumerate(MULTISETS):
+        subsets = {
+            tuple(multiset[i] for i in range(5) if bits >> i & 1) for bits in range(32)
+        }
+        row = sorted(KEEP_INDEX[s] for s in subsets)
+        sub_keeps[r] = row + [KEEP_INDEX[multiset]] * (32 - len(row))
+    return sub_keeps
+
+
+def _build_reachable_uppers() -> np.ndarray:
+    """채운 상단 항목 조합별로 실제로 나올 수 있는 상단 합계 표 생성.
+
+    Returns:
+        (64, 64) bool 배열. [upper_mask, upper]는 해당 상단 합계가 가능한지 여부
+    """
+    reachable = np.zeros((1 << UPPER_CATEGORY_COUNT, UPPER_STATES), dtype=bool)
+    for upper_mask in range(1 << UPPER_CATEGORY_COUNT):
+        totals = {0}
+        for c in range(UPPER_CATEGORY_COUNT):
+            if upper_mask >> c & 1:
+                # 눈 (c + 1)이 0-5개 나온 경우의 점수를 더함
+                totals = {t + count * (c + 1) for t in totals for count in range(6)}
+        reachable[upper_mask, [min(t, UPPER_BONUS_THRESHOLD) for t in totals]] = True
+    return reachable
+
+
+TRANSITIONS = _build_transitions()
+SUB_KEEPS = _build_sub_keeps()
+REACHABLE_UPPERS = _build_reachable_uppers()
+_START = TRANSITIONS[KEEP_INDEX[()]]  # 주사위 5개를 모두 굴렸을 때의 조합 확률
+_SCORES = SCORE_TABLE.astype(np.float64)
+_UPPER_VALUES = np.arange(UPPER_STATES)
+
+
+def state_of(scores: dict) -> tuple[int, int]:
+    """기록된 점수로부터 솔리테어 상태 계산.
+
+    Args:
+        scores: 카테고리명 → 점수 딕셔너리
+
+    Returns:
+        (채운 카테고리 비트마스크, 63으로 제한한 상단 합계)
+    """
+    mask = 0
+    upper = 0
+    for category, value in scores.items():
+        index = CATEGORY_INDEX[category]
+        mask |= 1 << index
+        if index < UPPER_CATEGORY_COUNT:
+            upper += value
+    return mask, min(upper, UPPER_BONUS_THRESHOLD)
+
+
+def _final_values(ev: np.ndarray, masks: np.ndarray, uppers: np.ndarray) -> np.ndarray:
+    """마지막 굴림 이후 각 조합에서 최선의 카테고리를 골랐을 때의 가치 계산.
+
+    Args:
+        ev: (8192, 64) 기대값 테이블 (다음 단계 상태가 채워져 있어야 함)
+        masks: (S,) 상태별 채운 카테고리 비트마스크
+        uppers: (S,) 상태별 상단 합계
+
+    Returns:
+        (S, 252) 크기의 배열. 해당 조합에서 점수 + 이후 기대값의 최대값
+    """
+    best = np.full((len(masks), len(MULTISETS)), -np.inf)
+    for c in range(len(CATEGORIES)):
+        is_open = (masks >> c & 1) == 0
+        if not is_open.any():
+            continue
+        rows = np.nonzero(is_open)[0]
+        next_masks = (masks[rows] | 1 << c)[:, None]
+        scores = _SCORES[:, c][None, :]
+        if c < UPPER_CATEGORY_COUNT:
+            # 상단 항목은 상단 합계를 늘리고, 기준을 처음 넘기면 보너스 획득
+            raw = uppers[rows, None] + SCORE_TABLE[:, c][None, :]
+            next_uppers = np.minimum(raw, UPPER_BONUS_THRESHOLD)
+            bonus = np.where((uppers[rows, None] < UPPER_BONUS_THRESHOLD) & (raw >= UPPER_BONUS_THRESHOLD),
+                             UPPER_BONUS, 0)
+            value = scores + bonus + ev[next_masks, next_uppers]
+        else:
+            value = scores + ev[next_masks, uppers[rows, None]]
+        best[rows] = np.maximum(best[rows], value)
+    return best
+
+
+def _reroll_step(values: np.ndarray) -> np.ndarray:
+    """굴림 직후 조합의 가치를 한 단계 이전 굴림 직후의 가치로 변환.
+
+    각 조합에서 남길 주사위를 최선으로 골랐을 때의 기대값.
+
+    Args:
+        values: (S, 252) 다음 굴림 결과 조합별 가치
+
+    Returns:
+        (S, 252) 이번 굴림 결과 조합별 가치
+    """
+    keep_values = values @ TRANSITIONS.T  # (S, 462) 남긴 조합별 기대값
+    return keep_values[:, SUB_KEEPS].max(axis=2)
+
+
+def solve(chunk_size: int = 2048, verbose: bool = False) -> np.ndarray:
+    """모든 솔리테어 상태의 최종 점수 기대값 테이블 계산.
+
+    채운 카테고리가 많은 상태부터 동적 계획법으로 거슬러 올라가며,
+    한 턴 안의 세 번 굴림과 남길 주사위 선택을 모두 최적으로 둔다고 가정.
+    도달할 수 없는 (mask, upper) 상태는 0으로 남음.
+
+    Args:
+        chunk_size: 한 번에 계산할 상태 수 (메모리 사용량 조절)
+        verbose: 진행 상황 출력 여부
+
+    Returns:
+        (8192, 64) float32 배열. [mask, upper]는 해당 상태에서 앞으로 얻을 점수의 기대값
+    """
+    ev = np.zeros((FULL_MASK + 1, UPPER_STATES), dtype=np.float32)
+    by_filled = [[] for _ in range(len(CATEGORIES) + 1)]
+    for mask in range(FULL_MASK + 1):
+        by_filled[mask.bit_count()].append(mask)
+
+    started = time.perf_counter()
+    for filled in range(len(CATEGORIES) - 1, -1, -1):
+        layer = np.array(by_filled[filled], dtype=np.int64)
+        masks = np.repeat(layer, UPPER_STATES)
+        uppers = np.tile(_UPPER_VALUES, len(layer))
+        # 도달할 수 없는 상단 합계 상태는 건너뜀
+        reachable = REACHABLE_UPPERS[masks & (1 << UPPER_CATEGORY_COUNT) - 1, uppers]
+        masks, uppers = masks[reachable], uppers[reachable]
+        for start in range(0, len(masks), chunk_size):
+            m = masks[start:start + chunk_size]
+            u = uppers[start:start + chunk_size]
+            values = _final_values(ev, m, u)
+            values = _reroll_step(_reroll_step(values))
+            ev[m, u] = values @ _START
+        if verbose:
+            print(f"채운 카테고리 {filled}개 완료 ({time.perf_counter() - started:.1f}초)")
+    return ev
+
+
+def build_table(path: str = DEFAULT_TABLE_PATH, verbose: bool = False) -> None:
+    """기대값 테이블을 계산해 바이너리 파일로 저장.
+
+    Args:
+        path: 저장할 .npy 파일 경로
+        verbose: 진행 상황 출력 여부
+    """
+    ev = solve(verbose=verbose)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        np.save(f, ev)
+    os.replace(tmp_path, path)  # 다른 프로세스가 덜 쓴 파일을 읽지 않도록 교체
+
+
+def _turn_values(ev: np.ndarray, mask: int, upper: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """한 상태의 굴림 단계별 조합 가치 계산 (Strategy.turn_values로 상태별 캐시).
+
+    Args:
+        ev: 기대값 테이블
+        mask: 채운 카테고리 비트마스크
+        upper: 63으로 제한한 상단 합계
+
+    Returns:
+        (마지막 굴림 후, 두 번째 굴림 후, 첫 굴림 후) 조합별 가치 배열
+    """
+    final = _final_values(ev, np.array([mask]), np.array([upper]))
+    second = _reroll_step(final)
+    first = _reroll_step(second)
+    return final[0], second[0], first[0]
+
+
+class Strategy:
+    """기대값 테이블을 이용한 최적 수 안내 클래스.
+
+    테이블은 메모리 맵으로 열어 프로세스마다 다시 계산하거나 복사하지 않음.
+    """
+
+    def __init__(self, path: str = DEFAULT_TABLE_PATH):
+        """테이블 파일을 메모리 맵으로 열기.
+
+        Args:
+            path: build_table로 만든 .npy 파일 경로
+        """
+        self.ev = np.load(path, mmap_mode="r")
+        # 캐시를 인스턴스마다 두어 Strategy를 버리면 캐시와 메모리 맵도 함께 해제되도록 함
+        # (메서드에 lru_cache를 걸면 self가 키가 되어 모든 인스턴스가 프로세스 끝까지 남음)
+        self.turn_values = functools.lru_cache(maxsize=TURN_CACHE_SIZE)(functools.partial(_turn_values, self.ev))
+
+    def expected_score(self, scores: dict) -> float:
+        """현재 기록 상태에서 앞으로 얻을 점수의 기대값.
+
+        Args:
+            scores: 카테고리명 → 점수 딕셔너리
+
+        Returns:
+            남은 턴을 최적으로 진행했을 때의 추가 점수 기대값
+        """
+        mask, upper = state_of(scores)
+        return float(self.ev[mask, upper])
+
+    def best_category(self, mask: int, upper: int, dice: list[int]) -> tuple[str, float]:
+        """현재 주사위로 기록할 최선의 카테고리 계산.
+
+        Args:
+            mask: 채운 카테고리 비트마스크
+            upper: 63으로 제한한 상단 합계
+            dice: 5개 주사위 값의 리스트
+
+        Returns:
+            (카테고리명, 기록 후 최종 기대값)
+        """
+        r = MULTISET_INDEX[tuple(sorted(dice))]
+        best, best_value = None, -np.inf
+        for c, category in enumerate(CATEGORIES):
+            if mask >> c & 1:
+                continue
+            value = int(SCORE_TABLE[r, c])
+            next_upper = upper
+            if c < UPPER_CATEGORY_COUNT:
+                next_upper = min(upper + value, UPPER_BONUS_THRESHOLD)
+                if upper < UPPER_BONUS_THRESHOLD <= upper + value:
+                    value += UPPER_BONUS
+            value += float(self.ev[mask | 1 << c, next_upper])
+            if value > best_value:
+                best, best_value = category, value
+        return best, best_value
+
+    def hint(self, mask: int, upper: int, dice: list[int], rolls_left: int) -> dict:
+        """현재 턴에서 둘 최적의 수 계산.
+
+        Args:
+            mask: 채운 카테고리 비트마스크
+            upper: 상단 합계 (63 이상은 63으로 취급)
+            dice: 5개 주사위 값의 리스트 (아직 굴리지 않았으면 빈 리스트)
+            rolls_left: 남은 재굴리기 횟수
+
+        Returns:
+            {"action": "roll"}, {"action": "reroll", "reroll": [...]} 또는
+            {"action": "category", "category": ...} 형태의 안내와 기대값
+        """
+        upper = min(upper, UPPER_BONUS_THRESHOLD)
+        if not dice:
+            return {"action": "roll", "expected": float(self.ev[mask, upper])}
+        if rolls_left <= 0:
+            category, value = self.best_category(mask, upper, dice)
+            return {"action": "category", "category": category, "expected": value}
+
+        # 남은 굴리기 횟수에 맞는 단계의 가치로 남길 조합 선택
+        final, second, _ = self.turn_values(mask, upper)
+        after = final if rolls_left == 1 else second
+        r = MULTISET_INDEX[tuple(sorted(dice))]
+        candidates = SUB_KEEPS[r]
+        keep_values = TRANSITIONS[candidates] @ after
+        k = int(candidates[int(np.argmax(keep_values))])
+        keep = KEEPS[k]
+        if len(keep) == 5:
+            # 모두 남기는 것이 최선이면 바로 점수 기록
+            category, value = self.best_category(mask, upper, dice)
+            return {"action": "category", "category": category, "expected": value}
+
+        # 남길 조합에 포함되지 않은 주사위 위치를 재굴리기 대상으로 선택
+        remaining = list(keep)
+        reroll = []
+        for i, d in enumerate(dice):
+            if d in remaining:
+                remaining.remove(d)
+            else:
+                reroll.append(i)
+        return {"action": "reroll", "reroll": reroll, "expected": float(keep_values.max())}
+
+
+@functools.cache
+def load_strategy(path: str = DEFAULT_TABLE_PATH) -> Strategy | None:
+    """프로세스 전체에서 공유할 Strategy 로드.
+
+    Args:
+        path: 기대값 테이블 파일 경로
+
+    Returns:
+        Strategy 객체, 테이블 파일이 없으면 None
+    """
+    if not os.path.exists(path):
+        return None
+    return Strategy(path)
+
+
+if __name__ == "__main__":
+    target = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_TABLE_PATH
+    build_table(target, verbose=True)
+    print(f"기대값 테이블 저장 완료: {target}")
+    print(f"게임 시작 시점 기대 점수: {float(np.load(target, mmap_mode='r')[0, 0]):.2f}")
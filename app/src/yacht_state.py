@@ -0,0 +1,172 @@
+from array import array
+
+from yacht_scoring import CATEGORIES, CATEGORY_INDEX, UPPER_BONUS, UPPER_BONUS_THRESHOLD, UPPER_CATEGORY_COUNT
+
+FULL_MASK = (1 << len(CATEGORIES)) - 1  # 13개 카테고리를 모두 채운 비트마스크
+
+
+class PlayerState:
+    """플레이어 한 명의 점수표.
+
+    채운 카테고리는 13비트 마스크로, 점수는 카테고리 인덱스 순서의 고정 크기 정수 배열로 보관하고
+    총합과 상단 합계는 점수를 기록할 때마다 갱신하므로 조회 시 다시 합산하지 않음.
+    """
+
+    __slots__ = ("name", "filled", "scores", "total", "upper")
+
+    def __init__(self, name: str):
+        """빈 점수표 생성.
+
+        Args:
+            name: 플레이어 이름
+        """
+        self.name = name
+        self.filled = 0  # 비트 i = CATEGORIES[i] 기록 여부
+        self.scores = array("h", bytes(2 * len(CATEGORIES)))  # 카테고리 인덱스 → 점수
+        self.total = 0  # 기록된 점수 합계 (보너스 제외)
+        self.upper = 0  # 상단 항목 점수 합계
+
+    def has(self, index: int) -> bool:
+        """카테고리 기록 여부 확인.
+
+        Args:
+            index: 카테고리 인덱스
+
+        Returns:
+            이미 점수가 기록되어 있으면 True
+        """
+        return bool(self.filled >> index & 1)
+
+    def record(self, index: int, value: int) -> None:
+        """카테고리에 점수를 기록하고 합계 갱신.
+
+        Args:
+            index: 카테고리 인덱스
+            value: 기록할 점수
+        """
+        self.filled |= 1 << index
+        self.scores[index] = value
+        self.total += value
+        if index < UPPER_CATEGORY_COUNT:
+            self.upper += value
+
+    @property
+    def complete(self) -> bool:
+        """13개 카테고리를 모두 채웠는지 여부."""
+        return self.filled == FULL_MASK
+
+    def final_score(self) -> int:
+        """상단 보너스를 포함한 총점."""
+        return self.total + (UPPER_BONUS if self.upper >= UPPER_BONUS_THRESHOLD else 0)
+
+    def scores_dict(self) -> dict:
+        """기록된 점수를 카테고리명 → 점수 딕셔너리로 변환."""
+        filled = self.filled
+        return {c: self.scores[i] for i, c in enumerate(CATEGORIES) if filled >> i & 1}
+
+
+class GameState:
+    """두 플레이어 게임 한 판의 상태.
+
+    진행 중인 턴의 주사위와 남은 굴리기 횟수는 현재 플레이어의 것만 있으면 되므로
+    플레이어별이 아닌 게임 단위로 하나만 보관.
+    기존 JSON 형태(game_start, state_snapshot)로는 to_dict로 프로토콜 경계에서만 변환.
+    """
+
+    __slots__ = ("players", "current_player", "round", "game_over", "version", "dice", "rolls_left")
+
+    def __init__(self, names: tuple[str, str] = ("Player1", "Player2")):
+        """새 게임 상태 생성.
+
+        Args:
+            names: 플레이어 이름
+        """
+        self.players = tuple(PlayerState(name) for name in names)
+        self.current_player = 0  # 현재 턴 플레이어 인덱스 (0 또는 1)
+        self.round = 1  # 현재 라운드 (두 플레이어가 한 번씩 기록하면 증가)
+        self.game_over = False  # 게임 종료 플래그
+        self.version = 0  # 상태 버전 (점수가 기록될 때마다 1씩 증가)
+        self.dice = None  # 현재 턴의 주사위 (아직 굴리지 않았으면 None)
+        self.rolls_left = 0  # 현재 턴의 남은 재굴리기 횟수
+
+    def roll(self, dice: list[int]) -> None:
+        """현재 플레이어의 굴림 결과 반영.
+
+        첫 굴림이면 남은 재굴리기 횟수를 2로, 재굴림이면 1 줄임.
+
+        Args:
+            dice: 굴린 뒤의 주사위 5개
+        """
+        if self.dice is None:
+            self.rolls_left = 2  # 최대 3번까지 굴릴 수 있으므로 2번 남음
+        else:
+            self.rolls_left -= 1
+        self.dice = dice
+
+    def select(self, index: int, value: int) -> None:
+        """현재 플레이어의 점수를 기록하고 턴 종료.
+
+        Args:
+            index: 카테고리 인덱스
+            value: 기록할 점수
+        """
+        self.players[self.current_player].record(index, value)
+        self.end_turn()
+
+    def end_turn(self) -> None:
+        """턴 데이터를 비우고 다음 플레이어로 넘김."""
+        self.dice = None
+        self.rolls_left = 0
+        self.current_player = 1 - self.current_player
+        if self.current_player == 0:
+            self.round += 1  # 두 플레이어 모두 기록했으면 다음 라운드
+        self.version += 1
+
+    @property
+    def finished(self) -> bool:
+        """모든 플레이어가 점수표를 다 채웠는지 여부."""
+        return all(player.complete for player in self.players)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "GameState":
+        """to_dict 형태의 딕셔너리에서 게임 상태 복원.
+
+        Args:
+            data: to_dict 결과 (스냅샷 등에서 읽은 값)
+
+        Returns:
+            복원된 GameState
+        """
+        state = cls(tuple(player["name"] for player in data["players"]))
+        for player, saved in zip(state.players, data["players"]):
+            for category, value in saved["scores"].items():
+                player.record(CATEGORY_INDEX[category], value)
+        state.current_player = data["current_player"]
+        state.round = data["round"]
+        state.game_over = data["game_over"]
+        state.version = data["version"]
+        turn_data = data["players"][state.current_player]["turn_data"]
+        if "dice" in turn_data:
+            state.dice = list(turn_data["dice"])
+            state.rolls_left = turn_data["rolls_left"]
+        return state
+
+    def to_dict(self) -> dict:
+        """기존 프로토콜의 game_state JSON 형태로 변환.
+
+        Returns:
+            current_player, players(name/scores/turn_data), round, game_over, version을 담은 딕셔너리
+        """
+        players = []
+        for i, player in enumerate(self.players):
+            turn_data = {}
+            if i == self.current_player and self.dice is not None:
+                turn_data = {"dice": list(self.dice), "rolls_left": self.rolls_left}
+            players.append({"name": player.name, "scores": player.scores_dict(), "turn_data": turn_data})
+        return {
+            "current_player": self.current_player,
+            "players": players,
+            "round": self.round,
+            "game_over": self.game_over,
+            "version": self.version
+        }
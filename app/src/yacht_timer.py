@@ -0,0 +1,120 @@
+import asyncio
+import math
+import time
+
+from yacht_log import logger
+
+TICK = 0.1  # 휠 한 칸의 시간(초) - 만료는 최대 이만큼 늦게 처리됨
+SLOTS = 512  # 휠 칸 수 (한 바퀴 51.2초, 더 먼 타이머는 바퀴 수를 세어 처리)
+
+
+class Timer:
+    """휠에 걸린 타이머 하나."""
+
+    __slots__ = ("due", "callback", "args", "slot")
+
+    def __init__(self, due: int, callback, args: tuple, slot: dict):
+        """타이머 생성 (보통은 TimerWheel.schedule 사용).
+
+        Args:
+            due: 만료될 휠 틱 번호
+            callback: 만료 시 호출할 함수
+            args: callback에 넘길 인자
+            slot: 타이머가 들어 있는 휠 칸
+        """
+        self.due = due
+        self.callback = callback
+        self.args = args
+        self.slot = slot
+
+    @property
+    def active(self) -> bool:
+        """아직 만료되거나 취소되지 않았는지 여부."""
+        return self.slot is not None
+
+    def cancel(self) -> None:
+        """타이머 취소 (O(1), 이미 만료되었거나 취소했으면 아무 일도 하지 않음)."""
+        if self.slot is not None:
+            del self.slot[self]
+            self.slot = None
+
+
+class TimerWheel:
+    """해시 타이머 휠.
+
+    만료 시각을 TICK 단위로 잘라 SLOTS개 칸 중 하나(틱 번호 % SLOTS)에 넣고,
+    틱마다 그 칸만 확인하므로 타이머 수와 관계없이 등록·취소가 O(1).
+    방마다 턴 제한 시간, 연결마다 유휴 시간처럼 대부분 만료 전에 취소되는 타이머가
+    수만 개 있어도 힙(loop.call_later)처럼 취소된 항목이 쌓이거나 O(log n) 비용이 들지 않음.
+    """
+
+    def __init__(self, tick: float = TICK, slots: int = SLOTS, clock=time.monotonic):
+        """빈 휠 생성.
+
+        Args:
+            tick: 한 칸의 시간(초)
+            slots: 칸 수
+            clock: 현재 시각 함수 (초)
+        """
+        self.tick = tick
+        self.clock = clock
+        self.slots: list[dict[Timer, None]] = [{} for _ in range(slots)]  # 칸마다 삽입 순서를 지키는 집합
+        self.started = clock()
+        self.current = 0  # 마지막으로 처리한 틱 번호
+
+    def __len__(self) -> int:
+        """대기 중인 타이머 수 (지표용 - 모든 칸을 훑음)."""
+        return sum(len(slot) for slot in self.slots)
+
+    def schedule(self, delay: float, callback, *args) -> Timer:
+        """delay초 뒤에 callback(*args) 호출 예약.
+
+        Args:
+            delay: 대기 시간(초)
+            callback: 만료 시 호출할 함수
+            *args: callback에 넘길 인자
+
+        Returns:
+            취소에 사용할 타이머
+        """
+        due = max(math.ceil((self.clock() + delay - self.started) / self.tick), self.current + 1)
+        slot = self.slots[due % len(self.slots)]
+        timer = Timer(due, callback, args, slot)
+        slot[timer] = None
+        return timer
+
+    def advance(self, now: float | None = None) -> int:
+        """now까지 지난 틱의 칸을 확인해 만료된 타이머 실행.
+
+        이벤트 루프가 오래 멈췄다가 돌아와도 한 바퀴 이상은 돌지 않고 모든 칸을 한 번씩만 확인.
+
+        Args:
+            now: 현재 시각 (None이면 clock())
+
+        Returns:
+            실행한 타이머 수
+        """
+        target = int(((self.clock() if now is None else now) - self.started) / self.tick)
+        fired = 0
+        for tick in range(self.current + 1, self.current + 1 + min(target - self.current, len(self.slots))):
+            slot = self.slots[tick % len(self.slots)]
+            # 다음 바퀴 이후의 타이머는 남겨 두고, 콜백이 휠을 바꿀 수 있으므로 먼저 꺼냄
+            due = [timer for timer in slot if timer.due <= target]
+            for timer in due:
+                del slot[timer]
+                timer.slot = None
+            for timer in due:
+                try:
+                    timer.callback(*timer.args)
+                except Exception as e:
+                    logger.error("타이머 콜백 오류", callback=getattr(timer.callback, "__qualname__", timer.callback),
+                                 error=e)
+            fired += len(due)
+        self.current = max(self.current, target)
+        return fired
+
+    async def run(self) -> None:
+        """이벤트 루프에서 틱마다 advance 호출 (취소될 때까지)."""
+        while True:
+            await asyncio.sleep(self.tick)
+            self.advance()
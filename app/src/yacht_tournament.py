@@ -0,0 +1,373 @@
+import argparse
+import importlib
+import itertools
+import json
+import math
+import os
+import random
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from yacht_engine import YachtEngine
+from yacht_rng import DiceRNG, derive_seed
+from yacht_scoring import CATEGORIES, MULTISETS, UPPER_BONUS_THRESHOLD, score_all
+from yacht_solver import load_strategy
+from yacht_state import GameState, PlayerState
+
+ELO_START = 1500.0
+ELO_K = 16.0  # 게임 한 판마다 레이팅이 움직이는 최대 폭
+# 조합별로 가장 많이 나온 눈 (개수가 같으면 큰 눈) - 시뮬레이션의 탐욕 정책과 같은 규칙
+_MOST_COMMON = {multiset: max(range(1, 7), key=lambda f: (multiset.count(f), f)) for multiset in MULTISETS}
+
+
+class GreedyBot:
+    """가장 많이 나온 눈을 남기고, 당장 점수가 가장 높은 빈 카테고리를 고르는 봇."""
+
+    def __init__(self, seed: int = 0):
+        """봇 초기화 (무작위 요소 없음)."""
+
+    def reroll(self, dice: list[int], player: PlayerState, rolls_left: int) -> list[int]:
+        """다시 굴릴 주사위 위치 선택.
+
+        Args:
+            dice: 현재 주사위
+            player: 본인 점수표
+            rolls_left: 남은 재굴리기 횟수
+
+        Returns:
+            다시 굴릴 위치 (비어 있으면 바로 점수 기록)
+        """
+        target = _MOST_COMMON[tuple(sorted(dice))]
+        return [i for i, d in enumerate(dice) if d != target]
+
+    def choose(self, dice: list[int], player: PlayerState) -> int:
+        """점수를 기록할 카테고리 인덱스 선택.
+
+        Args:
+            dice: 최종 주사위
+            player: 본인 점수표
+
+        Returns:
+            비어 있는 카테고리 인덱스
+        """
+        scores = score_all(dice)
+        filled = player.filled
+        return max((i for i in range(len(CATEGORIES)) if not filled >> i & 1), key=scores.__getitem__)
+
+
+class RandomBot:
+    """무작위로 다시 굴리고 무작위 빈 카테고리를 고르는 봇 (비교 기준용)."""
+
+    def __init__(self, seed: int = 0):
+        """봇 초기화.
+
+        Args:
+            seed: 봇 자신의 선택에 쓸 시드 (주사위와 별개)
+        """
+        self.random = random.Random(seed)
+
+    def reroll(self, dice, player, rolls_left):
+        """각 주사위를 1/2 확률로 다시 굴림."""
+        return [i for i in range(5) if self.random.random() < 0.5]
+
+    def choose(self, dice, player):
+        """빈 카테고리 중 하나를 무작위로 선택."""
+        filled = player.filled
+        return self.random.choice([i for i in range(len(CATEGORIES)) if not filled >> i & 1])
+
+
+class OptimalBot:
+    """솔버의 기대값 테이블로 최적의 수를 두는 봇 (힌트와 같은 계산)."""
+
+    def __init__(self, seed: int = 0):
+        """기대값 테이블 로드.
+
+        Raises:
+            FileNotFoundError: 기대값 테이블 파일이 없는 경우
+        """
+        self.strategy = load_strategy()
+        if self.strategy is None:
+            raise FileNotFoundError("기대값 테이블 없음 (python app/src/yacht_solver.py 로 생성)")
+
+    def reroll(self, dice, player, rolls_left):
+        """기대값이 가장 높은 남길 조합 외의 주사위를 다시 굴림."""
+        hint = self.strategy.hint(player.filled, player.upper, dice, rolls_left)
+        return hint["reroll"] if hint["action"] == "reroll" else []
+
+    def choose(self, dice, player):
+        """점수 + 보너스 + 이후 기대값이 가장 큰 카테고리 선택."""
+        category, _ = self.strategy.best_category(player.filled, min(player.upper, UPPER_BONUS_THRESHOLD), dice)
+        return CATEGORIES.index(category)
+
+
+BOTS = {"greedy": GreedyBot, "random": RandomBot, "optimal": OptimalBot}
+
+
+def load_bot(spec: str, seed: int = 0):
+    """봇 이름 또는 "모듈:클래스" 경로로 봇 생성.
+
+    reroll(dice, player, rolls_left)와 choose(dice, player)를 가진 클래스면
+    어떤 모듈의 것이든 참가시킬 수 있음.
+
+    Args:
+        spec: BOTS의 키 또는 "package.module:ClassName"
+        seed: 봇 생성자에 넘길 시드
+
+    Returns:
+        봇 객체
+
+    Raises:
+        ValueError: 알 수 없는 봇 이름인 경우
+    """
+    if spec in BOTS:
+        return BOTS[spec](seed)
+    if ":" not in spec:
+        raise ValueError(f"알 수 없는 봇: {spec} (사용 가능: {', '.join(BOTS)} 또는 module:Class)")
+    module, name = spec.split(":", 1)
+    return getattr(importlib.import_module(module), name)(seed)
+
+
+def play_game(bots: tuple, seed: int) -> list[int]:
+    """봇 둘이 엔진을 직접 호출해 게임 한 판을 끝까지 진행 (소켓과 직렬화 없음).
+
+    Args:
+        bots: (플레이어 1 봇, 플레이어 2 봇)
+        seed: 주사위 시드
+
+    Returns:
+        플레이어별 최종 점수 (상단 보너스 포함)
+
+    Raises:
+        ValueError: 봇이 범위 밖이거나 이미 채운 카테고리를 고른 경우 (그대로 두면 턴이 넘어가지 않음)
+    """
+    engine = YachtEngine(GameState(), DiceRNG(seed))
+    state = engine.state
+    while not state.finished:
+        player_id = state.current_player
+        bot = bots[player_id]
+        player = state.players[player_id]
+        engine.roll(player_id)
+        while state.rolls_left > 0:
+            reroll = bot.reroll(state.dice, player, state.rolls_left)
+            if not reroll:
+                break
+            engine.roll(player_id, reroll)
+        choice = bot.choose(state.dice, player)
+        category = CATEGORIES[choice] if isinstance(choice, int) and 0 <= choice < len(CATEGORIES) else None
+        if category is None or engine.select(player_id, category) is None:
+            reason = engine.select_error(player_id, category) if category is not None else "unknown_category"
+            bot_type = type(bot)
+            raise ValueError(f"봇 {bot_type.__module__}:{bot_type.__qualname__} 이(가) 기록할 수 없는 카테고리 선택: "
+                             f"{choice!r} ({reason})")
+    return engine.result()[1]
+
+
+def play_match(specs: tuple[str, str], games: int, seed: int) -> list[tuple[int, int]]:
+    """두 봇의 대전 (프로세스 풀 작업 단위).
+
+    두 판씩 같은 주사위 시드로 선후공을 바꿔 진행해 선공 이점과 주사위 운의 영향을 줄임.
+
+    Args:
+        specs: (봇 A, 봇 B) 지정 문자열
+        games: 진행할 게임 수
+        seed: 대전 시드
+
+    Returns:
+        게임별 (봇 A 점수, 봇 B 점수)
+    """
+    a = load_bot(specs[0], derive_seed(seed, 0))
+    b = load_bot(specs[1], derive_seed(seed, 1))
+    results = []
+    for game in range(games):
+        dice_seed = derive_seed(seed, 2 + game // 2)
+        if game % 2 == 0:
+            results.append(tuple(play_game((a, b), dice_seed)))
+        else:
+            b_score, a_score = play_game((b, a), dice_seed)
+            results.append((a_score, b_score))
+    return results
+
+
+class Standing:
+    """참가자 한 명의 누적 성적."""
+
+    __slots__ = ("name", "spec", "elo", "points", "wins", "draws", "losses", "score_sum", "opponents")
+
+    def __init__(self, name: str, spec: str):
+        """빈 성적 생성.
+
+        Args:
+            name: 표시 이름 (같은 봇이 여럿이면 번호를 붙임)
+            spec: 봇 지정 문자열
+        """
+        self.name = name
+        self.spec = spec
+        self.elo = ELO_START
+        self.points = 0.0  # 대전 승점 (이기면 1, 비기면 0.5) - 스위스 방식 짝짓기 기준
+        self.wins = self.draws = self.losses = 0
+        self.score_sum = 0
+        self.opponents: set[str] = set()
+
+    @property
+    def games(self) -> int:
+        """진행한 게임 수."""
+        return self.wins + self.draws + self.losses
+
+    def to_dict(self) -> dict:
+        """출력용 딕셔너리."""
+        return {"name": self.name, "bot": self.spec, "elo": round(self.elo, 1), "points": self.points,
+                "games": self.games, "wins": self.wins, "draws": self.draws, "losses": self.losses,
+                "mean_score": round(self.score_sum / self.games, 2) if self.games else 0.0}
+
+
+def apply_results(a: Standing, b: Standing, results: list[tuple[int, int]]) -> None:
+    """대전 결과를 게임 순서대로 성적과 Elo 레이팅에 반영.
+
+    Args:
+        a: 봇 A 성적
+        b: 봇 B 성적
+        results: 게임별 (봇 A 점수, 봇 B 점수)
+    """
+    won = 0.0
+    for a_score, b_score in results:
+        actual = 1.0 if a_score > b_score else 0.5 if a_score == b_score else 0.0
+        expected = 1.0 / (1.0 + 10 ** ((b.elo - a.elo) / 400))
+        a.elo += ELO_K * (actual - expected)
+        b.elo -= ELO_K * (actual - expected)
+        won += actual
+        a.score_sum += a_score
+        b.score_sum += b_score
+        if actual == 1.0:
+            a.wins += 1
+            b.losses += 1
+        elif actual == 0.0:
+            a.losses += 1
+            b.wins += 1
+        else:
+            a.draws += 1
+            b.draws += 1
+    match = 1.0 if won > len(results) / 2 else 0.5 if won == len(results) / 2 else 0.0
+    a.points += match
+    b.points += 1.0 - match
+    a.opponents.add(b.name)
+    b.opponents.add(a.name)
+
+
+def swiss_pairs(standings: list[Standing]) -> tuple[list[tuple[Standing, Standing]], Standing | None]:
+    """승점이 비슷한 참가자끼리, 가능하면 아직 만나지 않은 상대와 짝지음.
+
+    Args:
+        standings: 전체 참가자 성적
+
+    Returns:
+        (짝 목록, 부전승 참가자 - 인원이 짝수면 None)
+    """
+    order = sorted(standings, key=lambda s: (-s.points, -s.elo, s.name))
+    bye = None
+    if len(order) % 2:
+        # 승점이 가장 낮은 참가자 중 한 명이 부전승 (승점 1)
+        bye = order.pop()
+        bye.points += 1.0
+    pairs = []
+    while order:
+        first = order.pop(0)
+        index = next((i for i, other in enumerate(order) if other.name not in first.opponents), 0)
+        pairs.append((first, order.pop(index)))
+    return pairs, bye
+
+
+def run_tournament(specs: list[str], fmt: str = "round-robin", games: int = 100, rounds: int | None = None,
+                   workers: int = 1, seed: int | None = None) -> dict:
+    """봇 토너먼트 진행.
+
+    대전마다 시드가 정해지고 Elo는 대전 순서대로 반영하므로,
+    같은 시드면 프로세스 수와 관계없이 같은 결과.
+
+    Args:
+        specs: 참가 봇 지정 문자열 목록
+        fmt: "round-robin" (모든 짝이 한 번씩) 또는 "swiss" (승점이 비슷한 상대와 rounds 라운드)
+        games: 대전 한 번의 게임 수
+        rounds: 스위스 방식 라운드 수 (None이면 ceil(log2(참가자 수)) + 1)
+        workers: 프로세스 수 (1이면 현재 프로세스에서 실행)
+        seed: 재현용 시드 (None이면 무작위)
+
+    Returns:
+        순위표, 대전 수, 게임 수를 담은 딕셔너리
+    """
+    seed = derive_seed(None, 0) if seed is None else seed  # 시드를 정하지 않았으면 임의로 정하고 결과에 남김
+    counts = Counter(specs)
+    seen = Counter()
+    standings = []
+    for spec in specs:
+        seen[spec] += 1
+        name = spec if counts[spec] == 1 else f"{spec}#{seen[spec]}"
+        standings.append(Standing(name, spec))
+
+    if fmt == "round-robin":
+        schedule = [list(itertools.combinations(standings, 2))]
+    elif fmt == "swiss":
+        schedule = None
+        rounds = rounds or math.ceil(math.log2(max(len(standings), 2))) + 1
+    else:
+        raise ValueError(f"알 수 없는 방식: {fmt}")
+
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    matches = 0
+    try:
+        for round_index in range(len(schedule) if schedule else rounds):
+            pairs = schedule[round_index] if schedule else swiss_pairs(standings)[0]
+            jobs = [((a.spec, b.spec), games, derive_seed(seed, matches + i)) for i, (a, b) in enumerate(pairs)]
+            if pool is None:
+                results = [play_match(*job) for job in jobs]
+            else:
+                results = list(pool.map(play_match, *zip(*jobs)))
+            for (a, b), result in zip(pairs, results):
+                apply_results(a, b, result)
+            matches += len(pairs)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    ranked = sorted(standings, key=lambda s: (-s.points, -s.elo) if fmt == "swiss" else (-s.elo, -s.points))
+    return {
+        "format": fmt,
+        "seed": seed,
+        "matches": matches,
+        "games": sum(s.games for s in standings) // 2,
+        "standings": [s.to_dict() for s in ranked],
+    }
+
+
+def print_standings(report: dict) -> None:
+    """순위표를 표 형태로 출력."""
+    print(f"{report['format']}: 대전 {report['matches']}회, 게임 {report['games']:,}판 "
+          f"({report['games_per_second']:,.0f} games/s, 시드 {report['seed']})")
+    print("순위  봇" + " " * 14 + "     Elo   승점      승     무      패   평균 점수")  # 한글은 2칸이라 직접 정렬
+    for rank, s in enumerate(report["standings"], 1):
+        print(f"{rank:>4}  {s['name']:<16}{s['elo']:>8.1f}{s['points']:>7.1f}{s['wins']:>8}{s['draws']:>7}"
+              f"{s['losses']:>8}{s['mean_score']:>12.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="야추 봇 토너먼트 (소켓 없이 게임 엔진을 직접 사용)")
+    parser.add_argument("bots", nargs="+", help=f"참가 봇 ({', '.join(BOTS)} 또는 module:Class, 같은 봇 여러 번 가능)")
+    parser.add_argument("-f", "--format", choices=("round-robin", "swiss"), default="round-robin")
+    parser.add_argument("-g", "--games", type=int, default=100, help="대전 한 번의 게임 수")
+    parser.add_argument("-r", "--rounds", type=int, help="스위스 방식 라운드 수")
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 1, help="프로세스 수")
+    parser.add_argument("--seed", type=int, help="재현용 시드")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args()
+
+    if len(args.bots) < 2:
+        parser.error("참가 봇은 둘 이상이어야 합니다")
+    started = time.perf_counter()
+    report = run_tournament(args.bots, args.format, args.games, args.rounds, args.workers, args.seed)
+    elapsed = time.perf_counter() - started
+    report["elapsed"] = round(elapsed, 3)
+    report["games_per_second"] = round(report["games"] / elapsed, 1)
+    if args.json:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+    else:
+        print_standings(report)
@@ -0,0 +1,328 @@
+import argparse
+import json
+import os
+import random
+import signal
+import sys
+import threading
+import time
+from collections import Counter, deque
+
+from yacht_metrics import add_page
+
+TRACE_SAMPLE = 0.01  # --trace만 지정했을 때 추적할 읽기 비율
+MAX_EVENTS = 100_000  # 메모리에 보관할 최근 스팬 수 (넘으면 오래된 것부터 버림)
+PROFILE_INTERVAL = 0.005  # 프로파일러가 호출 스택을 훑는 주기(초)
+PROFILE_TOP = 30  # 프로파일 보고서에 표시할 함수 수
+
+
+class Trace:
+    """표본으로 뽑힌 읽기 한 번(과 그 안의 메시지 처리)의 스팬 기록기.
+
+    방·플레이어 태그와 트레이스 뷰어의 줄 번호(tid)를 가지고 있어
+    스팬마다 시작 시각만 넘기면 됨.
+    """
+
+    __slots__ = ("tracer", "tid", "tags")
+
+    def __init__(self, tracer: "Tracer", tid: int, tags: dict):
+        """기록기 생성 (보통은 Tracer.sample 사용).
+
+        Args:
+            tracer: 스팬을 보관할 Tracer
+            tid: 트레이스 뷰어에서 스팬을 그릴 줄 번호
+            tags: 모든 스팬에 붙일 필드 (방, 플레이어)
+        """
+        self.tracer = tracer
+        self.tid = tid
+        self.tags = tags
+
+    def add(self, name: str, started: float, **fields) -> None:
+        """started부터 지금까지를 스팬 하나로 기록.
+
+        지표용으로 이미 잰 time.perf_counter 값을 그대로 받아 시각을 한 번 더 읽지 않음.
+
+        Args:
+            name: 단계 이름 (read, decode, process_message, calculate_score, broadcast)
+            started: 단계를 시작한 time.perf_counter 값
+            **fields: 스팬에 함께 남길 필드 (메시지 종류, 바이트 수 등)
+        """
+        self.tracer.record(name, self.tid, started, time.perf_counter(), {**self.tags, **fields} if fields else self.tags)
+
+
+class Tracer:
+    """메시지 처리 단계별 스팬을 모아 Chrome trace-event JSON으로 내보내는 추적기.
+
+    연결에서 한 번 읽을 때마다 sample_rate 확률로만 기록기를 만들고,
+    뽑히지 않은 읽기와 추적을 끈 서버는 확률 비교 또는 속성 확인 한 번만 하고 지나감.
+    스팬은 최근 MAX_EVENTS개만 링 버퍼에 보관하고, 줄 이름도 최근에 뽑힌 줄 MAX_EVENTS개까지만 남기므로
+    오래 켜 두어도 메모리가 늘지 않음.
+    """
+
+    def __init__(self, max_events: int = MAX_EVENTS):
+        """꺼진 상태의 추적기 생성.
+
+        Args:
+            max_events: 보관할 최대 스팬 수
+        """
+        self.sample_rate = 0.0  # 0이면 추적하지 않음
+        self.path: str | None = None  # 종료 시와 SIGUSR1 수신 시 기록을 저장할 파일
+        self.current: Trace | None = None  # 지금 처리 중인 메시지의 기록기 (방 안의 단계가 이어서 기록)
+        self.events: deque = deque(maxlen=max_events)  # (이름, 줄 번호, 시작, 끝, 필드)
+        self.threads: dict[int, str] = {}  # 줄 번호 → 트레이스 뷰어에 표시할 이름 (최근에 뽑힌 줄이 뒤)
+        # 시그널 처리기가 기록 도중에 끼어들어도 같은 스레드에서 다시 잡을 수 있도록 RLock
+        self._lock = threading.RLock()
+
+    def configure(self, sample_rate: float, path: str | None = None) -> None:
+        """명령행 옵션으로 추적 켜기.
+
+        Args:
+            sample_rate: 추적할 읽기 비율 (0-1, 0이면 끔)
+            path: 기록을 저장할 파일 (None이면 /trace 경로로만 조회)
+        """
+        self.sample_rate = max(0.0, min(1.0, sample_rate))
+        self.path = path
+
+    def sample(self, tid: int, label: str, **tags) -> Trace | None:
+        """이번 읽기를 추적할지 정하고, 뽑혔으면 기록기 반환.
+
+        Args:
+            tid: 트레이스 뷰어에서 스팬을 그릴 줄 번호 (방·플레이어마다 다르게)
+            label: 그 줄에 표시할 이름
+            **tags: 모든 스팬에 붙일 필드 (방, 플레이어)
+
+        Returns:
+            기록기, 추적하지 않으면 None
+        """
+        if not self.sample_rate or random.random() >= self.sample_rate:
+            return None
+        with self._lock:
+            # 방 번호가 계속 늘어나므로 링 버퍼와 같은 개수까지만 남기고 가장 오래전에 뽑힌 줄부터 버림
+            self.threads.pop(tid, None)
+            self.threads[tid] = label
+            if len(self.threads) > self.events.maxlen:
+                del self.threads[next(iter(self.threads))]
+        return Trace(self, tid, tags)
+
+    def record(self, name: str, tid: int, started: float, ended: float, fields: dict) -> None:
+        """스팬 하나를 링 버퍼에 추가.
+
+        Args:
+            name: 단계 이름
+            tid: 줄 번호
+            started: 시작 시각 (time.perf_counter)
+            ended: 끝 시각 (time.perf_counter)
+            fields: 스팬 필드
+        """
+        with self._lock:
+            self.events.append((name, tid, started, ended, fields))
+
+    def export(self) -> dict:
+        """보관 중인 스팬을 Chrome trace-event 형식으로 변환.
+
+        chrome://tracing 이나 Perfetto(ui.perfetto.dev)에서 그대로 열 수 있고,
+        방·플레이어마다 한 줄씩 그려져 한 메시지 안의 단계가 겹쳐 보임.
+
+        Returns:
+            traceEvents 목록을 담은 딕셔너리 (시각은 마이크로초)
+        """
+        with self._lock:
+            events = list(self.events)
+            threads = dict(self.threads)
+        pid = os.getpid()
+        # 링 버퍼에 스팬이 남아 있는 줄의 이름만 내보냄
+        tids = {event[1] for event in events}
+        trace_events = [{"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": label}}
+                        for tid, label in threads.items() if tid in tids]
+        for name, tid, started, ended, fields in events:
+            trace_events.append({"name": name, "cat": "yacht", "ph": "X", "pid": pid, "tid": tid,
+                                 "ts": round(started * 1e6, 3), "dur": round((ended - started) * 1e6, 3),
+                                 "args": fields})
+        return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+    def dump(self) -> str | None:
+        """보관 중인 스팬을 path에 저장 (임시 파일에 쓴 뒤 교체).
+
+        Returns:
+            저장한 파일 경로, 저장할 곳이 없으면 None
+        """
+        if self.path is None:
+            return None
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp = f"{self.path}.tmp"
+        with open(temp, "w") as f:
+            json.dump(self.export(), f, separators=(",", ":"))
+        os.replace(temp, self.path)
+        return self.path
+
+
+class SamplingProfiler:
+    """실행 중인 서버의 호출 스택을 주기적으로 훑어 함수별 표본 수를 모으는 샘플링 프로파일러.
+
+    별도 스레드가 PROFILE_INTERVAL마다 watch로 등록한 스레드(이벤트 루프, 클라이언트 처리 스레드)의
+    현재 프레임을 읽기만 하므로 서버 코드에 계측을 넣지 않고, 꺼져 있으면 비용이 전혀 없음.
+    로그 출력이나 결과 기록처럼 대부분 기다리기만 하는 보조 스레드는 표본에서 제외.
+    함수마다 맨 위 프레임이었던 횟수(자체)와 스택 어딘가에 있던 횟수(누적)를 셈.
+    기다리는 시간도 표본에 잡히므로 이벤트 루프의 select는 유휴 시간을 뜻함.
+    """
+
+    def __init__(self, interval: float = PROFILE_INTERVAL):
+        """멈춘 상태의 프로파일러 생성.
+
+        Args:
+            interval: 표본 주기(초)
+        """
+        self.interval = interval
+        self.own: Counter = Counter()  # (파일, 줄, 함수) → 맨 위 프레임이었던 표본 수
+        self.total: Counter = Counter()  # (파일, 줄, 함수) → 스택에 있던 표본 수
+        self.samples = 0  # 훑은 스택 수
+        self.started = 0.0
+        self.threads: set[int] = set()  # 표본을 모을 스레드 ID
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def running(self) -> bool:
+        """표본을 모으는 중인지 여부."""
+        return self._thread is not None
+
+    def watch(self) -> None:
+        """호출한 스레드를 표본 대상에 추가 (프로파일러가 꺼져 있어도 등록만 해 둠)."""
+        self.threads.add(threading.get_ident())
+
+    def unwatch(self) -> None:
+        """호출한 스레드를 표본 대상에서 제외 (스레드가 끝나기 전에 호출)."""
+        self.threads.discard(threading.get_ident())
+
+    def start(self) -> None:
+        """표본 수집 스레드 시작 (이미 실행 중이면 아무 일도 하지 않음)."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self.started = time.monotonic()
+        self._thread = threading.Thread(target=self._run, name="yacht-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """표본 수집 중지 (모은 표본은 유지)."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def _run(self) -> None:
+        """멈출 때까지 interval마다 등록된 스레드의 스택을 기록."""
+        while not self._stop.wait(self.interval):
+            frames = sys._current_frames()
+            with self._lock:
+                for thread_id in list(self.threads):
+                    frame = frames.get(thread_id)
+                    if frame is None:
+                        continue
+                    self.samples += 1
+                    self.own[self._key(frame)] += 1
+                    seen = set()  # 재귀 호출은 누적에 한 번만
+                    while frame is not None:
+                        key = self._key(frame)
+                        if key not in seen:
+                            seen.add(key)
+                            self.total[key] += 1
+                        frame = frame.f_back
+
+    @staticmethod
+    def _key(frame) -> tuple[str, int, str]:
+        """프레임의 함수 식별자 (파일, 정의된 줄, 이름)."""
+        code = frame.f_code
+        return code.co_filename, code.co_firstlineno, code.co_name
+
+    def report(self, top: int = PROFILE_TOP) -> str:
+        """함수별 통계 보고서 (자체 표본 상위와 누적 표본 상위 두 표).
+
+        자체 표본 상위는 실제로 시간을 쓴 함수, 누적 표본 상위는 그 시간이 어느 호출 경로
+        (handle_client, process_message, broadcast 등) 아래에서 쓰였는지를 보여 줌.
+
+        Args:
+            top: 표마다 표시할 함수 수
+
+        Returns:
+            사람이 읽는 표 형식의 문자열
+        """
+        with self._lock:
+            own = dict(self.own)
+            total = dict(self.total)
+            samples = self.samples
+        if not self.running and not samples:
+            return "프로파일러 꺼짐 (--profile 로 시작)\n"
+        elapsed = time.monotonic() - self.started if self.started else 0.0
+        lines = [f"표본 {samples}개 ({self.interval * 1000:g}ms 간격, {elapsed:.1f}초)"]
+        for title, counts in (("자체 표본 상위", own), ("누적 표본 상위", total)):
+            lines += ["", title, f"{'자체%':>7} {'누적%':>7}  함수"]
+            for key in sorted(counts, key=counts.__getitem__, reverse=True)[:top]:
+                filename, line, name = key
+                lines.append(f"{own.get(key, 0) / samples:7.1%} {total[key] / samples:7.1%}  "
+                             f"{name} ({os.path.basename(filename)}:{line})")
+        return "\n".join(lines) + "\n"
+
+
+def add_trace_arguments(parser: argparse.ArgumentParser) -> None:
+    """추적과 프로파일링 명령행 옵션 추가 (모든 서버에서 공유).
+
+    Args:
+        parser: 옵션을 추가할 파서
+    """
+    parser.add_argument("--trace", metavar="PATH",
+                        help="메시지 처리 단계별 스팬을 Chrome trace-event JSON으로 저장할 파일 (종료 시, SIGUSR1 수신 시)")
+    parser.add_argument("--trace-sample", type=float, metavar="RATE",
+                        help=f"추적할 읽기 비율 0-1 (기본: --trace 지정 시 {TRACE_SAMPLE:g}, 아니면 끔)")
+    parser.add_argument("--profile", action="store_true",
+                        help="샘플링 프로파일러 실행 - 지표 포트의 /profile 또는 SIGUSR1로 함수별 통계 출력")
+
+
+def trace_options(args: argparse.Namespace) -> dict:
+    """add_trace_arguments로 받은 값을 start_tracing 키워드 인자로 변환."""
+    sample_rate = args.trace_sample
+    if sample_rate is None:
+        sample_rate = TRACE_SAMPLE if args.trace else 0.0
+    return {"sample_rate": sample_rate, "path": args.trace, "profile": args.profile}
+
+
+def dump_all(*_) -> None:
+    """추적 기록을 파일로 저장하고 프로파일 보고서를 표준 오류로 출력 (SIGUSR1 처리기)."""
+    path = tracer.dump()
+    if path is not None:
+        print(f"추적 기록 저장 - {path} ({len(tracer.events)}개 스팬)", file=sys.stderr)
+    if profiler.running:
+        sys.stderr.write(profiler.report())
+    sys.stderr.flush()
+
+
+def start_tracing(sample_rate: float = 0.0, path: str | None = None, profile: bool = False) -> None:
+    """추적과 프로파일러를 켜고 SIGUSR1에 저장 처리기를 등록.
+
+    Args:
+        sample_rate: 추적할 읽기 비율 (0이면 추적하지 않음)
+        path: 추적 기록을 저장할 파일
+        profile: 샘플링 프로파일러 실행 여부
+    """
+    tracer.configure(sample_rate, path)
+    if profile:
+        profiler.start()
+    if (sample_rate or profile) and hasattr(signal, "SIGUSR1"):
+        signal.signal(signal.SIGUSR1, dump_all)
+
+
+def stop_tracing() -> None:
+    """종료 전에 추적 기록을 저장하고 프로파일 보고서 출력."""
+    if tracer.sample_rate or profiler.running:
+        dump_all()
+    profiler.stop()
+
+
+tracer = Tracer()  # 프로세스 전체에서 함께 쓰는 추적기
+profiler = SamplingProfiler()
+add_page("/trace", "application/json", lambda: json.dumps(tracer.export(), separators=(",", ":")).encode())
+add_page("/profile", "text/plain; charset=utf-8", lambda: profiler.report().encode())
@@ -0,0 +1,162 @@
+import asyncio
+import errno
+import os
+import socket
+import stat
+
+DEFAULT_ADDRESS = "tcp://localhost:8888"
+BACKLOG = 1024
+
+
+class Endpoint:
+    """서버가 listen하거나 클라이언트가 접속할 주소 하나.
+
+    TCP(호스트, 포트)와 유닉스 도메인 스트림 소켓(파일 경로)을 같은 인터페이스로 다루므로
+    서버, 클라이언트, 부하 테스트 봇 모두 주소 문자열만 바꿔 전송 방식을 고를 수 있음.
+    같은 호스트의 봇은 유닉스 소켓으로 TCP 스택을 거치지 않고 접속.
+    """
+
+    __slots__ = ("kind", "host", "port", "path")
+
+    def __init__(self, kind: str, host: str | None = None, port: int | None = None, path: str | None = None):
+        """주소 생성 (보통은 parse 사용).
+
+        Args:
+            kind: "tcp" 또는 "unix"
+            host: TCP 호스트
+            port: TCP 포트
+            path: 유닉스 소켓 파일 경로
+        """
+        self.kind = kind
+        self.host = host
+        self.port = port
+        self.path = path
+
+    @classmethod
+    def parse(cls, text: str, default_host: str = "localhost") -> "Endpoint":
+        """주소 문자열 해석.
+
+        Args:
+            text: "unix:/경로", "unix:///경로", "tcp://호스트:포트", "호스트:포트", "[::1]:포트" 또는 "포트"
+            default_host: 호스트를 생략했을 때 사용할 호스트
+
+        Returns:
+            해석한 주소
+
+        Raises:
+            ValueError: 형식이 잘못된 경우
+        """
+        if text.startswith("unix:"):
+            path = text[len("unix:"):]
+            if path.startswith("//"):
+                path = path[2:]
+            if not path:
+                raise ValueError(f"유닉스 소켓 경로가 없습니다: {text}")
+            return cls("unix", path=path)
+        rest = text[len("tcp://"):] if text.startswith("tcp://") else text
+        host, sep, port = rest.rpartition(":")
+        if not sep:
+            host = ""
+        host = host.strip("[]") or default_host  # IPv6 주소는 [::1]:8888 형태
+        try:
+            return cls("tcp", host=host, port=int(port))
+        except ValueError:
+            raise ValueError(f"잘못된 주소: {text} (예: tcp://localhost:8888, unix:/tmp/yacht.sock)") from None
+
+    @classmethod
+    def tcp(cls, host: str, port: int) -> "Endpoint":
+        """TCP 주소 생성."""
+        return cls("tcp", host=host, port=port)
+
+    def __str__(self) -> str:
+        """parse로 다시 읽을 수 있는 주소 문자열."""
+        if self.kind == "unix":
+            return f"unix:{self.path}"
+        host = f"[{self.host}]" if ":" in self.host else self.host
+        return f"tcp://{host}:{self.port}"
+
+    async def open(self) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        """이 주소로 접속 (asyncio 스트림).
+
+        Returns:
+            (StreamReader, StreamWriter)
+        """
+        if self.kind == "unix":
+            return await asyncio.open_unix_connection(self.path)
+        return await asyncio.open_connection(self.host, self.port)
+
+    async def listen(self, handler, reuse_port: bool = False) -> asyncio.Server:
+        """이 주소에서 asyncio 서버 시작.
+
+        Args:
+            handler: 연결마다 호출할 코루틴 함수 (reader, writer)
+            reuse_port: SO_REUSEPORT로 여러 프로세스가 같은 TCP 포트를 바인딩할지 여부
+
+        Returns:
+            시작한 asyncio 서버
+        """
+        if self.kind == "unix":
+            self._remove_stale()
+            return await asyncio.start_unix_server(handler, self.path, backlog=BACKLOG)
+        return await asyncio.start_server(handler, self.host, self.port, reuse_address=True,
+                                          reuse_port=reuse_port or None, backlog=BACKLOG)
+
+    def bind(self) -> socket.socket:
+        """이 주소에 listen 중인 블로킹 소켓 생성 (스레드 서버, 워커 간 공유용).
+
+        Returns:
+            listen 중인 소켓
+        """
+        if self.kind == "unix":
+            self._remove_stale()
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.bind(self.path)
+            sock.listen(BACKLOG)
+            return sock
+        return socket.create_server((self.host, self.port), reuse_port=False, backlog=BACKLOG)
+
+    def cleanup(self) -> None:
+        """서버 종료 후 유닉스 소켓 파일 삭제 (TCP는 할 일 없음)."""
+        if self.kind == "unix":
+            try:
+                os.unlink(self.path)
+            except FileNotFoundError:
+                pass
+
+    def _remove_stale(self) -> None:
+        """이전 서버가 남긴 소켓 파일 삭제.
+
+        Raises:
+            OSError: 다른 서버가 아직 그 경로에서 접속을 받고 있거나, 소켓이 아닌 파일인 경우
+        """
+        try:
+            mode = os.stat(self.path).st_mode
+        except FileNotFoundError:
+            return
+        if not stat.S_ISSOCK(mode):
+            raise OSError(errno.EEXIST, f"소켓이 아닌 파일이 있습니다: {self.path}")
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(self.path)
+        except (ConnectionRefusedError, FileNotFoundError):
+            os.unlink(self.path)  # 비정상 종료한 서버가 남긴 파일
+            return
+        finally:
+            probe.close()
+        raise OSError(errno.EADDRINUSE, f"이미 사용 중인 주소: {self}")
+
+
+def parse_endpoints(addresses: list[str] | None, host: str = "localhost", port: int = 8888) -> list[Endpoint]:
+    """명령행의 --listen 목록을 주소 목록으로 변환.
+
+    Args:
+        addresses: 주소 문자열 목록 (None이나 빈 목록이면 host:port 하나)
+        host: 기본 TCP 호스트
+        port: 기본 TCP 포트
+
+    Returns:
+        주소 목록
+    """
+    if not addresses:
+        return [Endpoint.tcp(host, port)]
+    return [Endpoint.parse(address, host) for address in addresses]
@@ -0,0 +1,384 @@
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app", "src"))
+
+import numpy as np
+
+from yacht_async_server import AsyncYachtServer
+from yacht_client import YachtClient
+from yacht_log import logger
+from yacht_protocol import FrameDecoder, encode_message
+from yacht_results import ResultStore
+from yacht_scoring import CATEGORIES, score_batch
+from yacht_server import IDLE_TIMEOUT, TURN_TIMEOUT, YachtRoom
+from yacht_state import GameState
+from yacht_timer import TimerWheel
+from yacht_transport import Endpoint
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+
+def measure(func, ops: int, repeat: int = 5) -> dict:
+    """함수를 여러 번 반복 실행해 연산당 시간 측정.
+
+    Args:
+        func: 한 번 호출에 ops번의 연산을 수행하는 함수
+        ops: 한 번 호출당 연산 수
+        repeat: 반복 측정 횟수
+
+    Returns:
+        연산당 최소/중앙값 시간(ns)과 연산 수
+    """
+    func()  # 워밍업
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter_ns()
+        func()
+        samples.append((time.perf_counter_ns() - started) / ops)
+    return {"ns_per_op": round(min(samples), 1), "median_ns_per_op": round(statistics.median(samples), 1), "ops": ops}
+
+
+def sample_rolls(count: int, seed: int = 1234) -> list[list[int]]:
+    """재현 가능한 무작위 굴림 결과 생성."""
+    rng = random.Random(seed)
+    return [[rng.randint(1, 6) for _ in range(5)] for _ in range(count)]
+
+
+def mid_game_state() -> GameState:
+    """직렬화 측정용으로 절반쯤 진행된 게임 상태 생성."""
+    state = YachtRoom().game_state
+    rng = random.Random(99)
+    for player in state.players:
+        for index in range(7):
+            player.record(index, rng.randint(0, 30))
+    return state
+
+
+def bench_calculate_score() -> dict:
+    """서버 calculate_score 단일 호출."""
+    room = YachtRoom()
+    rolls = sample_rolls(1000)
+
+    def run():
+        for dice in rolls:
+            for category in CATEGORIES:
+                room.calculate_score(dice, category)
+
+    return measure(run, len(rolls) * len(CATEGORIES))
+
+
+def bench_preview_score() -> dict:
+    """클라이언트 preview_score 단일 호출."""
+    client = YachtClient()
+    rolls = sample_rolls(1000)
+
+    def run():
+        for dice in rolls:
+            for category in CATEGORIES:
+                client.preview_score(dice, category)
+
+    return measure(run, len(rolls) * len(CATEGORIES))
+
+
+def bench_score_batch() -> dict:
+    """score_batch 일괄 계산 (굴림 하나당 13개 카테고리)."""
+    rolls = np.array(sample_rolls(100_000), dtype=np.int64)
+    return measure(lambda: score_batch(rolls), len(rolls))
+
+
+def bench_broadcast_serialize() -> dict:
+    """전체 game_state를 JSON 형태로 변환해 담은 메시지 직렬화."""
+    state = mid_game_state()
+
+    def run():
+        for _ in range(10_000):
+            encode_message({"type": "state_snapshot", "data": state.to_dict()})
+
+    return measure(run, 10_000)
+
+
+def bench_turn_end_serialize() -> dict:
+    """turn_end (변경분) 메시지 직렬화."""
+    message = {"type": "turn_end", "data": {"score": 25, "category": "full_house", "player": 0,
+                                            "current_player": 1, "round": 7, "version": 13}, "seq": 41}
+
+    def run():
+        for _ in range(10_000):
+            encode_message(message)
+
+    return measure(run, 10_000)
+
+
+def bench_frame_decode() -> dict:
+    """여러 메시지가 이어 붙은 스트림을 조각 단위로 디코딩."""
+    messages = [
+        {"type": "roll_dice", "data": {"reroll": [0, 2, 4]}},
+        {"type": "select_category", "data": {"category": "yacht"}},
+        {"type": "dice_result", "data": {"dice": [1, 2, 3, 4, 5], "player": 0, "rolls_left": 2}, "seq": 40},
+    ]
+    stream = b"".join(encode_message(messages[i % 3]) for i in range(30_000))
+    chunks = [stream[i:i + 4096] for i in range(0, len(stream), 4096)]
+
+    def run():
+        decoder = FrameDecoder()
+        for chunk in chunks:
+            decoder.feed(chunk)
+
+    return measure(run, 30_000)
+
+
+def bench_binary_roundtrip() -> dict:
+    """바이너리 인코딩 메시지의 인코딩 + 디코딩."""
+    messages = [
+        {"type": "dice_result", "data": {"dice": [1, 2, 3, 4, 5], "player": 0, "rolls_left": 2}, "seq": 40},
+        {"type": "turn_end", "data": {"score": 25, "category": "full_house", "player": 0,
+                                      "current_player": 1, "round": 7, "version": 13}, "seq": 41},
+    ]
+
+    def run():
+        decoder = FrameDecoder()
+        for i in range(10_000):
+            decoder.feed(encode_message(messages[i % 2], binary=True))
+
+    return measure(run, 10_000)
+
+
+def bench_json_roundtrip() -> dict:
+    """같은 메시지의 JSON 인코딩 + 디코딩 (바이너리와 비교용)."""
+    messages = [
+        {"type": "dice_result", "data": {"dice": [1, 2, 3, 4, 5], "player": 0, "rolls_left": 2}, "seq": 40},
+        {"type": "turn_end", "data": {"score": 25, "category": "full_house", "player": 0,
+                                      "current_player": 1, "round": 7, "version": 13}, "seq": 41},
+    ]
+
+    def run():
+        decoder = FrameDecoder()
+        for i in range(10_000):
+            decoder.feed(encode_message(messages[i % 2]))
+
+    return measure(run, 10_000)
+
+
+def bench_timer_wheel() -> dict:
+    """턴/유휴 타이머 등록 + 취소 (대부분 만료 전에 취소되는 경우)."""
+    wheel = TimerWheel()
+    delays = [TURN_TIMEOUT if i % 2 else IDLE_TIMEOUT for i in range(10_000)]
+
+    def run():
+        for delay in delays:
+            wheel.schedule(delay, print).cancel()
+
+    return measure(run, 10_000)
+
+
+def bench_player_stats() -> dict:
+    """플레이어 통계 + 기준별 순위 조회 (게임 5만 판, 플레이어 5천 명이 기록된 저장소)."""
+    rng = random.Random(7)
+    states = []
+    for _ in range(100):
+        state = GameState()
+        for player in state.players:
+            for index in range(len(CATEGORIES)):
+                player.record(index, rng.randint(0, 30))
+        states.append(state)
+    names = [f"player{i}" for i in range(5000)]
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "results.db")
+        store = ResultStore(path)
+        for i in range(50_000):
+            state = states[i % len(states)]
+            scores = [player.final_score() for player in state.players]
+            store.record(i, state, 0 if scores[0] > scores[1] else 1, scores, (rng.choice(names), rng.choice(names)))
+        store.close()  # 남은 결과를 모두 기록한 뒤 조회용으로 다시 엶
+        store = ResultStore(path)
+        lookups = [rng.choice(names) for _ in range(1000)]
+        result = measure(lambda: [store.player(name) for name in lookups], len(lookups))
+        store.close()
+    return result
+
+
+async def _loopback_turns(turns: int, endpoint: Endpoint, pipeline: bool = False) -> float:
+    """루프백으로 서버를 띄우고 굴리기 → 재굴리기 → 선택 턴을 반복.
+
+    Args:
+        turns: 진행할 턴 수
+        endpoint: 서버 주소 (TCP 포트 0이면 빈 포트 사용)
+        pipeline: 세 요청에 id를 붙여 응답을 기다리지 않고 한 번에 보낼지 여부
+
+    Returns:
+        턴당 평균 시간(ns)
+    """
+    app = AsyncYachtServer()
+    server = await endpoint.listen(app.handle_client)
+    if endpoint.kind == "tcp":
+        endpoint.port = server.sockets[0].getsockname()[1]
+
+    # 두 플레이어가 번갈아 턴을 진행 (게임 하나 = 26턴)
+    async def connect():
+        reader, writer = await endpoint.open()
+        return reader, writer, FrameDecoder(), []
+
+    async def expect(conn, message_type, player):
+        # 상대 턴의 브로드캐스트는 건너뛰고 본인 턴의 응답만 대기
+        reader, _, decoder, queue = conn
+        while True:
+            while queue:
+                message = queue.pop(0)
+                if message["type"] == message_type and message["data"].get("player", player) == player:
+                    return message
+            queue.extend(decoder.feed(await reader.read(65536)))
+
+    def send(conn, message_type, data):
+        conn[1].write(encode_message({"type": message_type, "data": data}))
+
+    elapsed = 0
+    done = 0
+    while done < turns:
+        players = [await connect(), await connect()]
+        await expect(players[0], "game_start", 0)
+        for turn in range(len(CATEGORIES) * 2):
+            if done >= turns:
+                break
+            player = turn % 2
+            conn = players[player]
+            started = time.perf_counter_ns()
+            if pipeline:
+                conn[1].write(encode_message({"type": "roll_dice", "data": {}, "id": 1})
+                              + encode_message({"type": "roll_dice", "data": {"reroll": [0, 1]}, "id": 2})
+                              + encode_message({"type": "select_category", "data": {"category": CATEGORIES[turn // 2]},
+                                                "id": 3}))
+            else:
+                send(conn, "roll_dice", {})
+                await expect(conn, "dice_result", player)
+                send(conn, "roll_dice", {"reroll": [0, 1]})
+                await expect(conn, "dice_result", player)
+                send(conn, "select_category", {"category": CATEGORIES[turn // 2]})
+            await expect(conn, "game_end" if turn == len(CATEGORIES) * 2 - 1 else "turn_end", player)
+            elapsed += time.perf_counter_ns() - started
+            done += 1
+        for conn in players:
+            conn[1].close()
+
+    server.close()
+    await server.wait_closed()  # 서버 쪽 연결 처리 태스크가 모두 끝날 때까지 대기
+    endpoint.cleanup()
+    return elapsed / done
+
+
+def _bench_turns(make_endpoint, pipeline: bool = False) -> dict:
+    """주소마다 새 서버를 띄워 턴 왕복 시간을 세 번 측정."""
+    turns = 520
+    samples = []
+    logger.configure("off")  # 서버 로그 출력 제외
+    for _ in range(3):
+        samples.append(asyncio.run(_loopback_turns(turns, make_endpoint(), pipeline)))
+    return {"ns_per_op": round(min(samples), 1), "median_ns_per_op": round(statistics.median(samples), 1), "ops": turns}
+
+
+def bench_loopback_turn() -> dict:
+    """루프백 TCP를 통한 전체 턴 (굴리기 → 재굴리기 → 선택) 왕복."""
+    return _bench_turns(lambda: Endpoint.tcp("127.0.0.1", 0))
+
+
+def bench_pipelined_turn() -> dict:
+    """루프백 TCP로 한 턴의 요청 세 개를 응답을 기다리지 않고 보냈을 때의 턴 시간 (loopback_turn과 비교)."""
+    return _bench_turns(lambda: Endpoint.tcp("127.0.0.1", 0), pipeline=True)
+
+
+def bench_unix_turn() -> dict:
+    """유닉스 도메인 소켓을 통한 전체 턴 왕복 (loopback_turn과의 차이가 TCP 스택 비용)."""
+    with tempfile.TemporaryDirectory() as directory:
+        return _bench_turns(lambda: Endpoint.parse(f"unix:{os.path.join(directory, 'yacht.sock')}"))
+
+
+BENCHMARKS = {
+    "calculate_score": bench_calculate_score,
+    "preview_score": bench_preview_score,
+    "score_batch": bench_score_batch,
+    "broadcast_serialize": bench_broadcast_serialize,
+    "turn_end_serialize": bench_turn_end_serialize,
+    "frame_decode": bench_frame_decode,
+    "binary_roundtrip": bench_binary_roundtrip,
+    "json_roundtrip": bench_json_roundtrip,
+    "timer_wheel": bench_timer_wheel,
+    "player_stats": bench_player_stats,
+    "loopback_turn": bench_loopback_turn,
+    "pipelined_turn": bench_pipelined_turn,
+    "unix_turn": bench_unix_turn,
+}
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """기준 결과와 비교해 느려진 벤치마크 목록 반환.
+
+    Args:
+        results: 이번 실행 결과
+        baseline: 저장된 기준 결과
+        threshold: 느려짐으로 판단할 비율 (0.1 = 10%)
+
+    Returns:
+        기준보다 threshold 이상 느려진 벤치마크 이름 목록
+    """
+    regressions = []
+    for name, current in results["benchmarks"].items():
+        base = baseline["benchmarks"].get(name)
+        if base is None:
+            continue
+        ratio = current["ns_per_op"] / base["ns_per_op"]
+        current["baseline_ns_per_op"] = base["ns_per_op"]
+        current["ratio"] = round(ratio, 3)
+        if ratio > 1 + threshold:
+            regressions.append(name)
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="야추 성능 벤치마크")
+    parser.add_argument("names", nargs="*", help=f"실행할 벤치마크 (기본: 전체) {list(BENCHMARKS)}")
+    parser.add_argument("-o", "--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="비교할 기준 결과 JSON")
+    parser.add_argument("--save-baseline", action="store_true", help="이번 결과를 기준으로 저장")
+    parser.add_argument("--threshold", type=float, default=0.1, help="느려짐 판단 비율 (기본 10%%)")
+    args = parser.parse_args()
+
+    results = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "benchmarks": {},
+    }
+    for name in args.names or BENCHMARKS:
+        results["benchmarks"][name] = BENCHMARKS[name]()
+        print(f"{name}: {results['benchmarks'][name]['ns_per_op']} ns/op", file=sys.stderr)
+
+    regressions = []
+    if not args.save_baseline and os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        results["regressions"] = regressions
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output)
+    else:
+        print(output)
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            f.write(output)
+        print(f"기준 결과 저장: {args.baseline}", file=sys.stderr)
+    elif regressions:
+        print(f"기준 대비 느려진 벤치마크: {', '.join(regressions)}", file=sys.stderr)
+        sys.exit(1)
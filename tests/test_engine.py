@@ -0,0 +1,121 @@
+import pytest
+
+from yacht_engine import FIRST_ROLL_MASK, YachtEngine
+from yacht_rng import DiceRNG
+from yacht_scoring import CATEGORIES, UPPER_BONUS, UPPER_BONUS_THRESHOLD, score
+from yacht_state import GameState
+from yacht_tournament import GreedyBot, play_game
+
+
+def new_engine(seed: int = 7) -> YachtEngine:
+    """시드를 고정한 새 게임 엔진."""
+    return YachtEngine(GameState(), DiceRNG(seed))
+
+
+@pytest.mark.parametrize("dice, category, expected", [
+    ([1, 1, 1, 2, 3], "ones", 3),
+    ([2, 2, 2, 5, 5], "full_house", 25),
+    ([2, 2, 2, 2, 5], "full_house", 0),
+    ([3, 3, 3, 3, 1], "four_of_kind", 13),
+    ([1, 2, 3, 4, 6], "small_straight", 30),
+    ([2, 3, 4, 5, 6], "large_straight", 40),
+    ([6, 6, 6, 6, 6], "yacht", 50),
+    ([1, 2, 3, 4, 6], "chance", 16),
+    ([1, 2, 3, 4, 6], "unknown", 0),
+])
+def test_score(dice, category, expected):
+    """카테고리별 점수 규칙."""
+    assert score(dice, category) == expected
+
+
+def test_first_roll_then_rerolls():
+    """첫 굴림은 5개 모두, 이후 재굴림은 지정한 위치만 바꾸고 최대 두 번."""
+    engine = new_engine()
+    state = engine.state
+    assert engine.roll(0) == FIRST_ROLL_MASK
+    assert len(state.dice) == 5 and state.rolls_left == 2
+    before = state.dice.copy()
+    assert engine.roll(0, [1, 3, 3, 9]) == 0b01010  # 중복과 범위 밖 위치는 무시
+    assert [state.dice[i] for i in (0, 2, 4)] == [before[i] for i in (0, 2, 4)]
+    assert engine.roll(0, [0]) == 0b00001
+    assert state.rolls_left == 0
+    assert engine.roll_error(0) == "no_rolls_left"
+    assert engine.roll(0, [0]) is None
+
+
+def test_rejected_requests():
+    """규칙에 맞지 않는 요청은 상태를 바꾸지 않고 거절 코드를 돌려줌."""
+    engine = new_engine()
+    state = engine.state
+    assert engine.roll_error(1) == "not_your_turn"
+    assert engine.select_error(0, "chance") == "not_rolled"
+    assert engine.select(0, "chance") is None
+    engine.roll(0)
+    assert engine.select_error(1, "chance") == "not_your_turn"
+    assert engine.select_error(0, "bonus") == "unknown_category"
+    total = sum(state.dice)
+    assert engine.select(0, "chance") == total
+    assert state.current_player == 1 and state.dice is None and state.version == 1
+    engine.roll(1)
+    engine.select(1, "ones")
+    engine.roll(0)
+    assert engine.select_error(0, "chance") == "category_filled"
+    assert state.round == 2
+
+
+def test_full_game_is_reproducible():
+    """같은 시드로 끝까지 진행한 게임은 같은 점수, 종료 뒤에는 모든 요청이 game_over."""
+    def play(seed):
+        engine = new_engine(seed)
+        for _ in CATEGORIES:
+            for player_id in (0, 1):
+                engine.roll(player_id)
+                engine.roll(player_id, [0, 1])
+                open_categories = [c for c in CATEGORIES if engine.select_error(player_id, c) is None]
+                assert engine.select(player_id, open_categories[0]) is not None
+        assert engine.finished and engine.state.round == len(CATEGORIES) + 1
+        return engine
+
+    engine = play(42)
+    winner, scores = engine.result()
+    assert scores == play(42).result()[1]
+    assert winner == (0 if scores[0] > scores[1] else 1)
+    for player, total in zip(engine.state.players, scores):
+        assert total == player.total + (UPPER_BONUS if player.upper >= UPPER_BONUS_THRESHOLD else 0)
+    assert engine.roll_error(0) == "game_over"
+    assert engine.select_error(0, "chance") == "game_over"
+
+
+def test_forfeit():
+    """기권하면 상대가 승자."""
+    engine = new_engine()
+    engine.roll(0)
+    engine.select(0, "chance")
+    winner, scores = engine.forfeit(1)
+    assert winner == 0 and scores[1] == 0 and engine.state.game_over
+
+
+def test_play_game_bots():
+    """봇 대전은 같은 시드면 같은 결과."""
+    bots = (GreedyBot(1), GreedyBot(2))
+    assert play_game(bots, 5) == play_game((GreedyBot(1), GreedyBot(2)), 5)
+
+
+class StubbornBot:
+    """항상 같은 카테고리 인덱스만 고르는 봇."""
+
+    def __init__(self, choice):
+        self.choice = choice
+
+    def reroll(self, dice, player, rolls_left):
+        return []
+
+    def choose(self, dice, player):
+        return self.choice
+
+
+@pytest.mark.parametrize("choice, reason", [(0, "category_filled"), (13, "unknown_category"), (None, "unknown_category")])
+def test_play_game_rejects_invalid_bot_choice(choice, reason):
+    """기록할 수 없는 카테고리를 고르는 봇은 무한 루프 대신 ValueError."""
+    with pytest.raises(ValueError, match=reason):
+        play_game((StubbornBot(choice), GreedyBot()), 3)
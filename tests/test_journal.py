@@ -0,0 +1,108 @@
+import os
+
+from yacht_engine import YachtEngine
+from yacht_journal import LOG_FILE, RECORD, Journal, recover, replay
+from yacht_rng import SECURE_SEED, DiceRNG
+from yacht_scoring import CATEGORY_INDEX
+from yacht_state import GameState
+
+
+def play_turn(engine: YachtEngine, journal: Journal, room_id: int, category: str, rerolls=((0, 1),)) -> None:
+    """엔진으로 한 턴을 진행하면서 서버 방처럼 기록."""
+    state = engine.state
+    player = state.current_player
+    mask = engine.roll(player)
+    journal.record_roll(room_id, player, mask, state.dice)
+    for reroll in rerolls:
+        mask = engine.roll(player, list(reroll))
+        journal.record_roll(room_id, player, mask, state.dice)
+    value = engine.select(player, category)
+    journal.record_select(room_id, player, CATEGORY_INDEX[category], value)
+
+
+def test_recover_replays_log(tmp_path):
+    """스냅샷 없이도 기록을 재생해 진행 중인 게임과 시드, 굴린 주사위까지 복원."""
+    journal = Journal(str(tmp_path), commit_delay=0)
+    engine = YachtEngine(GameState(), DiceRNG(11))
+    journal.record_start(3, 11)
+    play_turn(engine, journal, 3, "chance")
+    play_turn(engine, journal, 3, "yacht")
+    player = engine.state.current_player
+    journal.record_roll(3, player, engine.roll(player), engine.state.dice)  # 기록 전에 중단된 턴
+    journal.close()
+
+    seeds = {}
+    games, next_room_id = recover(str(tmp_path), seeds)
+    assert next_room_id == 4 and seeds == {3: 11}
+    assert games[3].to_dict() == engine.state.to_dict()
+
+
+def test_snapshot_then_tail(tmp_path):
+    """스냅샷 이후 레코드만 이어서 적용하고, 끝난 방과 정리된 방은 제외."""
+    journal = Journal(str(tmp_path), commit_delay=0)
+    engines = {room_id: YachtEngine(GameState(), DiceRNG(room_id)) for room_id in (1, 2)}
+    for room_id in engines:
+        journal.record_start(room_id, room_id)
+        play_turn(engines[room_id], journal, room_id, "ones")
+    journal.snapshot({room_id: engine.state for room_id, engine in engines.items()}, 3, {1: 1, 2: 2})
+    play_turn(engines[1], journal, 1, "twos", rerolls=())
+    journal.record_end(2)
+    journal.record_start(7, SECURE_SEED)
+    journal.close()
+
+    seeds = {}
+    games, next_room_id = recover(str(tmp_path), seeds)
+    assert sorted(games) == [1, 7] and next_room_id == 8
+    assert games[1].to_dict() == engines[1].state.to_dict()
+    assert seeds[1] == 1 and seeds[7] == SECURE_SEED
+
+
+def test_reseed_overrides_seed(tmp_path):
+    """복구 뒤 새 생성기로 이어서 굴리면 다음 복구는 RESEED의 시드를 사용."""
+    journal = Journal(str(tmp_path), commit_delay=0)
+    journal.record_start(1, 3)
+    journal.record_start(2, 5)
+    journal.snapshot({1: GameState(), 2: GameState()}, 3, {1: 3, 2: 5})
+    journal.record_reseed(1, SECURE_SEED)
+    journal.record_reseed(2, 0xDEADBEEF)
+    journal.close()
+
+    seeds = {}
+    recover(str(tmp_path), seeds)
+    assert seeds == {1: SECURE_SEED, 2: 0xDEADBEEF}
+
+
+def test_replay_collects_finished_games(tmp_path):
+    """전체 재생은 정리된 게임과 진행 중인 게임을 나눠 돌려줌."""
+    journal = Journal(str(tmp_path), commit_delay=0)
+    engine = YachtEngine(GameState(), DiceRNG(9))
+    journal.record_start(1, 9)
+    journal.record_start(2, 10)
+    while not engine.finished:
+        player = engine.state.current_player
+        open_category = next(c for c, i in CATEGORY_INDEX.items() if not engine.state.players[player].has(i))
+        play_turn(engine, journal, 1, open_category)
+    journal.record_end(1)
+    journal.close()
+
+    seeds = {}
+    finished, active, count = replay(str(tmp_path), seeds)
+    assert list(finished) == [1] and list(active) == [2]
+    assert finished[1].finished and finished[1].game_over
+    assert [p.final_score() for p in finished[1].players] == engine.result()[1]
+    assert count == os.path.getsize(tmp_path / LOG_FILE) // RECORD.size
+    assert seeds == {1: 9, 2: 10}
+    assert recover(str(tmp_path))[0].keys() == {2}
+
+
+def test_torn_record_is_dropped(tmp_path):
+    """비정상 종료로 잘린 마지막 레코드는 복구에서 무시하고, 다시 열면 잘라냄."""
+    journal = Journal(str(tmp_path), commit_delay=0)
+    journal.record_start(1, 4)
+    journal.close()
+    with open(tmp_path / LOG_FILE, "ab") as f:
+        f.write(RECORD.pack(1, 2, 0, 0, 0)[:5])
+
+    assert list(recover(str(tmp_path))[0]) == [1]
+    Journal(str(tmp_path), commit_delay=0).close()
+    assert os.path.getsize(tmp_path / LOG_FILE) == RECORD.size
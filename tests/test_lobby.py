@@ -0,0 +1,111 @@
+import pytest
+
+from yacht_lobby import DEFAULT_MODE, DEFAULT_RATING, MAX_NAME_LENGTH, MAX_RATING, Lobby, Ticket
+
+
+def ticket(rating=DEFAULT_RATING, mode=DEFAULT_MODE, name="p") -> Ticket:
+    """클라이언트 없이 만든 대기표."""
+    return Ticket(None, {"name": name, "mode": mode, "rating": rating})
+
+
+@pytest.mark.parametrize("data, rating", [
+    ({"rating": 1720}, 1720),
+    ({"rating": 1720.9}, 1720),
+    ({"rating": -5}, 0),
+    ({"rating": 10 ** 30}, MAX_RATING),
+    ({"rating": float("nan")}, DEFAULT_RATING),
+    ({"rating": float("inf")}, DEFAULT_RATING),
+    ({"rating": "1600"}, DEFAULT_RATING),
+    ({}, DEFAULT_RATING),
+])
+def test_ticket_rating(data, rating):
+    """레이팅은 범위로 자르고, 유한한 수가 아니면 기본값."""
+    assert Ticket(None, data).rating == rating
+
+
+def test_ticket_defaults():
+    """잘못된 이름과 모드는 기본값으로 대체."""
+    t = Ticket(None, {"name": "x" * 50, "mode": ""})
+    assert len(t.name) == MAX_NAME_LENGTH and t.mode == DEFAULT_MODE
+    assert Ticket(None, {"name": 3}).name is None
+
+
+def test_match_within_spread():
+    """구간 차이가 spread 이내면 바로 매칭하고, 먼저 기다린 대기표가 앞."""
+    lobby = Lobby(spread=2)
+    first = ticket(1500)
+    assert lobby.enqueue(first) is None
+    assert lobby.stats()["queued"] == 1
+    second = ticket(1720)
+    assert lobby.enqueue(second) == (first, second)
+    assert lobby.stats()["queued"] == 0 and lobby.matched == 1
+    assert not first.active and not second.active
+
+
+def test_no_match_outside_spread_or_mode():
+    """구간 차이가 크거나 모드가 다르면 대기."""
+    lobby = Lobby(spread=2)
+    assert lobby.enqueue(ticket(1500)) is None
+    assert lobby.enqueue(ticket(1900)) is None
+    assert lobby.enqueue(ticket(1500, mode="ranked")) is None
+    assert lobby.depth == 3
+
+
+def test_nearest_bucket_then_oldest():
+    """가장 가까운 구간을 고르고, 같은 거리면 더 오래 기다린 대기표."""
+    lobby = Lobby(spread=5)
+    far, near_old, near_new = ticket(1150), ticket(1300), ticket(1300)
+    for t in (far, near_old, near_new):
+        lobby._push(t)  # enqueue는 서로 매칭하므로 큐에 직접 넣음
+    lobby.enqueue(ticket(1350, mode="ranked"))  # 다른 모드는 후보가 아님
+    new = ticket(1350)
+    assert lobby.enqueue(new) == (near_old, new)
+    new = ticket(1350)
+    assert lobby.enqueue(new) == (near_new, new)
+    new = ticket(1350)
+    assert lobby.enqueue(new) == (far, new)
+
+
+def test_cancel_skips_ticket_and_prunes():
+    """취소한 대기표는 매칭되지 않고, 빈 구간과 모드는 정리."""
+    lobby = Lobby()
+    gone = ticket(1500, mode="custom")
+    lobby.enqueue(gone)
+    lobby.cancel(gone)
+    lobby.cancel(gone)  # 두 번 취소해도 인원은 한 번만 감소
+    assert lobby.depth == 0
+    t = ticket(1500, mode="custom")
+    assert lobby.enqueue(t) is None
+    assert list(lobby.queues["custom"][t.bucket]) == [t]
+    lobby.cancel(t)
+    assert lobby.sweep() == []
+    assert "custom" not in lobby.queues and "custom" not in lobby.buckets
+
+
+def test_sweep_widens_after_wait():
+    """widen_after가 지난 대기표는 구간 차이와 관계없이 가장 가까운 상대와 매칭."""
+    lobby = Lobby(spread=0, widen_after=0.0)
+    low, high, far = ticket(800), ticket(2000), ticket(3500)
+    for t in (low, high, far):
+        assert lobby.enqueue(t) is None
+    assert lobby.sweep() == [(low, high)]
+    assert lobby.depth == 1 and lobby.sweep() == []  # 상대가 없으면 대기
+    assert list(lobby.buckets[DEFAULT_MODE]) == [far.bucket]
+
+
+def test_sweep_waits_before_deadline():
+    """widen_after 전에는 spread 밖 상대와 매칭하지 않음."""
+    lobby = Lobby(spread=0, widen_after=60.0)
+    lobby.enqueue(ticket(800))
+    lobby.enqueue(ticket(2000))
+    assert lobby.sweep() == []
+    assert lobby.depth == 2
+
+
+def test_many_modes_are_pruned():
+    """클라이언트가 정한 모드가 매칭 뒤 남지 않음."""
+    lobby = Lobby()
+    for i in range(100):
+        lobby.enqueue(ticket(1500, mode=f"m{i}"))
+        lobby.enqueue(ticket(1500, mode=f"m{i}"))
+    assert lobby.queues == {} and lobby.buckets == {} and lobby.matched == 100
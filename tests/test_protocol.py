@@ -0,0 +1,124 @@
+import json
+import struct
+
+import pytest
+
+from yacht_protocol import HEADER, FrameDecoder, encode_message
+
+MESSAGES = [
+    {"type": "roll_dice", "data": {"reroll": [0, 2, 4]}},
+    {"type": "select_category", "data": {"category": "yacht"}},
+    {"type": "dice_result", "data": {"dice": [1, 2, 3, 4, 5], "player": 0, "rolls_left": 2}, "seq": 40},
+    {"type": "join", "data": {"name": "철수", "mode": "classic", "rating": 1620}},
+]
+
+
+def frame(payload: bytes) -> bytes:
+    """길이 헤더를 붙인 프레임."""
+    return HEADER.pack(len(payload)) + payload
+
+
+def test_roundtrip_in_one_chunk():
+    """여러 메시지를 이어 붙여 한 번에 넣어도 순서대로 복원."""
+    stream = b"".join(encode_message(message) for message in MESSAGES)
+    assert FrameDecoder().feed(stream) == MESSAGES
+
+
+def test_roundtrip_byte_by_byte():
+    """한 바이트씩 나눠 도착해도 프레임이 완성될 때만 메시지를 돌려줌."""
+    decoder = FrameDecoder()
+    stream = b"".join(encode_message(message) for message in MESSAGES)
+    received = []
+    for i in range(len(stream)):
+        received += decoder.feed(stream[i:i + 1])
+    assert received == MESSAGES
+
+
+def test_partial_frame_is_kept_for_next_read():
+    """덜 도착한 프레임은 버퍼에 남아 다음 읽기에서 완성."""
+    decoder = FrameDecoder()
+    data = encode_message(MESSAGES[0])
+    assert decoder.feed(data[:-3]) == []
+    assert decoder.feed(data[-3:] + encode_message(MESSAGES[1])[:2]) == [MESSAGES[0]]
+
+
+def test_encoded_payload_is_ascii():
+    """encode_message는 ensure_ascii로 직렬화하므로 한글도 ASCII 페이로드."""
+    assert encode_message(MESSAGES[3])[HEADER.size:].isascii()
+
+
+def test_utf8_payload_from_other_implementations():
+    """ensure_ascii 없이 보낸 UTF-8 JSON도 깨지지 않고 복원 (ASCII 프레임과 섞여 있어도)."""
+    raw = frame(json.dumps(MESSAGES[3], ensure_ascii=False).encode())
+    padded = encode_message({"type": "pad", "data": {"text": "a" * 300}})  # 길이 헤더에 0x80 이상 바이트
+    decoder = FrameDecoder()
+    messages = decoder.feed(padded + raw[:7])
+    messages += decoder.feed(raw[7:] + encode_message(MESSAGES[0]))
+    assert [m["type"] for m in messages] == ["pad", "join", "roll_dice"]
+    assert messages[1]["data"]["name"] == "철수"
+
+
+@pytest.mark.parametrize("payload", [
+    b'{"type": "join", "data": {"name": "\xff"}}',  # UTF-8이 아님
+    b'{"type": "roll_dice", "data": {}',  # 닫히지 않은 JSON
+    b'{"type": "roll_dice", "data": {}}  ',  # 길이와 JSON 끝이 다름
+])
+def test_malformed_json_payload(payload):
+    """잘못된 JSON 페이로드는 ValueError."""
+    with pytest.raises(ValueError):
+        FrameDecoder().feed(frame(payload))
+
+
+def test_empty_payload():
+    """길이 0 프레임은 ValueError."""
+    with pytest.raises(ValueError):
+        FrameDecoder().feed(struct.pack("!I", 0))
+
+
+def test_oversized_frame_rejected_before_payload_arrives():
+    """최대 크기를 넘는 길이 헤더는 페이로드를 기다리지 않고 거절."""
+    with pytest.raises(ValueError):
+        FrameDecoder(max_frame_size=16).feed(struct.pack("!I", 17))
+
+
+BINARY_MESSAGES = [
+    {"type": "roll_dice", "data": {"reroll": [0, 2, 4]}},
+    {"type": "roll_dice", "data": {}},
+    {"type": "roll_dice", "data": {"reroll": [1]}, "id": 7},
+    {"type": "select_category", "data": {"category": "yacht"}},
+    {"type": "select_category", "data": {"category": "chance"}, "id": 2 ** 32 - 1},
+    {"type": "ack", "data": {}, "id": 12},
+    {"type": "dice_result", "data": {"dice": [6, 5, 4, 3, 1], "player": 1, "rolls_left": 0}, "seq": 99},
+    {"type": "turn_end", "data": {"score": 50, "category": "yacht", "player": 0, "current_player": 1,
+                                  "round": 3, "version": 17}, "seq": 100},
+]
+
+
+@pytest.mark.parametrize("message", BINARY_MESSAGES, ids=lambda m: m["type"])
+def test_binary_roundtrip(message):
+    """고정 레이아웃 메시지는 바이너리로 인코딩되고 JSON과 같은 딕셔너리로 복원."""
+    data = encode_message(message, binary=True)
+    assert data[HEADER.size] < 0x20  # JSON이 아닌 타입 바이트
+    assert FrameDecoder().feed(data) == [message]
+
+
+def test_binary_falls_back_to_json():
+    """레이아웃이 없거나 필드가 맞지 않는 메시지는 JSON으로 전송."""
+    for message in (MESSAGES[3], {"type": "roll_dice", "data": {"reroll": [5]}},
+                    {"type": "select_category", "data": {"category": "yacht"}, "id": "abc"}):
+        data = encode_message(message, binary=True)
+        assert data[HEADER.size:HEADER.size + 1] == b"{"
+        assert FrameDecoder().feed(data) == [message]
+
+
+@pytest.mark.parametrize("payload", [
+    struct.pack("!BB", 2, 13),  # select_category 카테고리 번호 범위 밖
+    struct.pack("!BBI", 6, 255, 1),  # select_category + id
+    struct.pack("!BBBhBBII", 4, 0, 14, 0, 1, 1, 1, 1),  # turn_end
+    struct.pack("!BB", 9, 0),  # 알 수 없는 타입
+    struct.pack("!BBB", 1, 0, 0),  # roll_dice 길이 불일치
+])
+def test_malformed_binary_payload(payload):
+    """범위를 벗어난 카테고리, 알 수 없는 타입, 길이가 맞지 않는 바이너리 페이로드는 ValueError."""
+    with pytest.raises(ValueError):
+        FrameDecoder().feed(frame(payload))
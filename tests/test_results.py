@@ -0,0 +1,126 @@
+import sqlite3
+
+import pytest
+
+from yacht_results import MIN_MEAN_GAMES, ResultStore, answer_query
+from yacht_scoring import CATEGORY_INDEX, UPPER_BONUS
+from yacht_state import GameState
+
+
+def finished_game(*sheets: dict) -> tuple[GameState, list[int]]:
+    """플레이어별 {카테고리: 점수}로 채운 게임 상태와 보너스를 포함한 총점."""
+    state = GameState()
+    for player, sheet in zip(state.players, sheets):
+        for category, value in sheet.items():
+            player.record(CATEGORY_INDEX[category], value)
+    return state, [player.final_score() for player in state.players]
+
+
+def record(store: ResultStore, names, sheets, room_id=1, forfeit=None) -> None:
+    """점수가 높은 쪽(동점이면 플레이어 2)을 승자로 기록."""
+    state, scores = finished_game(*sheets)
+    winner = 0 if scores[0] > scores[1] else 1
+    if forfeit is not None:
+        winner = 1 - forfeit
+    store.record(room_id, state, winner, scores, names, seed=room_id, forfeit=forfeit)
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "results.db")
+
+
+def reopen(store: ResultStore, path: str) -> ResultStore:
+    """쌓인 결과를 모두 커밋하고 새로 연 저장소."""
+    store.close()
+    return ResultStore(path, commit_delay=0)
+
+
+def test_player_aggregation_survives_reopen(path):
+    """플레이어별 게임 수, 승수, 평균, 최고 점수, 보너스, 카테고리 평균 집계."""
+    store = ResultStore(path, commit_delay=0)
+    upper = {"fours": 16, "fives": 20, "sixes": 30}
+    record(store, ("alice", "bob"), ({**upper, "chance": 20}, {"yacht": 50}))
+    record(store, ("bob", "alice"), ({"chance": 10}, {"chance": 30}), room_id=2)
+    store = reopen(store, path)
+
+    alice = store.player("alice")
+    assert alice["games"] == 2 and alice["wins"] == 2 and alice["win_rate"] == 1.0
+    assert alice["best"] == 86 + UPPER_BONUS
+    assert alice["mean"] == round((86 + UPPER_BONUS + 30) / 2, 1)
+    assert alice["bonus_rate"] == 0.5
+    assert alice["category_means"]["chance"] == 25.0 and alice["category_means"]["sixes"] == 15.0
+    assert alice["rank"] == {"wins": 1, "best": 1, "mean": None}  # mean은 MIN_MEAN_GAMES판 이상만
+    bob = store.player("bob")
+    assert (bob["games"], bob["wins"], bob["best"]) == (2, 0, 50)
+    assert bob["rank"]["wins"] == 2
+    assert store.player("carol") is None
+    store.close()
+
+
+def test_leaderboard_order_and_ties(path):
+    """기준 값 내림차순, 동점은 이름순이고 같은 순위."""
+    store = ResultStore(path, commit_delay=0)
+    record(store, ("a", "b"), ({"chance": 20}, {"chance": 10}))
+    record(store, ("c", "d"), ({"chance": 20}, {"chance": 5}), room_id=2)
+    record(store, ("a", "d"), ({"chance": 25}, {"chance": 5}), room_id=3)
+    store = reopen(store, path)
+
+    wins = store.leaderboard("wins", 3)
+    assert [(e["name"], e["wins"], e["rank"]) for e in wins] == [("a", 2, 1), ("c", 1, 2), ("b", 0, 3)]
+    best = store.leaderboard("best")
+    assert [(e["name"], e["rank"]) for e in best] == [("a", 1), ("c", 2), ("b", 3), ("d", 4)]
+    assert store.player("b")["rank"]["wins"] == 3 and store.player("d")["rank"]["wins"] == 3
+    with pytest.raises(ValueError):
+        store.leaderboard("luck")
+    store.close()
+
+
+def test_mean_board_needs_min_games(path):
+    """평균 점수 순위는 끝까지 진행한 게임이 MIN_MEAN_GAMES판 이상인 플레이어만."""
+    store = ResultStore(path, commit_delay=0)
+    for room_id in range(MIN_MEAN_GAMES):
+        record(store, ("steady", f"guest{room_id}"), ({"chance": 20}, {"chance": 10}), room_id=room_id)
+    store = reopen(store, path)
+    assert [e["name"] for e in store.leaderboard("mean")] == ["steady"]
+    assert store.player("steady")["rank"]["mean"] == 1
+    store.close()
+
+
+def test_same_name_and_anonymous_games_are_not_aggregated(path):
+    """두 자리가 같은 이름이거나 이름이 없는 자리는 게임 기록에만 남음."""
+    store = ResultStore(path, commit_delay=0)
+    record(store, ("solo", "solo"), ({"chance": 30}, {"chance": 5}))
+    record(store, ("named", None), ({"chance": 30}, {"chance": 5}), room_id=2)
+    store = reopen(store, path)
+    assert store.player("solo") is None
+    assert [e["name"] for e in store.leaderboard()] == ["named"]
+    store.close()
+    with sqlite3.connect(path) as connection:
+        assert connection.execute("SELECT count(*) FROM games").fetchone()[0] == 2
+
+
+def test_forfeit_counts_only_games_and_wins(path):
+    """기권 게임은 게임 수와 승수에만 반영하고 점수 통계에서는 제외."""
+    store = ResultStore(path, commit_delay=0)
+    record(store, ("quitter", "stayer"), ({"chance": 30}, {"ones": 1}), forfeit=0)
+    store = reopen(store, path)
+    stayer = store.player("stayer")
+    assert (stayer["games"], stayer["wins"], stayer["best"], stayer["mean"]) == (1, 1, 0, 0.0)
+    assert store.player("quitter")["wins"] == 0
+    store.close()
+
+
+def test_answer_query(path):
+    """잘못된 기준과 개수는 기본값으로, 이름을 생략한 통계 요청은 요청자 이름으로 응답."""
+    assert answer_query(None, {"type": "leaderboard_request", "data": {}})["data"] == {"available": False}
+    store = ResultStore(path, commit_delay=0)
+    record(store, ("alice", "bob"), ({"chance": 20}, {"chance": 10}))
+    store = reopen(store, path)
+    reply = answer_query(store, {"type": "leaderboard_request", "data": {"by": "luck", "limit": "x"}})
+    assert reply["data"]["by"] == "wins" and [e["name"] for e in reply["data"]["entries"]] == ["alice", "bob"]
+    reply = answer_query(store, {"type": "player_stats_request", "data": {}}, name="bob")
+    assert reply["data"]["found"] and reply["data"]["name"] == "bob"
+    reply = answer_query(store, {"type": "player_stats_request", "data": {"name": "zed"}})
+    assert reply["data"] == {"available": True, "name": "zed", "found": False}
+    store.close()
@@ -0,0 +1,99 @@
+from yacht_timer import TimerWheel
+
+
+class FakeClock:
+    """테스트에서 직접 움직이는 시계."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def new_wheel(slots: int = 8):
+    """틱 1초짜리 휠과 시계, 만료 기록 목록."""
+    clock = FakeClock()
+    return TimerWheel(tick=1.0, slots=slots, clock=clock), clock, []
+
+
+def test_fires_on_due_tick_in_order():
+    """만료 틱이 되어야 실행하고, 같은 칸은 등록 순서대로."""
+    wheel, clock, fired = new_wheel()
+    wheel.schedule(2.0, fired.append, "b")
+    wheel.schedule(1.5, fired.append, "a")
+    wheel.schedule(2.0, fired.append, "c")
+    assert wheel.advance(1.0) == 0
+    assert wheel.advance(2.0) == 3
+    assert fired == ["b", "a", "c"] and len(wheel) == 0
+
+
+def test_cancel_before_expiry():
+    """취소한 타이머는 실행되지 않고, 만료 뒤 취소는 아무 일도 하지 않음."""
+    wheel, clock, fired = new_wheel()
+    keep = wheel.schedule(1.0, fired.append, "keep")
+    drop = wheel.schedule(1.0, fired.append, "drop")
+    drop.cancel()
+    drop.cancel()
+    assert not drop.active and keep.active and len(wheel) == 1
+    wheel.advance(1.0)
+    assert fired == ["keep"] and not keep.active
+    keep.cancel()
+
+
+def test_timer_beyond_one_revolution():
+    """한 바퀴보다 먼 타이머는 같은 칸을 지나가도 바퀴 수가 찰 때까지 남음."""
+    wheel, clock, fired = new_wheel(slots=4)
+    wheel.schedule(6.0, fired.append, "late")
+    assert wheel.advance(2.0) == 0
+    assert wheel.advance(5.0) == 0 and len(wheel) == 1
+    assert wheel.advance(6.0) == 1 and fired == ["late"]
+
+
+def test_long_pause_checks_each_slot_once():
+    """루프가 오래 멈춰도 밀린 타이머를 한 번에 모두 실행."""
+    wheel, clock, fired = new_wheel(slots=4)
+    for delay in (1, 3, 4, 9):
+        wheel.schedule(delay, fired.append, delay)
+    assert wheel.advance(100.0) == 4
+    assert sorted(fired) == [1, 3, 4, 9] and wheel.current == 100
+
+
+def test_schedule_uses_clock_and_next_tick():
+    """지연 0이어도 다음 틱에 실행하고, 만료 시각은 틱 단위로 올림해 일찍 실행하지 않음."""
+    wheel, clock, fired = new_wheel()
+    clock.now = 3.2
+    wheel.advance()
+    wheel.schedule(0, fired.append, "now")
+    wheel.schedule(2.0, fired.append, "later")
+    clock.now = 4.0
+    assert wheel.advance() == 1 and fired == ["now"]
+    clock.now = 5.9  # 5.2초 만료는 6번 틱
+    assert wheel.advance() == 0
+    clock.now = 6.0
+    assert wheel.advance() == 1 and fired == ["now", "later"]
+
+
+def test_callback_error_does_not_stop_wheel():
+    """콜백 예외는 기록만 하고 나머지 타이머는 계속 실행."""
+    wheel, clock, fired = new_wheel()
+    wheel.schedule(1.0, lambda: 1 / 0)
+    wheel.schedule(1.0, fired.append, "after")
+    assert wheel.advance(1.0) == 2
+    assert fired == ["after"]
+
+
+def test_callback_can_reschedule():
+    """콜백 안에서 새 타이머를 걸어도 안전."""
+    wheel, clock, fired = new_wheel()
+
+    def again(n):
+        fired.append(n)
+        if n < 3:
+            wheel.schedule(1.0, again, n + 1)
+
+    wheel.schedule(1.0, again, 1)
+    for now in (1.0, 2.0, 3.0):
+        clock.now = now
+        wheel.advance()
+    assert fired == [1, 2, 3] and len(wheel) == 0